@@ -4,28 +4,56 @@ import time
 from PySide6.QtCore import QTimer, Qt
 from PySide6.QtWidgets import QTableWidgetItem
 from app.models.i2c_model import I2CTestBaseConfig, I2CPayloadConfig, I2CFullConfig
-from app.services.i2c_backend import I2CBackend
+from app.services.i2c_labview_service import i2c_config_encoder
+from app.services.hex_codec import parse_hex
+from app.models.eeprom_model import EEPROM_PROFILES
+from app.services.eeprom_transfer import EEPROMTransferRunner, EEPROMTransferResult
+from app.services.i2c_bus_scanner import BusScanRunner, BusScanCache, ScanResult, bus_key
+from app.services.i2c_client import format_address, parse_read_reply
+from app.services.register_map import RegisterMap, load_register_map
+from app.services.register_shadow import ShadowRegistry
+from app.services.signal_buffer import SignalStreams, CHANNELS, RX_BYTES, LATENCY
 from datetime import datetime
 import logging
 
 logger = logging.getLogger(__name__)
 
+SKIPPED_WRITE = "Skipped: unchanged in register cache"  # reply of a write the shadow did not send
+
 class I2CController:
     def __init__(self, main_window):
         self.main_window = main_window
-        self.backend = I2CBackend()
+        self.backend = main_window.services.i2c_backend
         self._cyclic_timer = QTimer()
+        self.signal_streams = SignalStreams({name: CHANNELS[name] for name in (RX_BYTES, LATENCY)})
         self.payload_configs: List[I2CPayloadConfig] = []
+        self.encoder = i2c_config_encoder()
         self.current_base_config: Optional[I2CTestBaseConfig] = None
         self.base_config: Optional[I2CTestBaseConfig] = None  # Keep for legacy, but prefer current_base_config
+        self.eeprom_transfer: Optional[EEPROMTransferRunner] = None
+        self.bus_scan: Optional[BusScanRunner] = None
+        self.scan_cache = BusScanCache()
+        self.register_shadows = ShadowRegistry()
+        self.register_cache_enabled = False  # Opt-in: skip unchanged register writes, serve fresh reads from the shadow
+        self.register_map: Optional[RegisterMap] = None
         self._connect_signals()
 
+    @property
+    def current_base_config(self) -> Optional[I2CTestBaseConfig]:
+        return self.encoder.base_config
+
+    @current_base_config.setter
+    def current_base_config(self, base_config: Optional[I2CTestBaseConfig]):
+        # The [I2CConfig] header is encoded once here instead of on every send
+        self.encoder.set_base_config(base_config)
+
     def _connect_signals(self):
         buttons = [
             (self.main_window.payload_panel.add_btn, self.add_payload_to_table, "Add"),
             (self.main_window.payload_panel.del_btn, self.delete_selected_transmit_row, "Delete"),
             (self.main_window.test_selection.add_config_btn, self._on_add_config, "Add Config"),
-            (self.main_window.payload_panel.send_btn, self._on_send, "SEND")
+            (self.main_window.payload_panel.send_btn, self._on_send, "SEND"),
+            (self.main_window.test_selection.scan_btn, self.scan_bus, "SCAN")
         ]
         for button, slot, name in buttons:
             button.clicked.connect(slot)
@@ -63,35 +91,11 @@ class I2CController:
             write_data = "Read Request"  # Placeholder for read test
             data_length = self.main_window.payload_panel.read_length.value()
         else:
-            raw_write_data = payload_config.message_data.strip()
-            if not raw_write_data:
+            if not payload_config.data:
                 self.log_status("Invalid or empty payload input.", level="warning")
                 return
-
-            # CHANGED: Always 0xXX (2 hex digits) for write data, regardless of register size
-            expected_len = 4  # Always 0xXX
-            zfill_width = 2  # Always pad to 2 hex digits
-
-            values = []
-            for v in raw_write_data.split():
-                v = v.strip().lower()
-                if v and not v.startswith('0x'):
-                    v = '0x' + v.zfill(zfill_width)
-                values.append(v)
-
-            num_values = len(values)
-            if num_values == 0:
-                self.log_status("No valid data values provided.", level="warning")
-                return
-
-            # Validation: Always expect 0xXX
-            for v in values:
-                if not (v.startswith('0x') and len(v) == expected_len):
-                    self.log_status(f"Invalid value: {v} (expected 0xXX for 8-bit or 0xXX for 16-bit)", level="warning")
-                    return
-
-            write_data = ' '.join(values)
-            data_length = num_values  # Each value is 1 byte
+            write_data = payload_config.message_data
+            data_length = len(payload_config.data)  # Each value is 1 byte
 
         self.main_window.transmit_table.add_entry(
             address=self.current_base_config.device_address,
@@ -99,7 +103,7 @@ class I2CController:
             data_length=str(data_length)
         )
         if is_read_test:
-            payload_config.message_data = ""
+            payload_config.data = b""
             payload_config.data_length = data_length
         self.payload_configs.append(payload_config)
         self.log_status("Payload added to I2C transmit table.")
@@ -126,56 +130,47 @@ class I2CController:
         is_read_test = test_case == "Read Test"
 
         register_size = int(self.main_window.payload_panel.register_size.currentText())
-        register_address = self.main_window.payload_panel.register_address.text().strip()
+        register_address = self._resolve_register_address(
+            self.main_window.payload_panel.register_address.text().strip(), register_size)
 
         tx_timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
 
         try:
             if is_read_test:
                 data_length = self.main_window.payload_panel.read_length.value()
-                message_data = ""
+                data = b""
             else:
-                # CHANGED: Always 0xXX (2 hex digits) for write data, regardless of register size
-                raw_message_data = txt(1).strip()
-                if not raw_message_data:
+                data = parse_hex(txt(1))
+                if not data:
                     raise ValueError("Empty message data")
-
-                expected_len = 4  # Always 0xXX
-                zfill_width = 2  # Always pad to 2 hex digits
-
-                values = []
-                for v in raw_message_data.split():
-                    v = v.strip().lower()
-                    if v and not v.startswith('0x'):
-                        v = '0x' + v.zfill(zfill_width)
-                    values.append(v)
-
-                num_values = len(values)
-                if num_values == 0:
-                    raise ValueError("No valid values")
-
-                # Validation: Always expect 0xXX
-                for v in values:
-                    if not (v.startswith('0x') and len(v) == expected_len):
-                        self.log_status(f"Invalid value in table: {v} (expected 0xXX for 8-bit or 0xXX for 16-bit)", level="warning")
-                        return
-
-                message_data = ' '.join(values)
-                data_length = num_values  # Each value is 1 byte
-        except ValueError:
+                data_length = len(data)  # Each value is 1 byte
+        except ValueError as e:
+            if str(e).startswith("Invalid value"):
+                self.log_status(f"{e} in table", level="warning")
+                return
             # CHANGED: Improved fallback
-            data_length = 1 if is_read_test else 1
-            message_data = ""
+            data_length = 1
+            data = b""
 
         cfg = I2CPayloadConfig(
-            message_data=message_data,
+            message_data=data,
             data_length=data_length,
             register_size=register_size,
             register_address=register_address
         )
 
-        response = self.send_config_to_labview(cfg)
+        sent_at = time.perf_counter()
+        shadow_address = self._shadow_address(register_address, register_size, len(cfg.data) or cfg.data_length)
+        if shadow_address is not None and test_case == "Write Test" and cfg.data:
+            response = self._write_through_shadow(cfg, shadow_address)
+        elif shadow_address is not None and is_read_test:
+            response = self._read_through_shadow(cfg, shadow_address)
+        else:
+            response = self.send_config_to_labview(cfg)
         rx_timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
+        if not response.startswith("Error:") and response not in ("No Response", SKIPPED_WRITE):
+            self.signal_streams.append(LATENCY, (time.perf_counter() - sent_at) * 1000)
+            self.signal_streams.append_bytes(RX_BYTES, response.encode('utf-8'))
 
         if response.startswith("Error:"):
             result = "Error"
@@ -187,6 +182,10 @@ class I2CController:
             ack_nack = "NACK"
             rx_data = ""
             self.log_status("No response from LabVIEW", level="warning")
+        elif response == SKIPPED_WRITE:
+            result = "Not sent (unchanged)"
+            ack_nack = ""  # the device was not addressed
+            rx_data = ""
         else:
             ack_nack = "ACK" if "ACK" in response else "NACK"
             if is_read_test:
@@ -228,6 +227,7 @@ class I2CController:
         test_case = self.main_window.test_selection.test_case.currentText()
         now = datetime.now().strftime("%H:%M:%S.%f")[:-3]
         if test_case.upper() == "READ TEST":
+            read_values = parse_read_reply(response, strict=True) if result == "Data received successfully" else None
             self.main_window.live_monitor.add_log_entry(
                 test_case=test_case,
                 register_address=register_address,
@@ -235,17 +235,19 @@ class I2CController:
                 data=rx_data if rx_data and rx_data != "No valid data" else "No data",
                 tx_timestamp="",         # Not used
                 rx_timestamp=now,        # Use current time for receive
-                result=result
+                result=result,
+                decoded=self._describe_registers(register_address, read_values)
             )
         elif test_case.upper() == "WRITE TEST":
             self.main_window.live_monitor.add_log_entry(
                 test_case=test_case,
                 register_address=register_address,
                 rw_bit="0",          # Always "0" for write
-                data=message_data,
+                data=cfg.message_data,
                 tx_timestamp=now,        # Use current time for transmit
                 rx_timestamp="",         # Not used
                 result=result,  # CHANGED: Use dynamic result instead of hardcoded
+                decoded=self._describe_registers(register_address, cfg.data)
                 # comment=""
             )
 
@@ -269,9 +271,105 @@ class I2CController:
         else:
             self.log_status("No row selected to delete.", level="warning")
 
+    # --------------------------------------------------------------------- #
+    #  Register shadow: diffed writes and read-through with TTL
+    # --------------------------------------------------------------------- #
+    def _shadow_address(self, register_address: str, register_size: int, length: int) -> Optional[int]:
+        """Start register for the shadow cache, or None when it does not apply.
+
+        Transfers that run past the end of the register space (the device
+        wraps or auto-increments past it) or touch a register the loaded map
+        marks volatile bypass the shadow and go out as sent.
+        """
+        if not self.register_cache_enabled or not register_address.strip():
+            return None
+        try:
+            address = int(register_address.split()[0], 16)
+        except ValueError:
+            return None
+        if address < 0 or address + length > 1 << register_size:
+            return None
+        if self.register_map is not None and self.register_map.any_volatile(address, length):
+            return None
+        return address
+
+    def _write_through_shadow(self, cfg: I2CPayloadConfig, address: int) -> str:
+        shadow = self.register_shadows.get(self.current_base_config.device_address, cfg.register_size)
+        if not shadow.stage(address, cfg.data):
+            self.log_status(f"Registers at {format_address(address, cfg.register_size)} unchanged; write skipped.")
+            return SKIPPED_WRITE
+        replies = []
+
+        def write(start: int, data: bytes) -> bool:
+            reply = self.send_config_to_labview(
+                I2CPayloadConfig(data, len(data), cfg.register_size, format_address(start, cfg.register_size)))
+            replies.append(reply)
+            return not reply.startswith("Error") and reply != "No Response" and "NACK" not in reply.upper()
+
+        writes = shadow.flush(write)
+        logger.debug("Shadow flush: %s", writes)
+        failed = [reply for reply, (_, _, ok) in zip(replies, writes) if not ok]
+        return failed[0] if failed else replies[-1]
+
+    def _read_through_shadow(self, cfg: I2CPayloadConfig, address: int) -> str:
+        shadow = self.register_shadows.get(self.current_base_config.device_address, cfg.register_size)
+        values = shadow.cached(address, cfg.data_length)
+        if values is not None:
+            self.log_status(f"Read of {format_address(address, cfg.register_size)} served from the register cache.")
+            return "\n".join(str(value) for value in values)
+        response = self.send_config_to_labview(cfg)
+        if not response.startswith("Error") and response != "No Response":
+            values = parse_read_reply(response, strict=True)
+            if values is not None and len(values) == cfg.data_length:
+                shadow.store(address, values)
+        return response
+
+    def set_register_cache_enabled(self, enabled: bool):
+        self.register_cache_enabled = enabled
+        if not enabled:
+            self.register_shadows.clear()
+
+    # --------------------------------------------------------------------- #
+    #  Register map: names for register addresses, decoded bitfields
+    # --------------------------------------------------------------------- #
+    def load_register_map(self, file_path: str):
+        try:
+            self.register_map = load_register_map(file_path)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            self.log_status(f"Error loading register map: {e}", level="error")
+            return
+        panel = self.main_window.payload_panel
+        panel.register_size.setCurrentText(str(self.register_map.register_size))
+        panel.set_register_names(self.register_map.names)
+        self.log_status(f"Register map {self.register_map.device or file_path} loaded: "
+                        f"{len(self.register_map.registers)} registers.")
+
+    def unload_register_map(self):
+        self.register_map = None
+        self.main_window.payload_panel.set_register_names([])
+        self.log_status("Register map unloaded.")
+
+    def _resolve_register_address(self, register_address: str, register_size: int) -> str:
+        """Hex address of a register named in the register map; anything else is returned unchanged."""
+        if self.register_map is not None and register_address:
+            register = self.register_map.by_name.get(register_address.upper())
+            if register is not None:
+                return format_address(register.address, register_size)
+        return register_address
+
+    def _describe_registers(self, register_address: str, data: Optional[bytes]) -> str:
+        """Register map decode of data read from or written at register_address; "" without a map."""
+        if self.register_map is None or not data or not register_address.strip():
+            return ""
+        try:
+            start = int(register_address.split()[0], 16)
+        except ValueError:
+            return ""
+        return self.register_map.describe(start, data)
+
     def send_config_to_labview(self, payload_config: I2CPayloadConfig):
         try:
-            message = self.backend.i2c_service._build_ini_message((self.current_base_config, payload_config))
+            message = self._build_transmission_message(payload_config)
             response = self.backend.i2c_service._send_ini_message(message, self.backend.i2c_service.send_port)
             if response and not response.startswith("Error") and response != "No Response":
                 self.log_status("Data sent successfully to LabVIEW")
@@ -294,6 +392,7 @@ class I2CController:
 
         self.current_base_config = base_config
         self.base_config = base_config  # Sync for legacy
+        self.register_shadows.clear()
         self.log_status("I2C Configuration saved locally.")
 
         try:
@@ -310,6 +409,89 @@ class I2CController:
             self.log_status(f"Error opening LabVIEW I2C VI: {e}", level="error")
             logger.error(f"Error launching LabVIEW I2C VI: {e}")
 
+    def scan_bus(self):
+        """Find every device that ACKs; a recent scan of the same bus is reused."""
+        if self.bus_scan and self.bus_scan.isRunning():
+            self.bus_scan.stop()
+            self.log_status("Stopping bus scan...", level="warning")
+            return
+        base_config = self.current_base_config or self._gather_base_config(log=False)
+        if not base_config:
+            return
+        service = self.backend.i2c_service
+        ten_bit = self.main_window.test_selection.address_mode.currentText() == "10-bit"
+        cached = self.scan_cache.get(bus_key(base_config, service.server_ip, service.send_port), ten_bit)
+        if cached is not None:
+            self.main_window.test_selection.set_found_devices(cached.addresses())
+            self.log_status(f"Bus scan (cached): {len(cached.addresses())} device(s) found.")
+            return
+        self.bus_scan = BusScanRunner(base_config, service.server_ip, service.send_port, ten_bit)
+        self.bus_scan.progress.connect(
+            lambda done, total: self.main_window.statusBar().showMessage(f"Bus scan: {done}/{total} addresses"))
+        self.bus_scan.finished.connect(self._on_bus_scan_finished)
+        self.bus_scan.error.connect(self._on_bus_scan_error)
+        self.main_window.test_selection.scan_btn.setText("STOP")
+        self.bus_scan.start()
+        self.log_status("Scanning I2C bus...")
+
+    def _on_bus_scan_finished(self, result: ScanResult):
+        self.main_window.test_selection.scan_btn.setText("SCAN")
+        if result.reason == "completed":
+            self.scan_cache.put(result)
+        addresses = result.addresses()
+        self.main_window.test_selection.set_found_devices(addresses)
+        mode = "batched" if result.batched else "one address per request"
+        listing = f": {', '.join(addresses)}" if addresses else ""
+        self.log_status(f"Bus scan {result.reason}, {len(addresses)} device(s) found{listing} "
+                        f"({result.probes} addresses in {result.requests} requests, {mode}, {result.elapsed:.2f}s).")
+
+    def _on_bus_scan_error(self, message: str):
+        self.main_window.test_selection.scan_btn.setText("SCAN")
+        self.log_status(message, level="error")
+
+    def program_eeprom(self, file_path: str, profile_name: str, start: int = 0, verify: bool = True):
+        """Write a file into an EEPROM page by page, then read it back."""
+        if not self.current_base_config:
+            self.log_status("Please add I2C configuration first!", level="warning")
+            return
+        if self.eeprom_transfer and self.eeprom_transfer.isRunning():
+            self.log_status("An EEPROM transfer is already running.", level="warning")
+            return
+        try:
+            with open(file_path, "rb") as f:
+                data = f.read()
+        except OSError as e:
+            self.log_status(f"Cannot read {file_path}: {e}", level="error")
+            return
+        profile = EEPROM_PROFILES[profile_name]
+        service = self.backend.i2c_service
+        self.eeprom_transfer = EEPROMTransferRunner(self.current_base_config, profile, data, start, verify,
+                                                    service.server_ip, service.send_port)
+        self.eeprom_transfer.progress.connect(self._on_eeprom_progress)
+        self.eeprom_transfer.finished.connect(self._on_eeprom_finished)
+        self.eeprom_transfer.error.connect(lambda msg: self.log_status(msg, level="error"))
+        self.eeprom_transfer.start()
+        self.log_status(f"Programming {len(data)} bytes into {profile.name} at 0x{start:04x}...")
+
+    def stop_eeprom_transfer(self):
+        if self.eeprom_transfer and self.eeprom_transfer.isRunning():
+            self.eeprom_transfer.stop()
+            self.log_status("Stopping EEPROM transfer...", level="warning")
+
+    def _on_eeprom_progress(self, phase: str, done: int, total: int):
+        self.main_window.statusBar().showMessage(f"EEPROM {phase}: {done}/{total} bytes")
+
+    def _on_eeprom_finished(self, result: EEPROMTransferResult):
+        summary = (f"EEPROM {result.profile}: {result.bytes_written} bytes in {result.pages} pages, "
+                   f"{result.ack_polls} ACK polls, {result.elapsed:.2f}s")
+        if result.reason != "completed":
+            self.log_status(f"{summary} - {result.reason}", level="error")
+        elif result.mismatches:
+            self.log_status(f"{summary} - verify failed at {len(result.mismatches)} bytes, "
+                            f"first 0x{result.mismatches[0]:04x}", level="error")
+        else:
+            self.log_status(f"{summary} - verified." if result.verified else f"{summary}.")
+
     def _gather_base_config(self, log=True) -> Optional[I2CTestBaseConfig]:
         ui = self.main_window.test_selection
         try:
@@ -336,7 +518,7 @@ class I2CController:
         ui = self.main_window.payload_panel
         try:
             register_size = int(ui.register_size.currentText())
-            register_address = ui.register_address.text().strip()
+            register_address = self._resolve_register_address(ui.register_address.text().strip(), register_size)
             if register_address:
                 if not register_address.lower().startswith('0x'):
                     register_address = '0x' + register_address.zfill(2 if register_size == 8 else 4)
@@ -345,26 +527,12 @@ class I2CController:
                     register_address = '0x' + addr_value
                 register_address = register_address.lower()
 
-            # CHANGED: Always compute for 0xXX (2 hex digits)
-            raw_message_data = ui.data.text().strip()
-            message_data = raw_message_data  # Will be processed later if needed
-            if raw_message_data:
-                expected_len = 4  # Always 0xXX
-                zfill_width = 2  # Always pad to 2 hex digits
-                values = []
-                for v in raw_message_data.split():
-                    v = v.strip().lower()
-                    if v and not v.startswith('0x'):
-                        v = '0x' + v.zfill(zfill_width)
-                    values.append(v)
-                num_values = len([v for v in values if v.startswith('0x') and len(v) == expected_len])
-                data_length = num_values  # Each is 1 byte
-            else:
-                data_length = 0
+            # Always 0xXX (one byte per value); raises ValueError on malformed input
+            data = parse_hex(ui.data.text())
 
             return I2CPayloadConfig(
-                message_data=message_data,
-                data_length=data_length,
+                message_data=data,
+                data_length=len(data),
                 register_address=register_address,
                 register_size=register_size
             )
@@ -410,7 +578,8 @@ class I2CController:
             )
 
             with open(file_path, 'w') as f:
-                json.dump(full_config, f, default=lambda o: o.__dict__, indent=4)
+                json.dump(full_config, f, default=lambda o: o.to_dict() if hasattr(o, "to_dict") else o.__dict__,
+                          indent=4)
             self.log_status("I2C Configuration saved successfully!")
         except Exception as e:
             self.log_status(f"Save error: {e}", level="error")
@@ -479,22 +648,4 @@ class I2CController:
 
     def _build_transmission_message(self, payload_config: I2CPayloadConfig):
         """Build I2C transmission message for LabVIEW"""
-        if not self.current_base_config:
-            raise ValueError("No base configuration available")
-            
-        message = "[I2CConfig]\n"
-        # Add base configuration
-        message += f"test_name = {self.current_base_config.test_name}\n"
-        message += f"device_address = {self.current_base_config.device_address}\n"
-        message += f"clock_speed = {self.current_base_config.clock_speed}\n"
-        message += f"addressing_mode = {self.current_base_config.addressing_mode}\n"
-        message += f"register_address = {self.current_base_config.register_address}\n"
-        message += f"bus_mode = {self.current_base_config.bus_mode}\n"
-        
-        # Add payload configuration
-        message += f"register_size = {payload_config.register_size}\n"
-        message += f"tx_data = {payload_config.message_data}\n"
-        message += f"data_length = {payload_config.data_length}\n"
-        
-        logger.debug(f"Built I2C message:\n{message}")
-        return message
\ No newline at end of file
+        return self.encoder.encode(payload_config)
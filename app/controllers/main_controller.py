@@ -2,10 +2,24 @@ from typing import Optional, List
 import json
 import time
 from PySide6.QtCore import QTimer, QThread, Signal, QEventLoop
-from PySide6.QtWidgets import QTableWidgetItem, QMessageBox
+from PySide6.QtWidgets import QTableWidgetItem, QMessageBox, QFileDialog
 from app.models.uart_model import UARTTestBaseConfig, UARTPayloadConfig, UARTFullConfig
-from app.services.uart_backend import UARTBackend
-from app.services.database_service import Database
+from app.models.test_plan import TestPlan, PlanResult
+from app.services.labview_service import (
+    serial_port_encoder, encode_batch, parse_batch_reply_line,
+    parse_batch_payloads, parse_serial_port_message
+)
+from app.services.test_plan_executor import TestPlanExecutor
+from app.services.burst_sender import BurstSender
+from app.services.file_streamer import FileStreamRunner, FileStreamResult
+from app.services.fixture_registry import FixtureRegistry
+from app.services.parallel_plan_runner import ParallelPlanRunner
+from app.services.baud_analysis import BaudSweepAccumulator, BaudSweepAnalyzer
+from app.services.baud_tolerance_search import BaudToleranceSearchRunner, ToleranceResult
+from app.services.ber_analysis import BERAccumulator, compare_buffers
+from app.services import session_capture
+from app.services.session_replayer import SessionReplayer
+from app.services.signal_buffer import SignalStreams, BAUD_MIN_ERROR, BAUD_MAX_ERROR, RX_BYTES, LATENCY
 from datetime import datetime
 import psycopg2
 import logging
@@ -14,30 +28,59 @@ from PySide6.QtCore import Qt
 
 logger = logging.getLogger(__name__)
 
+BATCH_SIZE = 100  # payloads per batched [SerialPort] request
+RECEPTION_TIMEOUT = 30.0   # seconds a READ waits for the VI to push received data
+RECEPTION_REPLY_GRACE = 1.0  # seconds a push may trail the VI's reply on the send port
+RECEPTION_POLL_MS = 50
+
 class MainController:
     def __init__(self, main_window):
         self.main_window = main_window
-        self.backend = UARTBackend()
-       # self._cyclic_timer = QTimer()
-       # self._cyclic_timer.timeout.connect(self._send_next_payload)
-       # self._pending_index = 0
+        self.backend = main_window.services.uart_backend
+        self.burst_sender: Optional[BurstSender] = None
+        self._burst_payloads: List[UARTPayloadConfig] = []
+        self._burst_failures = 0
+        self._burst_rate_text = ""
         self.base_config: Optional[UARTTestBaseConfig] = None
         self.payload_configs: List[UARTPayloadConfig] = []
+        self.encoder = serial_port_encoder()
         self.current_base_config: Optional[UARTTestBaseConfig] = None
+        self.plan_executor: Optional[TestPlanExecutor] = None
+        self.fixtures = FixtureRegistry()
+        self.fixture_runner: Optional[ParallelPlanRunner] = None
+        self.loopback_ber = BERAccumulator()
+        self.baud_sweep = BaudSweepAccumulator()
+        self.baud_analyzer = BaudSweepAnalyzer()
+        self.signal_streams = SignalStreams()  # Live history for the graph window
+        self._sent_at: Optional[float] = None
+        self.replayer: Optional[SessionReplayer] = None
+        self.tolerance_search: Optional[BaudToleranceSearchRunner] = None
+        self.file_stream: Optional[FileStreamRunner] = None
+        self._batch_queue: List[List[UARTPayloadConfig]] = []
+        self._batch_payloads: Optional[List[UARTPayloadConfig]] = None  # batch awaiting replies
+        self._batch_rows: List[int] = []
+        self._batch_answered = set()
+        self._replaying = False  # Replayed traffic is never written to the database
+        self._config_before_replay: Optional[UARTTestBaseConfig] = None
+        self._replay_config: Optional[UARTTestBaseConfig] = None  # last config a replayed request set
+        # RECEPTION TEST data arrives on the receive port; a READ waits for it here
+        self._reception_row: Optional[int] = None
+        self._reception_started = 0.0
+        self._reception_reply: Optional[str] = None  # the VI's answer on the send port, if any
+        self._reception_reply_at = 0.0
+        self._reception_reply_expected = False
+        self._reception_timer = QTimer()
+        self._reception_timer.setInterval(RECEPTION_POLL_MS)
+        self._reception_timer.timeout.connect(self._poll_reception)
+        self.baud_analyzer.analysis_ready.connect(self._on_baud_analysis)
+        self.baud_analyzer.error.connect(lambda msg: self.log_status(msg, level="error"))
         self.backend.labview.line_received.connect(self._on_labview_line_received)
         self.backend.labview.finished.connect(self._on_labview_full_response)
         self.backend.labview.progress.connect(self._on_progress_update)
+        self.backend.labview.error.connect(self._on_labview_error)
 
-        # Initialize Database
-        self.db_config = {
-            'dbname': 'uart_test',
-            'user': 'postgres',
-            'password': 'tejasai',
-            'host': 'localhost',
-            'port': '5432'
-        }
-        self.db = Database(self.db_config)
-        self.db.create_tables()
+        # Shared pooled database; tables are created once per application run
+        self.db = main_window.services.db
 
         self._connect_signals()
         # Ensure send button label reflects the current test case at startup
@@ -48,33 +91,58 @@ class MainController:
             logger.debug('Could not initialize test case dependent UI')
         
         main_window.payload_panel.stop_clicked.connect(self.backend.labview.stop)
+        main_window.payload_panel.stop_clicked.connect(self.stop_test_plan)
+        main_window.payload_panel.stop_clicked.connect(self.stop_cyclic)
+        main_window.payload_panel.stop_clicked.connect(self.stop_replay)
+        main_window.payload_panel.stop_clicked.connect(self.stop_baud_tolerance_search)
+        main_window.payload_panel.stop_clicked.connect(self.stop_batch)
+        main_window.payload_panel.stop_clicked.connect(self.stop_file_stream)
+        main_window.payload_panel.stop_clicked.connect(lambda: self._abort_reception("Stopped"))
         main_window.payload_panel.stop_clicked.connect(lambda:self.log_status("LabVIEW"))
+    @property
+    def current_base_config(self) -> Optional[UARTTestBaseConfig]:
+        return self.encoder.base_config
+
+    @current_base_config.setter
+    def current_base_config(self, base_config: Optional[UARTTestBaseConfig]):
+        # The [SerialPort] header is encoded once here instead of on every send
+        self.encoder.set_base_config(base_config)
+
     def _on_labview_full_response(self, full_response: str):
         """Called when LabVIEW sends full response (for normal tests)"""
+        if self._batch_payloads is not None:
+            self._on_batch_finished()
+            return
         if not self.current_base_config:
             return
 
         test_case = self.current_base_config.test_name.upper()
+        if test_case == "RECEPTION TEST" and self._reception_reply_expected:
+            # The data itself is pushed to the receive port; this only answers the READ request
+            self._reception_reply_expected = False
+            if self._reception_row is not None:
+                self._reception_reply = full_response
+                self._reception_reply_at = time.perf_counter()
+            return
 
         # Skip if it's a streaming test
         if test_case in ["BAUD RATE TESTING", "AUTO BAUD RATE DETECTION"]:
+            if test_case == "BAUD RATE TESTING" and len(self.baud_sweep):
+                self._analyze_baud_sweep()
             return  # Handled by line_received
 
+        latency = time.perf_counter() - self._sent_at if self._sent_at is not None else None
+        self._record_rx(full_response, latency)
+
         # Update Rx in live monitor
         if self.main_window.live_monitor.current_row >= 0:
             row = self.main_window.live_monitor.current_row
             self.main_window.live_monitor.table.setItem(row, 5, QTableWidgetItem(full_response.strip()))
 
             # Determine status
-            tx_data = self.main_window.live_monitor.table.item(row, 1).text()
-            status = "Pass"
-
-            if test_case == "LOOPBACK TEST":
-                if full_response.strip() != tx_data.strip():
-                    status = "FAIL"
-            elif test_case == "RECEPTION TEST":
-                if "success" not in full_response.lower() and "received" not in full_response.lower():
-                    status = "Data Received"
+            tx_item = self.main_window.live_monitor.table.item(row, 3)  # Tx Data column
+            tx_data = tx_item.text() if tx_item else ""
+            status = self._evaluate_status(test_case, tx_data, full_response, record=True)
 
             item = QTableWidgetItem(status)
             item.setTextAlignment(Qt.AlignCenter)
@@ -84,6 +152,42 @@ class MainController:
             cfg = UARTPayloadConfig(message_data=tx_data, data_length=len(tx_data))
             self._save_test_result_to_db(cfg, full_response, datetime.now(), status)
 
+    def _record_rx(self, rx_data: str, latency: Optional[float]):
+        """Feed one reply into the graph streams; latency is in seconds."""
+        if rx_data:
+            self.signal_streams.append_bytes(RX_BYTES, rx_data.encode('utf-8'))
+        if latency is not None:
+            self.signal_streams.append(LATENCY, latency * 1000)
+
+    def _evaluate_status(self, test_case: str, tx_data: str, rx_data: str, record: bool = False) -> str:
+        """Pass/fail for one transaction; record=True adds loopback results to the run BER."""
+        status = "Pass"
+        if test_case == "LOOPBACK TEST":
+            if not self._check_loopback(tx_data, rx_data, record):
+                status = "FAIL"
+        elif test_case == "RECEPTION TEST":
+            if "success" not in rx_data.lower() and "received" not in rx_data.lower():
+                status = "Data Received"
+        return status
+
+    def _check_loopback(self, tx_data: str, rx_data: str, record: bool) -> bool:
+        result = compare_buffers(tx_data.strip().encode('utf-8'), rx_data.strip().encode('utf-8'))
+        if record:
+            self.loopback_ber.add(result)
+            acc = self.loopback_ber
+            self.main_window.statusBar().showMessage(
+                f"Loopback BER {acc.ber:.3e} ({acc.bit_errors}/{acc.bits_compared} bits, "
+                f"{acc.failed_frames}/{acc.frames} frames failed, longest burst {acc.longest_burst} B)")
+            if not result.passed:
+                self.log_status(
+                    f"Loopback mismatch: {result.bit_errors} bit errors (BER {result.ber:.3e}), "
+                    f"first at byte {result.first_mismatch}, {result.burst_lengths.size} bursts, "
+                    f"length diff {result.length_mismatch:+d}", level="warning")
+        return result.passed
+
+    def reset_loopback_ber(self):
+        self.loopback_ber.reset()
+
     def _on_progress_update(self, count: int):
         self.main_window.live_monitor.set_progress(count)
 
@@ -92,6 +196,9 @@ class MainController:
     # --------------------------------------------------------------------- #
     def _on_labview_line_received(self, line: str):
         """Called **immediately** when LabVIEW sends a new line."""
+        if self._batch_payloads is not None:
+            self._on_batch_line(line)
+            return
         if not self.current_base_config:
             return
 
@@ -106,16 +213,76 @@ class MainController:
 
     def _process_baud_rate_line(self, line: str):
         """Parse: 110924.326940,3.854586,110924.326940,-3.711522"""
-        try:
-            parts = [p.strip() for p in line.split(",")]
-            if len(parts) >= 4:
-                min_b = int(round(float(parts[0])))
-                min_e = round(float(parts[1]), 2)
-                max_b = int(round(float(parts[2])))
-                max_e = round(float(parts[3]), 2)
-                self.main_window.live_monitor.add_baud_rate_result(min_b, min_e, max_b, max_e)
-        except Exception as e:
-            self.logger.warning(f"Bad baud line '{line}': {e}")
+        row = self.baud_sweep.append_line(line)
+        if row is None:
+            logger.warning("Bad baud line '%s'", line)
+            return
+        min_b, min_e, max_b, max_e = row
+        self.signal_streams.append(BAUD_MIN_ERROR, min_e)
+        self.signal_streams.append(BAUD_MAX_ERROR, max_e)
+        self.main_window.live_monitor.add_baud_rate_result(
+            int(round(min_b)), round(float(min_e), 2), int(round(max_b)), round(float(max_e), 2))
+
+    def _analyze_baud_sweep(self):
+        """Hand the collected sweep to the analysis process pool."""
+        nominal = self.current_base_config.baud_rate
+        self.baud_analyzer.submit(self.baud_sweep.snapshot(), nominal)
+        self.log_status(f"Analysing {len(self.baud_sweep)} baud sweep points...")
+
+    def _on_baud_analysis(self, result: dict):
+        if not result.get("count"):
+            return
+        self.log_status(
+            f"Baud sweep: window {result['window_low']:,.0f} ({result['window_low_pct']:+.2f}%) to "
+            f"{result['window_high']:,.0f} ({result['window_high_pct']:+.2f}%), "
+            f"{result['passed']}/{result['count']} points within ±{result['tolerance_pct']:g}%, "
+            f"worst margin {result['worst_margin']:+.2f}%",
+            level="info" if result['failed'] == 0 else "warning")
+        self._save_baud_rate_test_result(
+            int(round(result['window_low'])), round(result['window_low_error'], 2),
+            int(round(result['window_high'])), round(result['window_high_error'], 2))
+
+    def find_baud_tolerance(self):
+        """Bisect the min/max tolerable baud around the configured rate instead of a full sweep."""
+        if not self.current_base_config:
+            self.log_status("Add Config first!", level="warning")
+            return
+        if self.tolerance_search and self.tolerance_search.isRunning():
+            self.log_status("A baud tolerance search is already running.", level="warning")
+            return
+        self.tolerance_search = BaudToleranceSearchRunner(
+            self.current_base_config, self.backend.labview.server_ip, self.backend.labview.send_port)
+        self.tolerance_search.probe_done.connect(self._on_tolerance_probe)
+        self.tolerance_search.finished.connect(self._on_tolerance_found)
+        self.tolerance_search.error.connect(lambda msg: self.log_status(msg, level="error"))
+        self.tolerance_search.start()
+        self.log_status(f"Searching baud tolerance around {self.current_base_config.baud_rate:,}...")
+
+    def stop_baud_tolerance_search(self):
+        if self.tolerance_search and self.tolerance_search.isRunning():
+            self.tolerance_search.stop()
+
+    def _on_tolerance_probe(self, baud: float, passed: bool):
+        self.main_window.statusBar().showMessage(f"Baud probe {baud:,.0f}: {'pass' if passed else 'fail'}")
+
+    def _on_tolerance_found(self, result: ToleranceResult):
+        if not result.passed_nominal:
+            self.log_status(f"Baud tolerance search: {result.reason} after {len(result.probes)} probes.",
+                            level="error")
+            return
+        if result.max_baud is None:
+            self.log_status(f"Baud tolerance search incomplete ({result.reason}): min {result.min_baud:,.0f} "
+                            f"({result.min_pct:+.2f}%) after {len(result.probes)} probes.", level="warning")
+            return
+        limits = " (search range limit)" if result.min_limited or result.max_limited else ""
+        self.log_status(f"Baud tolerance: {result.min_baud:,.0f} ({result.min_pct:+.2f}%) to "
+                        f"{result.max_baud:,.0f} ({result.max_pct:+.2f}%) in {len(result.probes)} probes"
+                        f"{limits}, {result.reason}.")
+        min_baud, max_baud = int(round(result.min_baud)), int(round(result.max_baud))
+        if self.current_base_config.test_name.upper() == "BAUD RATE TESTING":
+            self.main_window.live_monitor.add_baud_rate_result(
+                min_baud, round(result.min_pct, 2), max_baud, round(result.max_pct, 2))
+        self._save_baud_rate_test_result(min_baud, round(result.min_pct, 2), max_baud, round(result.max_pct, 2))
 
     def _process_auto_baud_line(self, line: str):
         """Parse: 115200,115200  →  scalar, max"""
@@ -126,12 +293,14 @@ class MainController:
                 maximum = int(round(float(parts[1])))
                 self.main_window.live_monitor.add_auto_baud_rate_result(scalar, maximum, "Detected")
         except Exception as e:
-            self.logger.warning(f"Bad auto-baud line '{line}': {e}")
+            logger.warning("Bad auto-baud line '%s': %s", line, e)
 
     def _connect_signals(self):
         buttons = [
             (self.main_window.payload_panel.send_once_btn, self._on_send_once, "SEND"),
-            #(self.main_window.payload_panel.send_cyclic_btn, self._on_send_cyclic, "Send Cyclic"),
+            (self.main_window.payload_panel.send_all_btn, self._on_send_all, "SEND ALL"),
+            (self.main_window.payload_panel.send_cyclic_btn, self._on_send_cyclic, "Send Cyclic"),
+            (self.main_window.payload_panel.send_file_btn, self._on_send_file, "Send File"),
             (self.main_window.payload_panel.add_btn, self.add_payload_to_table, "Add"),
             (self.main_window.payload_panel.del_btn, self.delete_selected_transmit_row, "Delete"),
             (self.main_window.test_selection.add_config_btn, self._on_add_config, "Add Config")
@@ -150,7 +319,7 @@ class MainController:
     def log_status(self, message: str, duration: int = 4000, level: str = "info"):
         """Log a message to the StatusPanel."""
         self.main_window.status_panel.append_message(message, level)
-        logger.debug(f"Status logged: {message} ({level})")
+        logger.debug("Status logged: %s (%s)", message, level)
 
     def _on_add_config(self):
         """Handle ADD CONFIG button click - Opens LabVIEW VI only."""
@@ -161,6 +330,7 @@ class MainController:
             return
 
         self.current_base_config = base_config
+        self.reset_loopback_ber()
         self.log_status("Configuration saved locally.")
         
         # Launch LabVIEW VI and add delay to ensure it’s ready
@@ -193,6 +363,8 @@ class MainController:
 
     def _on_send_once(self):
         logger.debug("SEND button clicked")
+        if self._replay_running():
+            return
         if not self.current_base_config:
             self.log_status("Add Config first!", level="warning")
             return
@@ -229,15 +401,166 @@ class MainController:
                 self._handle_auto_baud_rate_detection(cfg)
             return
 
+        if test_case == "RECEPTION TEST":
+            self._read_reception(cfg)
+            return
+
         # === NORMAL TESTS: Use finished signal ===
         self.main_window.live_monitor.add_log_entry("Tx", cfg.message_data, str(cfg.data_length))
         self.send_config_to_labview(cfg)  # Async → response comes via _on_labview_full_response
         self.log_status("Data sent. Waiting for LabVIEW response...", level="info")
 
 
+    # --------------------------------------------------------------------- #
+    #  Batched sends: one request carries the base config and many payloads
+    # --------------------------------------------------------------------- #
+    def _on_send_all(self):
+        if self._replay_running():
+            return
+        if not self.current_base_config:
+            self.log_status("Add Config first!", level="warning")
+            return
+        if self.current_base_config.test_name.upper() in ["BAUD RATE TESTING", "AUTO BAUD RATE DETECTION"]:
+            self.log_status("Streaming tests cannot be batched; use SEND.", level="warning")
+            return
+        if self._batch_payloads is not None or self._batch_queue:
+            self.log_status("A batch is already in progress.", level="warning")
+            return
+        payloads = self._gather_payloads()
+        if not payloads:
+            self.log_status("No payload to send!", level="warning")
+            return
+        self._batch_queue = [payloads[i:i + BATCH_SIZE] for i in range(0, len(payloads), BATCH_SIZE)]
+        self.log_status(f"Sending {len(payloads)} payloads in {len(self._batch_queue)} batched request(s)...")
+        self._send_next_batch()
+
+    def _send_next_batch(self):
+        payloads = self._batch_queue.pop(0)
+        self._begin_batch(payloads)
+        self._sent_at = time.perf_counter()
+        message = encode_batch(self.encoder, payloads)
+        self.backend.labview._send_ini_message(message, self.backend.labview.send_port)
+
+    def _begin_batch(self, payloads: List[UARTPayloadConfig]):
+        """Add a Tx row per payload; replies are matched back by index."""
+        monitor = self.main_window.live_monitor
+        self._batch_rows = []
+        for payload in payloads:
+            monitor.add_log_entry("Tx", payload.message_data, str(payload.data_length))
+            self._batch_rows.append(monitor.current_row)
+        self._batch_payloads = payloads
+        self._batch_answered = set()
+
+    def _on_batch_line(self, line: str):
+        parsed = parse_batch_reply_line(line)
+        if parsed is None or parsed[0] >= len(self._batch_payloads):
+            logger.warning("Unexpected batch reply line '%s'", line)
+            return
+        index, rx_data = parsed
+        payload = self._batch_payloads[index]
+        test_case = self.current_base_config.test_name.upper()
+        status = self._evaluate_status(test_case, payload.message_data, rx_data, record=True)
+        self.main_window.live_monitor.set_rx_result(self._batch_rows[index], rx_data, status)
+        self._record_rx(rx_data, None)
+        self._batch_answered.add(index)
+        self._save_test_result_to_db(payload, rx_data, datetime.now(), status)
+
+    def _on_batch_finished(self):
+        missing = [i for i in range(len(self._batch_payloads)) if i not in self._batch_answered]
+        for index in missing:
+            self.main_window.live_monitor.set_rx_result(self._batch_rows[index], "", "No Response")
+        if self._sent_at is not None:
+            self._record_rx("", time.perf_counter() - self._sent_at)
+        answered = len(self._batch_answered)
+        self._batch_payloads = None
+        if missing:
+            self.log_status(f"Batch reply missing {len(missing)} of {answered + len(missing)} payloads.",
+                            level="warning")
+        if self._batch_queue:
+            self._send_next_batch()
+        else:
+            self.log_status("Batch send finished.")
+
+    def stop_batch(self):
+        if self._batch_payloads is not None or self._batch_queue:
+            self._batch_queue = []
+            self._abort_batch("Stopped")
+
+    def _abort_batch(self, status: str):
+        if self._batch_payloads is None:
+            return
+        for index in range(len(self._batch_payloads)):
+            if index not in self._batch_answered:
+                self.main_window.live_monitor.set_rx_result(self._batch_rows[index], "", status)
+        self._batch_payloads = None
+
+    def _on_labview_error(self, message: str):
+        self.log_status(f"LabVIEW communication issue: {message}", level="error")
+        self._batch_queue = []
+        self._abort_batch("Error")
+        self._reception_reply_expected = False
+        self._abort_reception("Error")
+
+    # --------------------------------------------------------------------- #
+    #  RECEPTION TEST: data the VI pushes to the receive port
+    # --------------------------------------------------------------------- #
+    def _read_reception(self, payload_config: UARTPayloadConfig):
+        """READ: take data already pushed since the last READ, else ask the VI and wait for its push."""
+        if self._reception_row is not None:
+            self.log_status("Still waiting for RECEPTION TEST data.", level="warning")
+            return
+        monitor = self.main_window.live_monitor
+        monitor.add_log_entry("Tx", payload_config.message_data, str(payload_config.data_length))
+        row = monitor.current_row
+        self._reception_started = time.perf_counter()
+        queued = self.backend.labview.reception.drain()
+        if queued:
+            self._complete_reception(row, "\n".join(queued))
+            return
+        self._reception_row = row
+        self._reception_reply = None
+        self._reception_reply_expected = True
+        self.send_config_to_labview(payload_config)
+        self._reception_timer.start()
+        self.log_status(f"Waiting for RECEPTION TEST data on port {self.backend.labview.receive_port}...")
+
+    def _poll_reception(self):
+        message = self.backend.labview.reception.get(timeout=0)
+        now = time.perf_counter()
+        if message is None and self._reception_reply is not None \
+                and now - self._reception_reply_at >= RECEPTION_REPLY_GRACE:
+            message = self._reception_reply  # the VI answered with the data on the send port instead
+        if message is None and now - self._reception_started < RECEPTION_TIMEOUT:
+            return
+        row = self._reception_row
+        self._reception_timer.stop()
+        self._reception_row = None
+        if message is None:
+            self.main_window.live_monitor.set_rx_result(row, "", "No Response")
+            self.log_status("No RECEPTION TEST data received.", level="warning")
+            return
+        self._complete_reception(row, message)
+
+    def _complete_reception(self, row: int, rx_data: str):
+        self._record_rx(rx_data, time.perf_counter() - self._reception_started)
+        status = self._evaluate_status("RECEPTION TEST", "", rx_data)
+        self.main_window.live_monitor.set_rx_result(row, rx_data.strip(), status)
+        tx_item = self.main_window.live_monitor.table.item(row, 3)
+        tx_data = tx_item.text() if tx_item else ""
+        self._save_test_result_to_db(UARTPayloadConfig(message_data=tx_data, data_length=len(tx_data)),
+                                     rx_data, datetime.now(), status)
+
+    def _abort_reception(self, status: str):
+        if self._reception_row is None:
+            return
+        self._reception_timer.stop()
+        self.main_window.live_monitor.set_rx_result(self._reception_row, "", status)
+        self._reception_row = None
+
     def _handle_baud_rate_test(self, payload_config=None):
         if payload_config is None:
             payload_config = UARTPayloadConfig(message_data="a", data_length=1)
+        self.baud_sweep.clear()
         self.send_config_to_labview(payload_config)
         self.log_status("Baud Rate Test started – waiting for results...", level="info")
 
@@ -254,7 +577,7 @@ class MainController:
 
     def _save_baud_rate_test_result(self, min_baud, min_error, max_baud, max_error):
         """Save baud rate test results to database"""
-        if self.db and self.current_base_config:
+        if self.db and self.current_base_config and not self._replaying:
             test_name_id = self._get_or_create_test_name_id(self.current_base_config.test_name)
             if test_name_id:
                 config_id = self.db.insert_uart_config(
@@ -283,25 +606,30 @@ class MainController:
                     self.log_status("Baud rate test result saved to database.", level="info")
 
 
-    def _save_test_result_to_db(self, payload_config, rx_data, rx_timestamp, status):
-        """Helper method to save test results to database."""
-        if self.db and self.current_base_config:
-            test_name_id = self._get_or_create_test_name_id(self.current_base_config.test_name)
+    def _save_test_result_to_db(self, payload_config, rx_data, rx_timestamp, status, base_config=None):
+        """Helper method to save test results to database.
+
+        base_config is the config the payload was sent with, when that is not
+        the current one (test plan results).
+        """
+        base_config = base_config or self.current_base_config
+        if self.db and base_config and not self._replaying:
+            test_name_id = self._get_or_create_test_name_id(base_config.test_name)
             if test_name_id:
                 config_id = self.db.insert_uart_config(
                     test_name_id=test_name_id,
-                    device_id=self.current_base_config.device_id or "Unknown",
-                    baud_rate=self.current_base_config.baud_rate,
-                    data_bits=self.current_base_config.data_bits,
-                    parity=self.current_base_config.parity,
-                    stop_bits=self.current_base_config.stop_bits,
-                    data_shift=self.current_base_config.data_shift,
-                    handshake=self.current_base_config.handshake
+                    device_id=base_config.device_id or "Unknown",
+                    baud_rate=base_config.baud_rate,
+                    data_bits=base_config.data_bits,
+                    parity=base_config.parity,
+                    stop_bits=base_config.stop_bits,
+                    data_shift=base_config.data_shift,
+                    handshake=base_config.handshake
                 )
                 if config_id:
                     self.db.insert_test_result(
                         uart_config_id=config_id,
-                        test_name=self.current_base_config.test_name,
+                        test_name=base_config.test_name,
                         tx_data=payload_config.message_data,
                         tx_timestamp=datetime.now(),
                         rx_data=rx_data,  # This will be None for specific tests
@@ -368,31 +696,142 @@ class MainController:
             logger.info("Switched to DEFAULT layout")
 
 
-    def _send_next_payload(self):
-        if hasattr(self, "_send_count") and hasattr(self, "_repeat_count"):
-            if self._send_count >= self._repeat_count:
-                self._cyclic_timer.stop()
-                self.main_window.payload_panel.send_cyclic_btn.setText("Send Cyclic")
-                self.log_status("Cyclic sending finished after repeats.", level="info")
-                self._send_count = 0
-                return
+    # --------------------------------------------------------------------- #
+    #  Cyclic / burst sending of the whole transmit table
+    # --------------------------------------------------------------------- #
+    def _on_send_cyclic(self):
+        if self.burst_sender and self.burst_sender.isRunning():
+            self.stop_cyclic()
+            return
+        if self._replay_running():
+            return
+        if not self.current_base_config:
+            self.log_status("Add Config first!", level="warning")
+            return
+
+        payloads = self._gather_payloads()
+        if not payloads:
+            self.log_status("No payload to send!", level="warning")
+            return
 
-            cfg = self._payload_list[self._pending_index]
-            self.main_window.live_monitor.add_log_entry("Tx", cfg.message_data, str(cfg.data_length))
+        panel = self.main_window.payload_panel
+        messages = [self._build_transmission_message(p) for p in payloads]
+        labview = self.backend.labview
+        self._burst_payloads = payloads
+        self._burst_failures = 0
+        self.burst_sender = BurstSender(
+            messages, labview.server_ip, labview.send_port,
+            target_rate=panel.send_rate.value(),
+            max_in_flight=panel.in_flight.value(),
+            repeat_count=panel.repeat_count.value()
+        )
+        self.burst_sender.result_ready.connect(self._on_burst_result)
+        self.burst_sender.rate_update.connect(self._on_burst_rate)
+        self.burst_sender.error.connect(lambda msg: self.log_status(msg, level="error"))
+        self.burst_sender.finished.connect(self._on_burst_finished)
+
+        rate = panel.send_rate.value()
+        rate_text = f"{rate:g} msg/s" if rate > 0 else "back-to-back"
+        self.log_status(f"Cyclic sending started: {len(payloads)} payloads x {panel.repeat_count.value()}, "
+                        f"{rate_text}, {panel.in_flight.value()} in flight")
+        panel.send_cyclic_btn.setText("Stop Cyclic")
+        self.burst_sender.start()
+
+    def stop_cyclic(self):
+        if self.burst_sender and self.burst_sender.isRunning():
+            self.burst_sender.stop()
+            self.log_status("Stopping cyclic sending...", level="warning")
+
+    def _on_burst_result(self, index: int, response: str, latency: float):
+        """Only failures get a monitor row; successes are summarised in rate updates."""
+        payload = self._burst_payloads[index]
+        test_case = self.current_base_config.test_name.upper()
+        if response.startswith("Error"):
+            status = "Error"
+        else:
+            self._record_rx(response, latency)
+            status = self._evaluate_status(test_case, payload.message_data, response, record=True)
+        if status in ("Pass", "Data Received"):
+            return
 
-            message = self._build_transmission_message(cfg)
-            response = self.send_data_to_labview_and_receive(message)
+        self._burst_failures += 1
+        monitor = self.main_window.live_monitor
+        monitor.add_log_entry("Tx", payload.message_data, str(payload.data_length))
+        if monitor.current_row >= 0:
+            monitor.table.setItem(monitor.current_row, 5, QTableWidgetItem(response))
+            item = QTableWidgetItem(status)
+            item.setTextAlignment(Qt.AlignCenter)
+            monitor.table.setItem(monitor.current_row, 6, item)
 
-            # ... log, update UI as before ...
+    def _on_burst_rate(self, completed: int, achieved: float, target: float):
+        self._on_progress_update(completed)
+        target_text = f"{target:g} msg/s" if target > 0 else "max"
+        self._burst_rate_text = f"{achieved:.1f} msg/s achieved (target {target_text})"
+        self.main_window.statusBar().showMessage(f"Cyclic: {completed} sent, {self._burst_rate_text}")
 
-            self._save_test_result_to_db(cfg, response, "Pass" if response and not response.startswith("Error") else "No Response")
+    def _on_burst_finished(self, completed: int):
+        self.main_window.payload_panel.send_cyclic_btn.setText("Send Cyclic")
+        self.log_status(f"Cyclic sending finished: {completed} sends, {self._burst_failures} failed, "
+                        f"{self._burst_rate_text}.")
 
-            self._pending_index = (self._pending_index + 1) % len(self._payload_list)
-            self._send_count += 1
+    # --------------------------------------------------------------------- #
+    #  File streaming: large payloads from disk in flow-controlled chunks
+    # --------------------------------------------------------------------- #
+    def _on_send_file(self):
+        if self.file_stream and self.file_stream.isRunning():
+            self.stop_file_stream()
+            return
+        if self._replay_running():
+            return
+        if not self.current_base_config:
+            self.log_status("Add Config first!", level="warning")
+            return
+        path, _ = QFileDialog.getOpenFileName(self.main_window, "Send File", "", "All Files (*)")
+        if path:
+            self.stream_file(path)
+
+    def stream_file(self, file_path: str):
+        labview = self.backend.labview
+        self.file_stream = FileStreamRunner(self.current_base_config, file_path,
+                                            labview.server_ip, labview.send_port)
+        self.file_stream.progress.connect(self._on_file_stream_progress)
+        self.file_stream.finished.connect(self._on_file_stream_finished)
+        self.file_stream.error.connect(self._on_file_stream_error)
+        self.main_window.payload_panel.send_file_btn.setText("Stop File")
+        self.log_status(f"Streaming {file_path} to LabVIEW...")
+        self.file_stream.start()
+
+    def stop_file_stream(self):
+        if self.file_stream and self.file_stream.isRunning():
+            self.file_stream.stop()
+            self.log_status("Stopping file stream...", level="warning")
+
+    def _on_file_stream_progress(self, sent: int, total: int, rate: float):
+        self.main_window.statusBar().showMessage(
+            f"File stream: {sent:,}/{total:,} bytes ({sent * 100 // max(total, 1)}%), {rate / 1024:.1f} KiB/s")
+
+    def _on_file_stream_error(self, message: str):
+        self.main_window.payload_panel.send_file_btn.setText("Send File")
+        self.log_status(f"File stream failed: {message}", level="error")
+
+    def _on_file_stream_finished(self, result: FileStreamResult):
+        self.main_window.payload_panel.send_file_btn.setText("Send File")
+        rates = result.window_rates
+        rate_text = (f"{result.throughput / 1024:.1f} KiB/s (windows {rates.min() / 1024:.1f}-"
+                     f"{rates.max() / 1024:.1f} KiB/s)" if rates.size else "no data sent")
+        summary = (f"File stream {result.reason}: {result.bytes_sent:,}/{result.size:,} bytes in "
+                   f"{result.chunks_sent}/{result.chunks} chunks, {result.elapsed:.2f}s, {rate_text}")
+        if self.current_base_config.test_name.upper() != "LOOPBACK TEST":
+            self.log_status(summary + ".", level="info" if result.reason == "completed" else "warning")
+            return
+        if result.looped_back:
+            self.log_status(f"{summary}; loopback CRC32 {result.rx_crc:08x} matches.")
         else:
-            # Fallback to default (in case repeat not set up)
-            # Original logic...
-            pass
+            self.log_status(f"{summary}; loopback FAIL: CRC32 tx {result.tx_crc:08x} rx {result.rx_crc:08x}, "
+                            f"{result.rx_bytes:,} bytes back, {result.missing_chunks} chunks unanswered, "
+                            f"{len(result.mismatched_chunks)} chunks differ"
+                            + (f" (first {result.mismatched_chunks[0]})" if result.mismatched_chunks else ""),
+                            level="error")
 
     def send_config_to_labview(self, payload_config):
         """Send both base config and payload to LabVIEW in one message"""
@@ -401,11 +840,12 @@ class MainController:
             message = self._build_transmission_message(payload_config)
             
             # Log what we're sending
-            logger.debug(f"Complete message to LabVIEW:\n{message}")
+            logger.debug("Complete message to LabVIEW:\n%s", message)
             self.log_status(f"Sending config to LabVIEW ({len(message)} bytes)")
             
             # Send to LabVIEW
-            response = self.backend.labview._send_ini_message(message, 12345)
+            self._sent_at = time.perf_counter()
+            response = self.backend.labview._send_ini_message(message, self.backend.labview.send_port)
             
             # Process response
             if response and not response.startswith("Error") and response != "No Response":
@@ -421,6 +861,213 @@ class MainController:
             logger.error(error_msg)
             return f"Error: {e}"
 
+    # --------------------------------------------------------------------- #
+    #  Session capture and replay
+    # --------------------------------------------------------------------- #
+    def start_capture(self, file_path: str):
+        try:
+            session_capture.start_capture(file_path)
+            self.log_status(f"Capturing LabVIEW traffic to {file_path}")
+        except OSError as e:
+            self.log_status(f"Could not start capture: {e}", level="error")
+
+    def stop_capture(self):
+        writer = session_capture.stop_capture()
+        if writer is not None:
+            self.log_status(f"Capture saved: {writer.frames} frames in {writer.path}")
+
+    def replay_session(self, file_path: str, speed: float = 1.0):
+        """Feed a captured session through the normal response handlers (speed 0 = as fast as possible)."""
+        if self.replayer and self.replayer.isRunning():
+            self.log_status("A session replay is already running.", level="warning")
+            return
+        busy = self._live_activity()
+        if busy:
+            self.log_status(f"Cannot replay while {busy} is running.", level="warning")
+            return
+        self._replaying = True
+        # Replayed requests switch the config as the capture did; the user's is restored afterwards
+        self._config_before_replay = self.current_base_config
+        self._replay_config = None
+        self.replayer = SessionReplayer(file_path, speed, ports=[self.backend.labview.send_port])
+        self.replayer.request_sent.connect(self._on_replayed_request)
+        self.replayer.line_received.connect(self._on_labview_line_received)
+        self.replayer.response_received.connect(self._on_labview_full_response)
+        self.replayer.progress.connect(lambda done, total: self._on_progress_update(done))
+        self.replayer.error.connect(lambda msg: self.log_status(msg, level="error"))
+        self.replayer.finished.connect(self._on_replay_finished)
+        self.replayer.start()
+        self.log_status(f"Replaying {file_path} at {'maximum speed' if speed <= 0 else f'{speed:g}x'}...")
+
+    def stop_replay(self):
+        if self.replayer and self.replayer.isRunning():
+            self.replayer.stop()
+
+    def _replay_running(self) -> bool:
+        """True (and a warning) while a replay owns the monitor and response handlers."""
+        if self.replayer and self.replayer.isRunning():
+            self.log_status("A session replay is running; stop it first.", level="warning")
+            return True
+        return False
+
+    def _live_activity(self) -> str:
+        """What live traffic is in progress, or "" if none."""
+        worker = self.backend.labview.current_worker
+        if worker is not None and worker.isRunning():
+            return "a send"
+        if self._batch_payloads is not None or self._batch_queue:
+            return "a batch"
+        if self.burst_sender and self.burst_sender.isRunning():
+            return "a cyclic send"
+        if self.file_stream and self.file_stream.isRunning():
+            return "a file stream"
+        if (self.plan_executor and self.plan_executor.isRunning()) or \
+                (self.fixture_runner and self.fixture_runner.is_running()):
+            return "a test plan"
+        return ""
+
+    def _on_replayed_request(self, message: str):
+        self._replay_config, payload = parse_serial_port_message(message)
+        self.current_base_config = self._replay_config
+        batch = parse_batch_payloads(message)
+        if batch is not None:
+            self._begin_batch(batch)
+            return
+        test_case = self.current_base_config.test_name.upper()
+        if test_case == "BAUD RATE TESTING":
+            self.baud_sweep.clear()
+        elif test_case != "AUTO BAUD RATE DETECTION":
+            self.main_window.live_monitor.add_log_entry("Tx", payload.message_data, str(payload.data_length))
+
+    def _on_replay_finished(self, replayed: int):
+        self._replaying = False
+        # Keep a config the user added during the replay
+        if self._replay_config is not None and self.current_base_config is self._replay_config:
+            self.current_base_config = self._config_before_replay
+        self._config_before_replay = self._replay_config = None
+        self.log_status(f"Replay finished: {replayed} frames.")
+
+    # --------------------------------------------------------------------- #
+    #  Test plans: base configs x payload lists x repeat counts
+    # --------------------------------------------------------------------- #
+    def run_test_plan(self, file_path: str):
+        """Load a test plan file and execute it over a single LabVIEW connection."""
+        if self.plan_executor and self.plan_executor.isRunning():
+            self.log_status("A test plan is already running.", level="warning")
+            return
+        if self._replay_running():
+            return
+        try:
+            with open(file_path, 'r') as f:
+                plan = TestPlan.from_dict(json.load(f))
+        except Exception as e:
+            self.log_status(f"Test plan load error: {e}", level="error")
+            return
+
+        total = plan.total_items()
+        if total == 0:
+            self.log_status("Test plan contains no payloads.", level="warning")
+            return
+
+        labview = self.backend.labview
+        self.plan_executor = TestPlanExecutor(plan, labview.server_ip, labview.send_port)
+        self.plan_executor.result_ready.connect(self._on_plan_result)
+        self.plan_executor.progress.connect(lambda done, _total: self._on_progress_update(done))
+        self.plan_executor.error.connect(lambda msg: self.log_status(msg, level="error"))
+        self.plan_executor.finished.connect(self._on_plan_finished)
+        self.log_status(f"Running test plan '{plan.name}' ({len(plan.steps)} steps, {total} sends)...")
+        self.plan_executor.start()
+
+    def stop_test_plan(self):
+        if self.plan_executor and self.plan_executor.isRunning():
+            self.plan_executor.stop()
+            self.log_status("Stopping test plan...", level="warning")
+        if self.fixture_runner and self.fixture_runner.is_running():
+            self.fixture_runner.stop()
+            self.log_status("Stopping fixture run...", level="warning")
+
+    def run_test_plan_on_fixtures(self, plan_path: str, fixtures_path: str, mode: str):
+        """Run one test plan on every enabled UART fixture in parallel."""
+        if self.fixture_runner and self.fixture_runner.is_running():
+            self.log_status("A fixture run is already in progress.", level="warning")
+            return
+        if self._replay_running():
+            return
+        try:
+            with open(plan_path, 'r') as f:
+                plan = TestPlan.from_dict(json.load(f))
+            self.fixtures.load(fixtures_path)
+        except Exception as e:
+            self.log_status(f"Fixture run load error: {e}", level="error")
+            return
+
+        # Plans are UART payload sequences; I2C fixtures have nothing to run them
+        fixtures = self.fixtures.fixtures("UART")
+        skipped = len(self.fixtures.fixtures()) - len(fixtures)
+        if skipped:
+            self.log_status(f"Skipping {skipped} non-UART fixtures.", level="warning")
+        if not fixtures:
+            self.log_status("No enabled UART fixtures found.", level="warning")
+            return
+
+        def passed(result: PlanResult) -> bool:
+            status = self._evaluate_status(result.base_config.test_name.upper(),
+                                           result.payload.message_data, result.rx_data or "")
+            return status != "FAIL"
+
+        self.fixture_runner = ParallelPlanRunner(plan, fixtures, mode, evaluate=passed)
+        self.fixture_runner.result_ready.connect(self._on_plan_result)
+        self.fixture_runner.fixture_finished.connect(self._on_fixture_finished)
+        self.fixture_runner.error.connect(lambda msg: self.log_status(msg, level="error"))
+        self.fixture_runner.finished.connect(self._on_fixture_run_finished)
+        self.log_status(f"Running test plan '{plan.name}' on {len(fixtures)} fixtures ({mode})...")
+        self.fixture_runner.start()
+
+    def _on_fixture_finished(self, name: str, summary):
+        level = "info" if summary.failed == 0 and summary.errors == 0 else "warning"
+        self.log_status(f"[{name}] {summary.sent} sent, {summary.passed} passed, {summary.failed} failed, "
+                        f"{summary.errors} errors, mean latency {summary.mean_latency * 1000:.1f} ms",
+                        level=level)
+
+    def _on_fixture_run_finished(self, summaries):
+        unsent = self.fixture_runner.unsent if self.fixture_runner else 0
+        if unsent:
+            self.log_status(f"Fixture run finished on {len(summaries)} fixtures; {unsent} items not sent.",
+                            level="warning")
+        else:
+            self.log_status(f"Fixture run finished on {len(summaries)} fixtures.")
+
+    def _on_plan_result(self, result: PlanResult):
+        """Stream one plan result into the live monitor and the database."""
+        test_case = result.base_config.test_name.upper()
+        tx_data = result.payload.message_data
+
+        monitor = self.main_window.live_monitor
+        monitor.add_log_entry("Tx", tx_data, str(result.payload.data_length))
+        if monitor.current_row < 0:
+            return
+        row = monitor.current_row
+
+        if result.error:
+            rx_data = ""
+            status = "Error"
+            self.log_status(result.error, level="error")
+        else:
+            rx_data = result.rx_data or ""
+            self._record_rx(rx_data, (result.rx_timestamp - result.tx_timestamp).total_seconds())
+            status = self._evaluate_status(test_case, tx_data, rx_data, record=True)
+            monitor.table.setItem(row, 5, QTableWidgetItem(rx_data))
+
+        item = QTableWidgetItem(status)
+        item.setTextAlignment(Qt.AlignCenter)
+        monitor.table.setItem(row, 6, item)
+
+        self._save_test_result_to_db(result.payload, rx_data, result.rx_timestamp, status,
+                                     base_config=result.base_config)
+
+    def _on_plan_finished(self, executed: int):
+        self.log_status(f"Test plan finished: {executed} sends executed.")
+
     def _get_or_create_test_name_id(self, test_name):
         test_type_id = self.db.get_test_type_id("UART Testing")
         if not test_type_id:
@@ -431,28 +1078,40 @@ class MainController:
         test_name_id = self.db.get_test_name_id(test_type_id, test_name)
         if not test_name_id:
             # Dynamically insert missing test name
+            conn = self.db.connect()
+            if conn is None:
+                return None
             try:
-                conn = self.db.connect()
-                if conn:
-                    with conn.cursor() as cur:
-                        # Generate a new test name ID
-                        cur.execute("SELECT COUNT(*) FROM test_names WHERE test_type_id = %s", (test_type_id,))
-                        count = cur.fetchone()[0]
-                        new_id = f"UART{count + 1:02d}"
-                        cur.execute("""
-                            INSERT INTO test_names (id, test_type_id, test_name)
-                            VALUES (%s, %s, %s)
-                            ON CONFLICT (id) DO NOTHING
-                            RETURNING id
-                        """, (new_id, test_type_id, test_name))
-                        test_name_id = cur.fetchone()[0]
-                        conn.commit()
-                        logger.info(f"Inserted test name '{test_name}' with ID {test_name_id}")
-                    conn.close()
+                with conn.cursor() as cur:
+                    # Generate a new test name ID
+                    cur.execute("SELECT COUNT(*) FROM test_names WHERE test_type_id = %s", (test_type_id,))
+                    count = cur.fetchone()[0]
+                    new_id = f"UART{count + 1:02d}"
+                    cur.execute("""
+                        INSERT INTO test_names (id, test_type_id, test_name)
+                        VALUES (%s, %s, %s)
+                        ON CONFLICT (id) DO NOTHING
+                        RETURNING id
+                    """, (new_id, test_type_id, test_name))
+                    row = cur.fetchone()
+                    conn.commit()
             except psycopg2.Error as e:
                 self.log_status(f"Error inserting test name '{test_name}': {e}", level="error")
-                logger.error(f"Error inserting test name: {e}")
+                logger.error("Error inserting test name: %s", e)
                 return None
+            finally:
+                self.db.release(conn)
+            if row:
+                test_name_id = row[0]
+                logger.info("Inserted test name '%s' with ID %s", test_name, test_name_id)
+            else:
+                # The generated ID is taken (IDs out of sequence, or a concurrent insert);
+                # the name may have been added meanwhile
+                test_name_id = self.db.get_test_name_id(test_type_id, test_name)
+                if not test_name_id:
+                    self.log_status(f"Could not insert test name '{test_name}': ID {new_id} already exists.",
+                                    level="error")
+                    return None
         return test_name_id
 
     def _gather_base_config(self, log=True) -> Optional[UARTTestBaseConfig]:
@@ -613,21 +1272,7 @@ class MainController:
 
     def _build_transmission_message(self, payload_config):
         """Build proper INI format message for LabVIEW"""
-        # Map stop bits to LabVIEW format
-        stop_bits_map = {0.5: 5, 1.0: 10, 1.5: 15, 2.0: 20}
-        stop_bits_lv = stop_bits_map.get(float(self.current_base_config.stop_bits), 10)
-        
-        message = "[SerialPort]\n"
-        message += f"test_name = {self.current_base_config.test_name}\n"
-        message += f"device_id = {self.current_base_config.device_id}\n"
-        message += f"baud_rate = {self.current_base_config.baud_rate}\n"
-        message += f"databits = {self.current_base_config.data_bits}\n"  # Note: databits not data_bits
-        message += f"parity = {self.current_base_config.parity}\n"
-        message += f"stop_bits = {stop_bits_lv}\n"  # Use LabVIEW format
-        message += f"data_shift = {self.current_base_config.data_shift}\n"
-        message += f"handshake = {self.current_base_config.handshake}\n"
-        message += f"tx_data = {payload_config.message_data}\n"
-        return message
+        return self.encoder.encode(payload_config)
 
 
     def send_data_to_labview_and_receive(self, message):
@@ -635,7 +1280,7 @@ class MainController:
             logger.debug(f"Sending complete config to LabVIEW:\n{message}")
             
             # Use your LabVIEW service instead of direct socket
-            response = self.backend.labview._send_ini_message(message, 12345)
+            response = self.backend.labview._send_ini_message(message, self.backend.labview.send_port)
             
             if response and not response.startswith("Error"):
                 self.log_status(f"LabVIEW Response: {response}")
@@ -652,9 +1297,7 @@ class MainController:
             return f"Error: {e}"
         
     def closeEvent(self, event):
-        if self.backend.labview.current_worker and self.backend.labview.current_worker.isRunning():
-            self.backend.labview.current_worker.terminate()
-            self.backend.labview.current_worker.wait()
+        self.backend.labview.cancel_request()
         super().closeEvent(event)
 
 class LabVIEWCommunicationThread(QThread):
@@ -0,0 +1,125 @@
+# app/logging_config.py
+"""Application logging: one level setting, a background writer thread and per-logger rate limits.
+
+Loggers anywhere in the app only enqueue records; a QueueListener thread
+formats them and does the console and file I/O, so worker loops never
+block on logging. Use %-style arguments (``logger.debug("x %s", value)``)
+so messages that are filtered out are never formatted at all.
+"""
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+import logging
+import os
+import queue
+import threading
+import time
+
+DEFAULT_LEVEL = "INFO"
+LEVEL_ENV_VAR = "PVS_LOG_LEVEL"
+LOG_FILE = os.path.join("logs", "app.log")
+LOG_FORMAT = "%(asctime)s %(levelname)-7s %(name)s: %(message)s"
+
+# Sustained messages per second and burst size allowed per logger at INFO and
+# below; warnings and errors are never dropped
+DEFAULT_RATE = 20.0
+DEFAULT_BURST = 100
+RATE_LIMITS = {
+    "app.services.labview_worker": (10.0, 50),
+    "app.services.labview_client": (10.0, 50),
+    "app.services.burst_sender": (5.0, 20),
+}
+
+_listener = None
+
+
+class RateLimitFilter(logging.Filter):
+    """Token bucket per logger; reports how many records it dropped once traffic calms down."""
+
+    def __init__(self, rate=DEFAULT_RATE, burst=DEFAULT_BURST, limits=None):
+        super().__init__()
+        self.rate = rate
+        self.burst = burst
+        self.limits = dict(RATE_LIMITS if limits is None else limits)
+        self._buckets = {}  # logger name -> [tokens, last refill, dropped]
+        self._lock = threading.Lock()
+
+    def filter(self, record):
+        if record.levelno > logging.INFO:
+            return True
+        rate, burst = self.limits.get(record.name, (self.rate, self.burst))
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.setdefault(record.name, [burst, now, 0])
+            bucket[0] = min(burst, bucket[0] + (now - bucket[1]) * rate)
+            bucket[1] = now
+            if bucket[0] < 1:
+                bucket[2] += 1
+                return False
+            bucket[0] -= 1
+            dropped, bucket[2] = bucket[2], 0
+        if dropped:
+            record.msg = f"[{dropped} similar messages suppressed] {record.msg}"
+        return True
+
+
+class _InProcessQueueHandler(QueueHandler):
+    """QueueHandler that leaves formatting to the listener thread.
+
+    The stock prepare() formats on the calling thread so records can be
+    pickled; an in-process queue.Queue does not need that.
+    """
+
+    def prepare(self, record):
+        return record
+
+
+def resolve_level(level=None) -> int:
+    """Level from the argument, else $PVS_LOG_LEVEL, else DEFAULT_LEVEL."""
+    name = level or os.environ.get(LEVEL_ENV_VAR) or DEFAULT_LEVEL
+    if isinstance(name, int):
+        return name
+    value = logging.getLevelName(str(name).upper())
+    return value if isinstance(value, int) else logging.INFO
+
+
+def setup_logging(level=None, log_file=LOG_FILE):
+    """Install the queue-based pipeline on the root logger; safe to call more than once."""
+    global _listener
+    root = logging.getLogger()
+    root.setLevel(resolve_level(level))
+    if _listener is not None:
+        return _listener
+
+    formatter = logging.Formatter(LOG_FORMAT)
+    handlers = [logging.StreamHandler()]
+    if log_file:
+        directory = os.path.dirname(log_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        handlers.append(RotatingFileHandler(log_file, maxBytes=5 * 1024 * 1024, backupCount=5, encoding="utf-8"))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = _InProcessQueueHandler(log_queue)
+    queue_handler.addFilter(RateLimitFilter())
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+
+def set_level(level):
+    logging.getLogger().setLevel(resolve_level(level))
+
+
+def shutdown_logging():
+    """Flush queued records and stop the writer thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
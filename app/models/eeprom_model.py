@@ -0,0 +1,44 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class EEPROMProfile:
+    name: str
+    size: int            # bytes
+    page_size: int       # bytes per page write; a write never crosses a page boundary
+    address_width: int   # word address bytes sent after the device address (1 or 2)
+    write_cycle_ms: float = 5.0  # datasheet tWR, used to bound ACK polling
+
+    @property
+    def register_size(self) -> int:
+        """register_size (bits) the I2C VI expects for this part's word address."""
+        return 16 if self.address_width == 2 else 8
+
+    @property
+    def block_size(self) -> int:
+        """Bytes reachable with one device address.
+
+        Parts with 1-byte addressing above 256 bytes (24C04/08/16) put the
+        upper address bits in the low bits of the device address.
+        """
+        return min(self.size, 1 << (8 * self.address_width))
+
+    def device_address(self, base_address: int, memory_address: int) -> int:
+        return base_address | (memory_address // self.block_size)
+
+
+# Common 24Cxx serial EEPROMs
+EEPROM_PROFILES = {
+    p.name: p for p in [
+        EEPROMProfile("24C01", 128, 8, 1),
+        EEPROMProfile("24C02", 256, 8, 1),
+        EEPROMProfile("24C04", 512, 16, 1),
+        EEPROMProfile("24C08", 1024, 16, 1),
+        EEPROMProfile("24C16", 2048, 16, 1),
+        EEPROMProfile("24C32", 4096, 32, 2),
+        EEPROMProfile("24C64", 8192, 32, 2),
+        EEPROMProfile("24C128", 16384, 64, 2),
+        EEPROMProfile("24C256", 32768, 64, 2),
+        EEPROMProfile("24C512", 65536, 128, 2),
+    ]
+}
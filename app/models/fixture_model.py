@@ -0,0 +1,27 @@
+# app/models/fixture_model.py
+from dataclasses import dataclass
+
+
+@dataclass
+class Fixture:
+    name: str
+    host: str
+    port: int
+    protocol: str = "UART"  # "UART" or "I2C"
+    device_id: str = ""     # DUT identifier recorded with this fixture's results
+    enabled: bool = True
+
+
+@dataclass
+class FixtureSummary:
+    fixture: str
+    sent: int = 0
+    passed: int = 0
+    failed: int = 0
+    errors: int = 0
+    total_latency: float = 0.0  # seconds, summed over answered sends
+
+    @property
+    def mean_latency(self) -> float:
+        answered = self.sent - self.errors
+        return self.total_latency / answered if answered else 0.0
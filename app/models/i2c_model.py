@@ -1,5 +1,6 @@
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Union
+from app.services.hex_codec import parse_hex, format_hex
 
 @dataclass
 class I2CTestBaseConfig:
@@ -14,8 +15,10 @@ class I2CTestBaseConfig:
 
 @dataclass
 class I2CPayloadConfig:
-    def __init__(self, message_data: str, data_length: int, register_size: int, register_address: Optional[str] = None):
-        self.message_data = message_data
+    def __init__(self, message_data: Union[str, bytes, bytearray], data_length: int, register_size: int,
+                 register_address: Optional[str] = None):
+        # Payload bytes; hex text (e.g. from a saved config) is parsed once here
+        self.data = parse_hex(message_data) if isinstance(message_data, str) else bytes(message_data)
         self.data_length = data_length
         # Ensure register_size is always 8 or 16 bits
         if register_size not in [8, 16]:
@@ -23,6 +26,23 @@ class I2CPayloadConfig:
         self.register_size = register_size  # Store in bits
         self.register_address = register_address
 
+    @property
+    def message_data(self) -> str:
+        """Hex text of the payload ("0x0a 0x0b"), as shown in the tables and sent to LabVIEW."""
+        return format_hex(self.data)
+
+    @message_data.setter
+    def message_data(self, value):
+        self.data = parse_hex(value) if isinstance(value, str) else bytes(value)
+
+    def to_dict(self) -> dict:
+        return {
+            "message_data": self.message_data,
+            "data_length": self.data_length,
+            "register_size": self.register_size,
+            "register_address": self.register_address,
+        }
+
 @dataclass
 class I2CFullConfig:
     base_config: Optional[I2CTestBaseConfig]
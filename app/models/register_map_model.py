@@ -0,0 +1,29 @@
+from dataclasses import dataclass, field
+from typing import Dict, Tuple
+
+
+@dataclass(frozen=True)
+class RegisterField:
+    name: str
+    lsb: int
+    width: int           # bits
+    values: Dict[int, str] = field(default_factory=dict)  # raw value -> label, e.g. {3: "normal"}
+
+    @property
+    def mask(self) -> int:
+        return (1 << self.width) - 1
+
+
+@dataclass(frozen=True)
+class Register:
+    name: str
+    address: int
+    width: int = 8       # bits; registers wider than 8 bits span consecutive addresses
+    fields: Tuple[RegisterField, ...] = ()
+    reset: int = 0
+    volatile: bool = False  # command/status/data register: never skip a write or reuse a read
+
+    @property
+    def size(self) -> int:
+        """Bytes (consecutive register addresses) the register occupies."""
+        return self.width // 8
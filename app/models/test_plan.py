@@ -0,0 +1,81 @@
+# app/models/test_plan.py
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Optional
+from app.models.uart_model import UARTTestBaseConfig, UARTPayloadConfig
+
+
+@dataclass
+class TestPlanStep:
+    base_config: UARTTestBaseConfig
+    payloads: List[UARTPayloadConfig]
+    repeat: int = 1  # Number of passes over the payload list
+
+
+@dataclass
+class TestPlan:
+    name: str
+    steps: List[TestPlanStep] = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "TestPlan":
+        """Build a plan from its JSON form.
+
+        A single-config file written by ``MainController.save_config`` is
+        accepted as a one-step plan with one payload.
+        """
+        raw_steps = data.get("steps")
+        if raw_steps is None:
+            raw_steps = [data]
+
+        steps = []
+        for raw in raw_steps:
+            payloads = raw.get("payloads")
+            if payloads is None:
+                payloads = [raw["payload_config"]] if raw.get("payload_config") else []
+            repeat = int(raw.get("repeat", 1))
+            if repeat < 1:
+                raise ValueError("repeat must be at least 1")
+            steps.append(TestPlanStep(
+                base_config=UARTTestBaseConfig(**raw["base_config"]),
+                payloads=[UARTPayloadConfig(**p) for p in payloads],
+                repeat=repeat
+            ))
+        return cls(name=data.get("name", "Test Plan"), steps=steps)
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "steps": [
+                {
+                    "base_config": step.base_config.__dict__,
+                    "payloads": [p.__dict__ for p in step.payloads],
+                    "repeat": step.repeat
+                }
+                for step in self.steps
+            ]
+        }
+
+    def iter_items(self):
+        """Yield (step_index, payload_index, iteration, base_config, payload) in run order."""
+        for step_index, step in enumerate(self.steps):
+            for iteration in range(step.repeat):
+                for payload_index, payload in enumerate(step.payloads):
+                    yield step_index, payload_index, iteration, step.base_config, payload
+
+    def total_items(self) -> int:
+        return sum(len(step.payloads) * step.repeat for step in self.steps)
+
+
+@dataclass
+class PlanResult:
+    step_index: int
+    payload_index: int
+    iteration: int
+    base_config: UARTTestBaseConfig
+    payload: UARTPayloadConfig
+    tx_timestamp: datetime
+    rx_data: Optional[str] = None
+    rx_timestamp: Optional[datetime] = None
+    error: Optional[str] = None
+    fixture: str = ""  # Name of the fixture that ran this item, if any
@@ -0,0 +1,125 @@
+# app/services/baud_analysis.py
+from concurrent.futures import ProcessPoolExecutor
+import logging
+import numpy as np
+from PySide6.QtCore import QObject, Signal
+
+logger = logging.getLogger(__name__)
+
+# Receiver tolerance commonly quoted for UART links (percent of nominal baud)
+DEFAULT_TOLERANCE_PCT = 2.0
+
+# Column layout of one sweep line: "min_baud,min_err,max_baud,max_err"
+MIN_BAUD, MIN_ERR, MAX_BAUD, MAX_ERR = range(4)
+
+
+class BaudSweepAccumulator:
+    """Collects streamed baud-rate sweep lines into a growable (N, 4) array."""
+
+    def __init__(self, capacity: int = 1024):
+        self._data = np.empty((capacity, 4), dtype=np.float64)
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def clear(self):
+        self._count = 0
+
+    def append_line(self, line: str):
+        """Parse one sweep line; return the (min_b, min_e, max_b, max_e) row or None."""
+        try:
+            values = np.fromstring(line, dtype=np.float64, sep=',')
+        except ValueError:
+            return None
+        if values.size < 4 or not np.isfinite(values[:4]).all():
+            return None
+        if self._count == len(self._data):
+            grown = np.empty((len(self._data) * 2, 4), dtype=np.float64)
+            grown[:self._count] = self._data[:self._count]
+            self._data = grown
+        row = self._data[self._count]
+        row[:] = values[:4]
+        self._count += 1
+        return row
+
+    def snapshot(self) -> np.ndarray:
+        """Copy of the rows collected so far, safe to ship to another process."""
+        return self._data[:self._count].copy()
+
+
+def analyze_sweep(data: np.ndarray, nominal_baud: float,
+                  tolerance_pct: float = DEFAULT_TOLERANCE_PCT) -> dict:
+    """Compute tolerance window, error-vs-baud curve and pass/fail margins in bulk.
+
+    Runs in a worker process, so it takes and returns only picklable values.
+    """
+    if data.size == 0:
+        return {"count": 0}
+
+    min_b, min_e = data[:, MIN_BAUD], data[:, MIN_ERR]
+    max_b, max_e = data[:, MAX_BAUD], data[:, MAX_ERR]
+
+    # Error-vs-baud curve: both edges of every sweep point, ordered by baud
+    baud = np.concatenate((min_b, max_b))
+    error = np.concatenate((min_e, max_e))
+    order = np.argsort(baud, kind='stable')
+
+    worst_error = np.maximum(np.abs(min_e), np.abs(max_e))
+    margin = tolerance_pct - worst_error
+    passed = margin >= 0
+
+    low_index = int(np.argmin(min_b))
+    high_index = int(np.argmax(max_b))
+    window_low = float(min_b[low_index])
+    window_high = float(max_b[high_index])
+    return {
+        "count": int(len(data)),
+        "nominal_baud": float(nominal_baud),
+        "tolerance_pct": float(tolerance_pct),
+        "window_low": window_low,
+        "window_high": window_high,
+        "window_low_error": float(min_e[low_index]),
+        "window_high_error": float(max_e[high_index]),
+        "window_low_pct": (window_low - nominal_baud) / nominal_baud * 100.0 if nominal_baud else 0.0,
+        "window_high_pct": (window_high - nominal_baud) / nominal_baud * 100.0 if nominal_baud else 0.0,
+        "curve_baud": baud[order],
+        "curve_error": error[order],
+        "margin": margin,
+        "passed": int(passed.sum()),
+        "failed": int((~passed).sum()),
+        "worst_margin": float(margin.min()),
+        "mean_abs_error": float(np.abs(error).mean()),
+        "std_error": float(error.std()),
+    }
+
+
+class BaudSweepAnalyzer(QObject):
+    """Runs analyze_sweep in a process pool and reports back on the GUI thread."""
+    analysis_ready = Signal(object)  # dict from analyze_sweep
+    error = Signal(str)
+
+    def __init__(self, max_workers: int = 1):
+        super().__init__()
+        self.max_workers = max_workers
+        self._pool = None
+
+    def submit(self, data: np.ndarray, nominal_baud: float,
+               tolerance_pct: float = DEFAULT_TOLERANCE_PCT):
+        if self._pool is None:
+            # Started on first use so the app does not pay for idle workers
+            self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+        future = self._pool.submit(analyze_sweep, data, nominal_baud, tolerance_pct)
+        future.add_done_callback(self._on_done)
+
+    def _on_done(self, future):
+        try:
+            self.analysis_ready.emit(future.result())
+        except Exception as e:
+            logger.error("Baud sweep analysis failed: %s", e)
+            self.error.emit(f"Error: {e}")
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
@@ -0,0 +1,153 @@
+# app/services/baud_tolerance_search.py
+from dataclasses import dataclass, field, replace
+from typing import Callable, List, Optional, Tuple
+import logging
+from PySide6.QtCore import QThread, Signal
+from app.models.uart_model import UARTTestBaseConfig, UARTPayloadConfig
+from app.services.cancellation import CancelToken, Cancelled
+from app.services.labview_client import LabVIEWClient
+from app.services.labview_service import build_serial_port_message
+from app.services.ber_analysis import compare_buffers
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_DEVIATION_PCT = 10.0  # search nominal ±10%
+DEFAULT_PRECISION_PCT = 0.05      # stop once an edge is bracketed this tightly
+DEFAULT_PATTERN = "U5\xaa\x55The quick brown fox 0123456789"
+
+
+class SearchStopped(Exception):
+    pass
+
+
+@dataclass
+class ToleranceResult:
+    nominal: int
+    min_baud: Optional[float] = None  # lowest passing baud found
+    max_baud: Optional[float] = None  # highest passing baud found
+    min_limited: bool = False         # True when the search range ended before a failure was seen
+    max_limited: bool = False
+    probes: List[Tuple[float, bool]] = field(default_factory=list)
+    reason: str = ""
+
+    @property
+    def passed_nominal(self) -> bool:
+        return self.min_baud is not None
+
+    @property
+    def min_pct(self) -> float:
+        return (self.min_baud - self.nominal) / self.nominal * 100.0
+
+    @property
+    def max_pct(self) -> float:
+        return (self.max_baud - self.nominal) / self.nominal * 100.0
+
+
+class BaudToleranceSearch:
+    """Bisects the pass/fail boundary on each side of the nominal baud rate.
+
+    ``probe(baud) -> bool`` runs one trial at that rate. Pass/fail is assumed
+    monotonic on each side of nominal, so each edge needs only
+    log2(range / precision) probes instead of a linear sweep.
+    """
+
+    def __init__(self, probe: Callable[[float], bool],
+                 max_deviation_pct: float = DEFAULT_MAX_DEVIATION_PCT,
+                 precision_pct: float = DEFAULT_PRECISION_PCT,
+                 max_probes: int = 64):
+        self.probe = probe
+        self.max_deviation_pct = max_deviation_pct
+        self.precision_pct = precision_pct
+        self.max_probes = max_probes
+        self._stop_requested = False
+
+    def stop(self):
+        self._stop_requested = True
+
+    def _run_probe(self, baud: float, result: ToleranceResult) -> bool:
+        if self._stop_requested:
+            raise SearchStopped("stopped")
+        if len(result.probes) >= self.max_probes:
+            raise SearchStopped(f"probe budget of {self.max_probes} exhausted")
+        passed = bool(self.probe(baud))
+        result.probes.append((baud, passed))
+        return passed
+
+    def _find_edge(self, nominal: float, direction: int, result: ToleranceResult):
+        """Return (last passing baud, limited) on one side of nominal."""
+        good = nominal
+        bad = nominal * (1 + direction * self.max_deviation_pct / 100.0)
+        if self._run_probe(bad, result):
+            # Still passing at the edge of the range: no need to bisect
+            return bad, True
+        precision = nominal * self.precision_pct / 100.0
+        while abs(bad - good) > precision:
+            mid = (good + bad) / 2.0
+            if self._run_probe(mid, result):
+                good = mid
+            else:
+                bad = mid
+        return good, False
+
+    def search(self, nominal: int) -> ToleranceResult:
+        result = ToleranceResult(nominal=nominal)
+        try:
+            if not self._run_probe(nominal, result):
+                result.reason = "fails at nominal baud rate"
+                return result
+            result.min_baud, result.min_limited = self._find_edge(nominal, -1, result)
+            result.max_baud, result.max_limited = self._find_edge(nominal, +1, result)
+            result.reason = "converged"
+        except SearchStopped as e:
+            result.reason = str(e)
+        return result
+
+
+class BaudToleranceSearchRunner(QThread):
+    """Runs a BaudToleranceSearch against the VI, one LOOPBACK TEST message per probe."""
+    probe_done = Signal(float, bool)  # (baud, passed)
+    finished = Signal(object)         # ToleranceResult
+    error = Signal(str)
+
+    def __init__(self, base_config: UARTTestBaseConfig, host='127.0.0.1', port=12345,
+                 pattern: str = DEFAULT_PATTERN, trials: int = 1, **search_options):
+        super().__init__()
+        self.base_config = base_config
+        self.host = host
+        self.port = port
+        self.pattern = pattern
+        self.trials = trials  # every trial at a rate must pass for the rate to pass
+        self.search = BaudToleranceSearch(self._probe, **search_options)
+        self._client = None
+        self.cancel_token = CancelToken()
+
+    def stop(self):
+        self.search.stop()
+        self.cancel_token.cancel()
+
+    def _probe(self, baud: float) -> bool:
+        config = replace(self.base_config, test_name="LOOPBACK TEST", baud_rate=int(round(baud)))
+        message = build_serial_port_message(config, UARTPayloadConfig(self.pattern, len(self.pattern)))
+        passed = True
+        for _ in range(self.trials):
+            try:
+                reply = self._client.request(message)
+            except Cancelled:
+                raise SearchStopped("stopped") from None
+            if not compare_buffers(self.pattern.encode('utf-8'), reply.strip().encode('utf-8')).passed:
+                passed = False
+                break
+        logger.debug("Baud probe %d: %s", int(round(baud)), "pass" if passed else "fail")
+        self.probe_done.emit(float(baud), passed)
+        return passed
+
+    def run(self):
+        self._client = LabVIEWClient(self.host, self.port, cancel_token=self.cancel_token)
+        try:
+            result = self.search.search(self.base_config.baud_rate)
+        except OSError as e:
+            self.error.emit(f"Error: {e}")
+            return
+        finally:
+            self._client.close()
+        self.finished.emit(result)
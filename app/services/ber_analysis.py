@@ -0,0 +1,96 @@
+# app/services/ber_analysis.py
+from dataclasses import dataclass, field
+from typing import Dict
+import numpy as np
+
+# Number of set bits in every byte value, used as a vectorised popcount
+POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+@dataclass
+class BERResult:
+    bits_compared: int
+    bit_errors: int
+    first_mismatch: int        # byte offset, -1 when the buffers match
+    burst_lengths: np.ndarray  # lengths in bytes of each run of mismatched bytes
+    length_mismatch: int       # len(rx) - len(tx)
+
+    @property
+    def ber(self) -> float:
+        return self.bit_errors / self.bits_compared if self.bits_compared else 0.0
+
+    @property
+    def passed(self) -> bool:
+        return self.bit_errors == 0
+
+
+def compare_buffers(tx: bytes, rx: bytes) -> BERResult:
+    """Byte-level Tx/Rx comparison with bit error count and error bursts.
+
+    Bytes missing from (or extra in) the shorter buffer count as fully
+    errored, so a truncated reply never reports a perfect BER.
+    """
+    common = min(len(tx), len(rx))
+    extra = abs(len(rx) - len(tx))
+    a = np.frombuffer(tx, dtype=np.uint8, count=common)
+    b = np.frombuffer(rx, dtype=np.uint8, count=common)
+    diff = np.bitwise_xor(a, b)
+
+    bit_errors = int(POPCOUNT[diff].sum(dtype=np.int64)) + extra * 8
+    mismatched = np.flatnonzero(diff)
+    if extra:
+        # The unmatched tail is one more burst
+        mismatched = np.concatenate((mismatched, np.arange(common, common + extra)))
+
+    if mismatched.size:
+        breaks = np.flatnonzero(np.diff(mismatched) != 1)
+        starts = np.concatenate(([0], breaks + 1))
+        ends = np.concatenate((breaks, [mismatched.size - 1]))
+        bursts = mismatched[ends] - mismatched[starts] + 1
+        first = int(mismatched[0])
+    else:
+        bursts = np.empty(0, dtype=np.int64)
+        first = -1
+
+    return BERResult(
+        bits_compared=max(len(tx), len(rx)) * 8,
+        bit_errors=bit_errors,
+        first_mismatch=first,
+        burst_lengths=bursts,
+        length_mismatch=len(rx) - len(tx)
+    )
+
+
+@dataclass
+class BERAccumulator:
+    """Running totals of loopback comparisons over a long run."""
+    bits_compared: int = 0
+    bit_errors: int = 0
+    frames: int = 0
+    failed_frames: int = 0
+    longest_burst: int = 0
+    burst_histogram: Dict[int, int] = field(default_factory=dict)  # burst length -> count
+
+    def add(self, result: BERResult):
+        self.bits_compared += result.bits_compared
+        self.bit_errors += result.bit_errors
+        self.frames += 1
+        if not result.passed:
+            self.failed_frames += 1
+        if result.burst_lengths.size:
+            lengths, counts = np.unique(result.burst_lengths, return_counts=True)
+            for length, count in zip(lengths.tolist(), counts.tolist()):
+                self.burst_histogram[length] = self.burst_histogram.get(length, 0) + count
+            self.longest_burst = max(self.longest_burst, int(lengths[-1]))
+
+    @property
+    def ber(self) -> float:
+        return self.bit_errors / self.bits_compared if self.bits_compared else 0.0
+
+    def reset(self):
+        self.bits_compared = 0
+        self.bit_errors = 0
+        self.frames = 0
+        self.failed_frames = 0
+        self.longest_burst = 0
+        self.burst_histogram.clear()
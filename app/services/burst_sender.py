@@ -0,0 +1,145 @@
+# app/services/burst_sender.py
+from concurrent.futures import ThreadPoolExecutor
+import queue
+import threading
+import time
+import logging
+from PySide6.QtCore import QThread, Signal
+from app.services.cancellation import CancelToken, Cancelled
+from app.services.labview_client import LabVIEWClient
+
+# Below this much time left before a deadline the scheduler spins instead of
+# sleeping, since OS sleep granularity is far coarser than the target period.
+SPIN_THRESHOLD = 0.002
+
+
+def sleep_until(deadline: float):
+    """Block until time.perf_counter() reaches deadline."""
+    while True:
+        remaining = deadline - time.perf_counter()
+        if remaining <= 0:
+            return
+        if remaining > SPIN_THRESHOLD:
+            time.sleep(remaining - SPIN_THRESHOLD)
+        else:
+            time.sleep(0)
+
+
+class BurstSender(QThread):
+    """Cyclic/burst transmit engine.
+
+    Sends the given messages in order, ``repeat_count`` passes over the list,
+    either paced at ``target_rate`` messages per second or back-to-back when
+    the rate is 0. Up to ``max_in_flight`` requests are outstanding at once,
+    each on its own LabVIEW connection.
+    """
+    result_ready = Signal(int, str, float)     # (payload index, response, latency in s)
+    rate_update = Signal(int, float, float)    # (completed, achieved rate, target rate)
+    finished = Signal(int)                     # number of requests completed
+    error = Signal(str)
+
+    REPORT_INTERVAL = 0.5
+
+    def __init__(self, messages, host='127.0.0.1', port=12345,
+                 target_rate=0.0, max_in_flight=1, repeat_count=1):
+        super().__init__()
+        self.messages = list(messages)
+        self.host = host
+        self.port = port
+        self.target_rate = float(target_rate)
+        self.max_in_flight = max(1, int(max_in_flight))
+        self.repeat_count = max(1, int(repeat_count))
+        self.logger = logging.getLogger(__name__)
+        self._stop_requested = False
+        self._local = threading.local()
+        self._clients = []
+        self._clients_lock = threading.Lock()
+        # Pool threads only enqueue results; signals are emitted from run() so
+        # that exactly one thread ever emits.
+        self._results = queue.Queue()
+        self._completed = 0
+        self.cancel_token = CancelToken()
+
+    def stop(self):
+        self._stop_requested = True
+        self.cancel_token.cancel()  # aborts the requests in flight
+
+    def _client(self) -> LabVIEWClient:
+        client = getattr(self._local, 'client', None)
+        if client is None:
+            client = LabVIEWClient(self.host, self.port, cancel_token=self.cancel_token)
+            self._local.client = client
+            with self._clients_lock:
+                self._clients.append(client)
+        return client
+
+    def _send(self, index, message, slots):
+        start = time.perf_counter()
+        try:
+            response = self._client().request(message)
+        except Cancelled:
+            return  # stopped; not a failed send
+        except OSError as e:
+            self._client().close()
+            response = f"Error: {e}"
+        finally:
+            slots.release()
+        self._results.put((index, response, time.perf_counter() - start))
+
+    def _drain(self):
+        while True:
+            try:
+                index, response, latency = self._results.get_nowait()
+            except queue.Empty:
+                return
+            self._completed += 1
+            self.result_ready.emit(index, response, latency)
+
+    def run(self):
+        if not self.messages:
+            self.finished.emit(0)
+            return
+
+        period = 1.0 / self.target_rate if self.target_rate > 0 else 0.0
+        slots = threading.Semaphore(self.max_in_flight)
+        pool = ThreadPoolExecutor(max_workers=self.max_in_flight)
+        start = time.perf_counter()
+        next_report = start + self.REPORT_INTERVAL
+        sent = 0
+        try:
+            for _ in range(self.repeat_count):
+                for index, message in enumerate(self.messages):
+                    if self._stop_requested:
+                        break
+                    if period:
+                        # Absolute deadlines: jitter in one send never accumulates
+                        sleep_until(start + sent * period)
+                    while not slots.acquire(timeout=0.05):
+                        self._drain()
+                    pool.submit(self._send, index, message, slots)
+                    sent += 1
+                    self._drain()
+
+                    now = time.perf_counter()
+                    if now >= next_report:
+                        self._report(now - start)
+                        next_report = now + self.REPORT_INTERVAL
+                if self._stop_requested:
+                    self.logger.info("Burst stopped after %d sends", sent)
+                    break
+        except Exception as e:
+            self.error.emit(f"Error: {e}")
+        finally:
+            pool.shutdown(wait=True)
+            self._drain()
+            with self._clients_lock:
+                for client in self._clients:
+                    client.close()
+                self._clients.clear()
+
+        self._report(time.perf_counter() - start)
+        self.finished.emit(self._completed)
+
+    def _report(self, elapsed: float):
+        achieved = self._completed / elapsed if elapsed > 0 else 0.0
+        self.rate_update.emit(self._completed, achieved, self.target_rate)
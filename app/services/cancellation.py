@@ -0,0 +1,79 @@
+# app/services/cancellation.py
+"""Cooperative cancellation for threads blocked on LabVIEW sockets.
+
+A worker thread cannot be killed safely: QThread.terminate() leaves its
+socket open and its Python state half-updated. Instead the thread that
+wants to stop a worker cancels the worker's CancelToken. Cancelling shuts
+down every socket the worker registered with watch(), so a blocked recv()
+returns at once, and the worker then sees the token set and unwinds
+normally, closing what it opened.
+"""
+from contextlib import contextmanager
+import socket
+import threading
+
+
+class Cancelled(OSError):
+    """A request was aborted through its CancelToken.
+
+    An OSError, so code that already handles a dropped connection also
+    handles a cancelled one.
+    """
+
+    def __init__(self, message="cancelled"):
+        super().__init__(message)
+
+
+class CancelToken:
+    def __init__(self):
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._sockets = set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self):
+        """Set the token and unblock every watched socket; safe to call from any thread, more than once."""
+        with self._lock:
+            self._event.set()
+            sockets = list(self._sockets)
+        for sock in sockets:
+            _shutdown(sock)
+
+    def raise_if_cancelled(self):
+        if self._event.is_set():
+            raise Cancelled()
+
+    def sleep(self, seconds: float) -> bool:
+        """Sleep that a cancel cuts short; True if the token was cancelled."""
+        return self._event.wait(seconds)
+
+    def add(self, sock: socket.socket):
+        """Shut sock down when the token is cancelled (at once if it already is)."""
+        with self._lock:
+            self._sockets.add(sock)
+            cancelled = self._event.is_set()
+        if cancelled:
+            _shutdown(sock)
+
+    def discard(self, sock: socket.socket):
+        with self._lock:
+            self._sockets.discard(sock)
+
+    @contextmanager
+    def watch(self, sock: socket.socket):
+        """add() sock for the duration of the block."""
+        self.add(sock)
+        try:
+            yield sock
+        finally:
+            self.discard(sock)
+
+
+def _shutdown(sock: socket.socket):
+    try:
+        sock.shutdown(socket.SHUT_RDWR)
+    except OSError:
+        pass  # not connected yet, or already closed
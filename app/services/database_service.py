@@ -1,25 +1,52 @@
 import psycopg2
 from psycopg2 import sql
+from psycopg2.pool import ThreadedConnectionPool
+import threading
 import logging
 from datetime import datetime
 
-# Setup logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class Database:
-    def __init__(self, db_config):
+    def __init__(self, db_config, max_connections=4):
         self.db_config = db_config
+        self.max_connections = max_connections
+        self._pool = None
+        self._pool_lock = threading.Lock()
+        self.tables_ready = False
 
     def connect(self):
+        """Borrow a pooled connection; hand it back with release()."""
         try:
-            conn = psycopg2.connect(**self.db_config)
-            return conn
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = ThreadedConnectionPool(1, self.max_connections, **self.db_config)
+            return self._pool.getconn()
         except psycopg2.Error as e:
-            logger.error(f"Error connecting to the database: {e}")
+            logger.error("Error connecting to the database: %s", e)
             return None
 
+    def release(self, conn):
+        """Return a connection from connect() to the pool, discarding it if broken."""
+        if self._pool is None:
+            conn.close()
+            return
+        if not conn.closed:
+            try:
+                conn.rollback()  # Never hand out a connection mid-transaction
+            except psycopg2.Error:
+                pass
+        self._pool.putconn(conn, close=bool(conn.closed))
+
+    def close(self):
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.closeall()
+                self._pool = None
+
     def create_tables(self):
+        if self.tables_ready:
+            return
         conn = self.connect()
         if conn is None:
             return
@@ -112,12 +139,13 @@ class Database:
                             ON CONFLICT (id) DO NOTHING
                         """, (test_id, test_type_id, name.upper()))
                 conn.commit()
+                self.tables_ready = True
                 logger.debug("Tables created successfully")
         except psycopg2.Error as e:
-            logger.error(f"Error creating tables: {e}")
+            logger.error("Error creating tables: %s", e)
             conn.rollback()
         finally:
-            conn.close()
+            self.release(conn)
 
     def get_test_type_id(self, test_category):
         conn = self.connect()
@@ -132,10 +160,10 @@ class Database:
                 Status = cur.fetchone()
                 return Status[0] if Status else None
         except psycopg2.Error as e:
-            logger.error(f"Error getting test type ID: {e}")
+            logger.error("Error getting test type ID: %s", e)
             return None
         finally:
-            conn.close()
+            self.release(conn)
 
     def get_test_name_id(self, test_type_id, test_name):
         conn = self.connect()
@@ -150,10 +178,10 @@ class Database:
                 Status = cur.fetchone()
                 return Status[0] if Status else None
         except psycopg2.Error as e:
-            logger.error(f"Error getting test name ID: {e}")
+            logger.error("Error getting test name ID: %s", e)
             return None
         finally:
-            conn.close()
+            self.release(conn)
 
     def _generate_config_id(self):
         conn = self.connect()
@@ -167,10 +195,10 @@ class Database:
                 serial = count + 1
                 return f"CFG_UART_{serial:03d}"
         except psycopg2.Error as e:
-            logger.error(f"Error generating config ID: {e}")
+            logger.error("Error generating config ID: %s", e)
             return "CFG_UART_001"
         finally:
-            conn.close()
+            self.release(conn)
 
     def insert_uart_config(self, test_name_id, device_id,baud_rate, data_bits, parity, 
                           stop_bits, data_shift, handshake):
@@ -191,13 +219,13 @@ class Database:
                       stop_bits, data_shift, handshake))
                 returned_id = cur.fetchone()[0]
                 conn.commit()
-                logger.info(f"UART configuration inserted with id: {returned_id}")
+                logger.info("UART configuration inserted with id: %s", returned_id)
                 return returned_id
         except psycopg2.Error as e:
-            logger.error(f"Error inserting UART configuration: {e}")
+            logger.error("Error inserting UART configuration: %s", e)
             return None
         finally:
-            conn.close()
+            self.release(conn)
 
     def insert_test_result(self, uart_config_id,test_name, tx_data, tx_timestamp, rx_data, rx_timestamp, status):
         conn = self.connect()
@@ -214,13 +242,13 @@ class Database:
                 """, (uart_config_id,test_name, tx_data, tx_timestamp, rx_data, rx_timestamp, status))
                 result_id = cur.fetchone()[0]
                 conn.commit()
-                logger.info(f"Test Status inserted with id: {result_id}")
+                logger.info("Test Status inserted with id: %s", result_id)
                 return result_id
         except psycopg2.Error as e:
-            logger.error(f"Error inserting test Status: {e}")
+            logger.error("Error inserting test Status: %s", e)
             return None
         finally:
-            conn.close()
+            self.release(conn)
     def _save_baud_rate_test_result(self, min_baud, min_error, max_baud, max_error):
         """Save baud rate test results to database"""
         if self.db and self.current_base_config:
@@ -0,0 +1,180 @@
+# app/services/eeprom_transfer.py
+from dataclasses import dataclass, field
+from typing import List
+import logging
+import time
+from PySide6.QtCore import QThread, Signal
+from app.models.eeprom_model import EEPROMProfile
+from app.models.i2c_model import I2CTestBaseConfig
+from app.services.cancellation import CancelToken, Cancelled
+from app.services.i2c_client import I2CClient
+
+logger = logging.getLogger(__name__)
+
+READ_CHUNK = 256         # bytes per sequential verify read
+MIN_POLL_WINDOW = 0.05   # seconds; ACK polling gives up after max(4 x tWR, this)
+POLL_INTERVAL = 0.0005   # seconds between ACK polls, so a busy part is not flooded with requests
+
+
+class TransferStopped(Exception):
+    pass
+
+
+class TransferError(Exception):
+    pass
+
+
+@dataclass
+class EEPROMTransferResult:
+    profile: str
+    start: int
+    length: int
+    bytes_written: int = 0
+    pages: int = 0
+    ack_polls: int = 0
+    verified: bool = False
+    mismatches: List[int] = field(default_factory=list)  # memory addresses that read back wrong
+    elapsed: float = 0.0
+    reason: str = ""
+
+
+def page_writes(profile: EEPROMProfile, start: int, length: int):
+    """(memory address, data offset, size) of each write; none crosses a page boundary."""
+    address, offset = start, 0
+    while offset < length:
+        size = min(profile.page_size - address % profile.page_size, length - offset)
+        yield address, offset, size
+        address += size
+        offset += size
+
+
+def read_chunks(profile: EEPROMProfile, start: int, length: int, chunk: int = READ_CHUNK):
+    """(memory address, data offset, size) of each verify read; none crosses a device-address block."""
+    address, offset = start, 0
+    while offset < length:
+        size = min(chunk, profile.block_size - address % profile.block_size, length - offset)
+        yield address, offset, size
+        address += size
+        offset += size
+
+
+class EEPROMTransfer:
+    """Page-aligned programming with ACK polling, then a sequential read-back verify."""
+
+    def __init__(self, client: I2CClient, profile: EEPROMProfile, base_address: int):
+        self.client = client
+        self.profile = profile
+        self.base_address = base_address
+        self._stop_requested = False
+
+    def stop(self):
+        self._stop_requested = True
+
+    def _check_stop(self):
+        if self._stop_requested:
+            raise TransferStopped("stopped")
+
+    def _wait_for_ack(self, device_address: int) -> int:
+        """Poll until the write cycle ends (the device ACKs again); returns the number of polls."""
+        deadline = time.monotonic() + max(4 * self.profile.write_cycle_ms / 1000.0, MIN_POLL_WINDOW)
+        polls = 0
+        while True:
+            polls += 1
+            if self.client.probe(device_address):
+                return polls
+            if time.monotonic() > deadline:
+                raise TransferError(f"device 0x{device_address:02x} still busy after {polls} ACK polls")
+            time.sleep(POLL_INTERVAL)
+
+    def _memory_word(self, address: int) -> int:
+        return address % self.profile.block_size
+
+    def write(self, data: bytes, start: int, result: EEPROMTransferResult, progress=None):
+        profile = self.profile
+        for address, offset, size in page_writes(profile, start, len(data)):
+            self._check_stop()
+            device = profile.device_address(self.base_address, address)
+            if not self.client.write(self._memory_word(address), data[offset:offset + size],
+                                     profile.register_size, device):
+                raise TransferError(f"write at 0x{address:04x} was not acknowledged")
+            result.ack_polls += self._wait_for_ack(device)
+            result.pages += 1
+            result.bytes_written += size
+            if progress:
+                progress(offset + size)
+
+    def verify(self, data: bytes, start: int, result: EEPROMTransferResult, progress=None):
+        profile = self.profile
+        for address, offset, size in read_chunks(profile, start, len(data)):
+            self._check_stop()
+            device = profile.device_address(self.base_address, address)
+            readback = self.client.read(self._memory_word(address), size, profile.register_size, device)
+            expected = data[offset:offset + size]
+            if readback != expected:
+                result.mismatches.extend(
+                    address + i for i in range(size)
+                    if i >= len(readback) or readback[i] != expected[i]
+                )
+            if progress:
+                progress(offset + size)
+        result.verified = not result.mismatches
+
+    def program(self, data: bytes, start: int = 0, verify: bool = True, progress=None) -> EEPROMTransferResult:
+        """Write data at start and optionally read it back. progress(phase, done, total) is called per transaction."""
+        result = EEPROMTransferResult(self.profile.name, start, len(data))
+        if start < 0 or start + len(data) > self.profile.size:
+            result.reason = f"{len(data)} bytes at 0x{start:x} do not fit in a {self.profile.size}-byte {self.profile.name}"
+            return result
+        began = time.perf_counter()
+        try:
+            self.write(data, start, result, progress and (lambda done: progress("write", done, len(data))))
+            if verify:
+                self.verify(data, start, result, progress and (lambda done: progress("verify", done, len(data))))
+            result.reason = "completed"
+        except (TransferStopped, TransferError, Cancelled) as e:
+            result.reason = str(e)
+        result.elapsed = time.perf_counter() - began
+        return result
+
+
+class EEPROMTransferRunner(QThread):
+    """Runs an EEPROMTransfer against the I2C VI off the GUI thread."""
+    progress = Signal(str, int, int)  # (phase, bytes done, total)
+    finished = Signal(object)         # EEPROMTransferResult
+    error = Signal(str)
+
+    def __init__(self, base_config: I2CTestBaseConfig, profile: EEPROMProfile, data: bytes,
+                 start: int = 0, verify: bool = True, host='127.0.0.1', port=9561):
+        super().__init__()
+        self.base_config = base_config
+        self.profile = profile
+        self.data = bytes(data)
+        self.start_address = start
+        self.verify = verify
+        self.host = host
+        self.port = port
+        self.transfer = None
+        self.cancel_token = CancelToken()
+        self._stop_requested = False
+
+    def stop(self):
+        self._stop_requested = True
+        if self.transfer is not None:
+            self.transfer.stop()
+        self.cancel_token.cancel()
+
+    def run(self):
+        client = I2CClient(self.base_config, self.host, self.port, cancel_token=self.cancel_token)
+        try:
+            self.transfer = EEPROMTransfer(client, self.profile, int(self.base_config.device_address, 16))
+            if self._stop_requested:
+                self.transfer.stop()
+            result = self.transfer.program(self.data, self.start_address, self.verify, self.progress.emit)
+            logger.info("EEPROM %s: %d pages, %d ACK polls, %d transactions in %.2fs",
+                        result.reason, result.pages, result.ack_polls, client.transactions, result.elapsed)
+        except (OSError, ValueError) as e:
+            self.error.emit(f"Error: {e}")
+            return
+        finally:
+            client.close()
+        self.finished.emit(result)
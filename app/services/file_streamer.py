@@ -0,0 +1,182 @@
+# app/services/file_streamer.py
+"""Streams a file of any size to the UART VI in fixed-size chunks.
+
+The file is memory-mapped, so only the chunks in flight are ever copied into
+Python memory. Chunks go out a window at a time as hex-encoded batch
+messages; the next window is only sent once the VI has answered the current
+one, which keeps the VI's serial buffer from being overrun at any baud rate.
+"""
+from dataclasses import dataclass
+from typing import List, Optional
+import logging
+import mmap
+import os
+import time
+import zlib
+import numpy as np
+from PySide6.QtCore import QThread, Signal
+from app.models.uart_model import UARTTestBaseConfig
+from app.services.cancellation import CancelToken, Cancelled
+from app.services.labview_client import LabVIEWClient
+from app.services.labview_service import serial_port_encoder, encode_stream_window, parse_batch_reply_line
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 1024   # file bytes per tx_data line
+WINDOW = 16         # chunks per request, i.e. the most data unacknowledged by the VI
+
+
+class StreamStopped(Exception):
+    pass
+
+
+@dataclass
+class FileStreamResult:
+    path: str
+    size: int
+    chunk_size: int
+    chunks: int
+    chunks_sent: int = 0
+    bytes_sent: int = 0
+    elapsed: float = 0.0
+    tx_crc: int = 0
+    rx_crc: int = 0
+    rx_bytes: int = 0                  # looped-back bytes received
+    missing_chunks: int = 0            # chunks the VI did not answer
+    mismatched_chunks: Optional[List[int]] = None  # loopback chunks that differ from what was sent
+    window_rates: Optional[np.ndarray] = None      # bytes/s of each acknowledged window (one request)
+    reason: str = ""
+
+    @property
+    def throughput(self) -> float:
+        return self.bytes_sent / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def looped_back(self) -> bool:
+        """True when every chunk came back and the checksums match."""
+        return (self.chunks_sent == self.chunks and not self.missing_chunks
+                and self.rx_bytes == self.size and self.rx_crc == self.tx_crc)
+
+
+def decode_rx_chunk(rx_data: str) -> bytes:
+    """Loopback data of one chunk: hex as sent, or the raw text if the VI echoed it undecoded."""
+    try:
+        return bytes.fromhex(rx_data)
+    except ValueError:
+        return rx_data.strip().encode('utf-8')
+
+
+class FileStreamer:
+    def __init__(self, client: LabVIEWClient, base_config: UARTTestBaseConfig,
+                 chunk_size: int = CHUNK_SIZE, window: int = WINDOW):
+        if chunk_size <= 0 or window <= 0:
+            raise ValueError("chunk_size and window must be positive")
+        self.client = client
+        self.encoder = serial_port_encoder()
+        self.encoder.set_base_config(base_config)
+        self.chunk_size = chunk_size
+        self.window = window
+        self._stop_requested = False
+
+    def stop(self):
+        self._stop_requested = True
+
+    def stream(self, path: str, progress=None) -> FileStreamResult:
+        """Send the file at path; progress(bytes sent, total, bytes/s) is called after each window."""
+        size = os.path.getsize(path)
+        chunks = -(-size // self.chunk_size)
+        result = FileStreamResult(path, size, self.chunk_size, chunks, mismatched_chunks=[],
+                                  window_rates=np.zeros(-(-chunks // self.window), dtype=np.float64))
+        if not size:
+            result.reason = "empty file"
+            return result
+        began = time.perf_counter()
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            try:
+                for first in range(0, chunks, self.window):
+                    if self._stop_requested:
+                        raise StreamStopped("stopped")
+                    self._send_window(data, first, min(first + self.window, chunks), result)
+                    if progress:
+                        progress(result.bytes_sent, size, result.bytes_sent / (time.perf_counter() - began))
+                result.reason = "completed"
+            except (StreamStopped, Cancelled) as e:
+                result.reason = str(e)
+        result.elapsed = time.perf_counter() - began
+        result.window_rates = result.window_rates[:-(-result.chunks_sent // self.window)]
+        return result
+
+    def _send_window(self, data: mmap.mmap, first: int, end: int, result: FileStreamResult):
+        chunks = [data[i * self.chunk_size:(i + 1) * self.chunk_size] for i in range(first, end)]
+        started = time.perf_counter()
+        try:
+            reply = self.client.request(encode_stream_window(self.encoder, first, result.chunks, chunks))
+        except Cancelled:
+            raise
+        except OSError as e:
+            # Keep the statistics of the windows already acknowledged
+            raise StreamStopped(f"chunk {first}: {e}") from e
+        elapsed = time.perf_counter() - started
+
+        looped = [None] * len(chunks)
+        for line in reply.splitlines():
+            parsed = parse_batch_reply_line(line)
+            if parsed is not None and parsed[0] < len(chunks):
+                looped[parsed[0]] = decode_rx_chunk(parsed[1])
+        sent = sum(len(chunk) for chunk in chunks)
+        # One request carries the whole window, so its rate is the finest that can be measured
+        result.window_rates[first // self.window] = sent / elapsed if elapsed > 0 else 0.0
+        for offset, (chunk, rx) in enumerate(zip(chunks, looped)):
+            result.tx_crc = zlib.crc32(chunk, result.tx_crc)
+            if rx is None:
+                result.missing_chunks += 1
+                continue
+            result.rx_crc = zlib.crc32(rx, result.rx_crc)
+            result.rx_bytes += len(rx)
+            if rx != chunk:
+                result.mismatched_chunks.append(first + offset)
+        result.chunks_sent = end
+        result.bytes_sent += sent
+
+
+class FileStreamRunner(QThread):
+    """Runs a FileStreamer against the UART VI off the GUI thread."""
+    progress = Signal(int, int, float)  # (bytes sent, total, bytes/s)
+    finished = Signal(object)           # FileStreamResult
+    error = Signal(str)
+
+    def __init__(self, base_config: UARTTestBaseConfig, path: str, host='127.0.0.1', port=12345,
+                 chunk_size: int = CHUNK_SIZE, window: int = WINDOW):
+        super().__init__()
+        self.base_config = base_config
+        self.path = path
+        self.host = host
+        self.port = port
+        self.chunk_size = chunk_size
+        self.window = window
+        self.streamer = None
+        self.cancel_token = CancelToken()
+        self._stop_requested = False
+
+    def stop(self):
+        self._stop_requested = True
+        if self.streamer is not None:
+            self.streamer.stop()
+        self.cancel_token.cancel()
+
+    def run(self):
+        client = LabVIEWClient(self.host, self.port, cancel_token=self.cancel_token)
+        try:
+            self.streamer = FileStreamer(client, self.base_config, self.chunk_size, self.window)
+            if self._stop_requested:
+                self.streamer.stop()
+            result = self.streamer.stream(self.path, self.progress.emit)
+            logger.info("File stream %s: %d/%d chunks, %.0f B/s, crc tx %08x rx %08x",
+                        result.reason, result.chunks_sent, result.chunks, result.throughput,
+                        result.tx_crc, result.rx_crc)
+        except (OSError, ValueError) as e:
+            self.error.emit(f"Error: {e}")
+            return
+        finally:
+            client.close()
+        self.finished.emit(result)
@@ -0,0 +1,47 @@
+# app/services/fixture_registry.py
+import json
+import logging
+from typing import Dict, List, Optional
+from app.models.fixture_model import Fixture
+
+logger = logging.getLogger(__name__)
+
+
+class FixtureRegistry:
+    """Named LabVIEW endpoints (one per DUT/VI) available to a session."""
+
+    def __init__(self):
+        self._fixtures: Dict[str, Fixture] = {}
+
+    def add(self, fixture: Fixture):
+        endpoint = (fixture.host, fixture.port)
+        for other in self._fixtures.values():
+            if other.name != fixture.name and (other.host, other.port) == endpoint:
+                raise ValueError(f"Fixture '{other.name}' already uses {fixture.host}:{fixture.port}")
+        self._fixtures[fixture.name] = fixture
+
+    def remove(self, name: str):
+        self._fixtures.pop(name, None)
+
+    def get(self, name: str) -> Optional[Fixture]:
+        return self._fixtures.get(name)
+
+    def fixtures(self, protocol: Optional[str] = None) -> List[Fixture]:
+        """Enabled fixtures, optionally limited to one protocol."""
+        return [f for f in self._fixtures.values()
+                if f.enabled and (protocol is None or f.protocol.upper() == protocol.upper())]
+
+    def __len__(self):
+        return len(self._fixtures)
+
+    def load(self, file_path: str):
+        with open(file_path, 'r') as f:
+            data = json.load(f)
+        self._fixtures.clear()
+        for raw in data.get("fixtures", []):
+            self.add(Fixture(**raw))
+        logger.info("Loaded %d fixtures from %s", len(self._fixtures), file_path)
+
+    def save(self, file_path: str):
+        with open(file_path, 'w') as f:
+            json.dump({"fixtures": [fx.__dict__ for fx in self._fixtures.values()]}, f, indent=4)
@@ -0,0 +1,47 @@
+# app/services/hex_codec.py
+"""Hex text <-> bytes for I2C payloads.
+
+Payload text is whitespace-separated byte values, each with or without a
+``0x`` prefix (``"0x0a 0B c"``). Parsing and formatting are done with
+``bytes.fromhex``/``bytes.hex`` over the whole payload rather than one
+token at a time, and formatted text is cached because the same payload is
+shown in the transmit table, the monitor and the INI message.
+"""
+from functools import lru_cache
+
+
+def parse_hex(text: str) -> bytes:
+    """Bytes for whitespace-separated hex values; raises ValueError on anything else.
+
+    Single digits are zero-padded (``"a"`` is 0x0a); longer runs are read two
+    digits per byte, most significant first, as ``bytes.fromhex`` does.
+    """
+    cleaned = text.replace("0x", " ").replace("0X", " ")
+    try:
+        return bytes.fromhex(cleaned)
+    except ValueError:
+        pass
+    # Slow path only for odd-length values or bad digits
+    tokens = cleaned.split()
+    for i, token in enumerate(tokens):
+        if len(token) == 1:
+            tokens[i] = "0" + token
+        elif len(token) % 2:
+            raise ValueError(f"Invalid value: 0x{token} (expected 0xXX)")
+    try:
+        return bytes.fromhex("".join(tokens))
+    except ValueError:
+        bad = next(t for t in tokens if any(c not in "0123456789abcdefABCDEF" for c in t))
+        raise ValueError(f"Invalid value: 0x{bad} (expected 0xXX)") from None
+
+
+@lru_cache(maxsize=256)
+def _format(data: bytes) -> str:
+    return "0x" + data.hex(" ").replace(" ", " 0x")
+
+
+def format_hex(data) -> str:
+    """Display form of data: ``"0x0a 0x0b 0x0c"``."""
+    if not data:
+        return ""
+    return _format(bytes(data))
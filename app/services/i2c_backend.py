@@ -6,14 +6,18 @@ class I2CBackend:
     def __init__(self, host='127.0.0.1', send_port=9561, receive_port=9562):
         self.logger = logging.getLogger(__name__)
         self.i2c_service = I2CService(host, send_port, receive_port)
+        self.i2c_service.start_reception()  # Listen for VI pushes for the backend's lifetime
 
     def send_base_config(self, base_config: I2CTestBaseConfig):
-        self.logger.info(f"Sending I2C base_config: {base_config}")
+        self.logger.debug("Sending I2C base_config: %s", base_config)
         return self.i2c_service.send_base_config(base_config)
 
     def send_payload(self, payload_config: I2CPayloadConfig):
-        self.logger.info(f"Sending I2C payload: {payload_config}")
+        self.logger.debug("Sending I2C payload: %s", payload_config)
         return self.i2c_service.send_payload(payload_config)
 
-    def receive_response(self):
-        return self.i2c_service.receive_response()
\ No newline at end of file
+    def receive_response(self, timeout=30):
+        return self.i2c_service.receive_response(timeout)
+
+    def close(self):
+        self.i2c_service.close()
\ No newline at end of file
@@ -0,0 +1,156 @@
+# app/services/i2c_bus_scanner.py
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+import logging
+import time
+from PySide6.QtCore import QThread, Signal
+from app.models.i2c_model import I2CTestBaseConfig
+from app.services.cancellation import CancelToken, Cancelled
+from app.services.i2c_client import I2CClient
+
+logger = logging.getLogger(__name__)
+
+SEVEN_BIT_ADDRESSES = range(0x08, 0x78)  # 0x00-0x07 and 0x78-0x7F are reserved
+TEN_BIT_ADDRESSES = range(0x000, 0x400)
+BATCH_SIZE = 128        # addresses probed per request
+SCAN_CACHE_TTL = 30.0   # seconds a bus scan is reused before probing again
+
+
+@dataclass
+class ScanResult:
+    bus: Tuple
+    found: List[int] = field(default_factory=list)          # 7-bit addresses that ACKed
+    found_10bit: List[int] = field(default_factory=list)
+    ten_bit: bool = False     # whether the 10-bit space was scanned
+    probes: int = 0
+    requests: int = 0
+    batched: bool = True      # False when the VI only answered single probes
+    elapsed: float = 0.0
+    timestamp: float = 0.0    # time.monotonic() when the scan finished
+    reason: str = ""
+
+    def addresses(self) -> List[str]:
+        return [f"0x{a:02X}" for a in self.found] + [f"0x{a:03X}" for a in self.found_10bit]
+
+
+class BusScanCache:
+    """Last scan per bus, where a bus is the VI endpoint and its clock settings."""
+
+    def __init__(self, ttl: float = SCAN_CACHE_TTL):
+        self.ttl = ttl
+        self._results: Dict[Tuple, ScanResult] = {}
+
+    def get(self, bus: Tuple, ten_bit: bool = False) -> Optional[ScanResult]:
+        result = self._results.get(bus)
+        if result is None or time.monotonic() - result.timestamp > self.ttl:
+            return None
+        if ten_bit and not result.ten_bit:
+            return None
+        return result
+
+    def put(self, result: ScanResult):
+        self._results[result.bus] = result
+
+    def invalidate(self, bus: Tuple = None):
+        if bus is None:
+            self._results.clear()
+        else:
+            self._results.pop(bus, None)
+
+
+def bus_key(base_config: I2CTestBaseConfig, host: str, port: int) -> Tuple:
+    return host, port, base_config.clock_speed, base_config.bus_mode
+
+
+class BusScanner:
+    """Probes address ranges for ACK, BATCH_SIZE addresses per request."""
+
+    def __init__(self, client: I2CClient, batch_size: int = BATCH_SIZE):
+        self.client = client
+        self.batch_size = batch_size
+        self.batched = True
+        self._stop_requested = False
+
+    def stop(self):
+        self._stop_requested = True
+
+    def _probe_batch(self, addresses, addressing_mode) -> List[bool]:
+        if self.batched:
+            acks = self.client.probe_many(addresses, addressing_mode)
+            if acks is not None:
+                return acks
+            logger.info("I2C VI did not answer a batched probe; scanning one address per request")
+            self.batched = False
+        width = 3 if addressing_mode == "10-bit" else 2
+        acks = []
+        for address in addresses:
+            if self._stop_requested:
+                break
+            acks.append(self.client.probe(f"0x{address:0{width}x}", addressing_mode))
+        return acks
+
+    def scan(self, addresses, addressing_mode: str = "7-bit", progress=None) -> List[int]:
+        addresses = list(addresses)
+        found = []
+        for start in range(0, len(addresses), self.batch_size):
+            if self._stop_requested:
+                break
+            batch = addresses[start:start + self.batch_size]
+            try:
+                acks = self._probe_batch(batch, addressing_mode)
+            except Cancelled:
+                break  # stopped mid-request; keep what was found so far
+            found.extend(a for a, ack in zip(batch, acks) if ack)
+            if progress:
+                progress(start + len(acks))
+        return found
+
+
+class BusScanRunner(QThread):
+    progress = Signal(int, int)  # (addresses probed, total)
+    finished = Signal(object)    # ScanResult
+    error = Signal(str)
+
+    def __init__(self, base_config: I2CTestBaseConfig, host='127.0.0.1', port=9561, ten_bit=False):
+        super().__init__()
+        self.base_config = base_config
+        self.host = host
+        self.port = port
+        self.ten_bit = ten_bit
+        self.scanner = None
+        self.cancel_token = CancelToken()
+        self._stop_requested = False
+
+    def stop(self):
+        self._stop_requested = True
+        if self.scanner is not None:
+            self.scanner.stop()
+        self.cancel_token.cancel()
+
+    def run(self):
+        result = ScanResult(bus=bus_key(self.base_config, self.host, self.port), ten_bit=self.ten_bit)
+        total = len(SEVEN_BIT_ADDRESSES) + (len(TEN_BIT_ADDRESSES) if self.ten_bit else 0)
+        client = I2CClient(self.base_config, self.host, self.port, cancel_token=self.cancel_token)
+        began = time.perf_counter()
+        try:
+            self.scanner = BusScanner(client)
+            if self._stop_requested:
+                self.scanner.stop()
+            result.found = self.scanner.scan(SEVEN_BIT_ADDRESSES, "7-bit",
+                                             lambda done: self.progress.emit(done, total))
+            if self.ten_bit:
+                offset = len(SEVEN_BIT_ADDRESSES)
+                result.found_10bit = self.scanner.scan(TEN_BIT_ADDRESSES, "10-bit",
+                                                       lambda done: self.progress.emit(offset + done, total))
+            result.probes = total
+            result.reason = "stopped" if self._stop_requested else "completed"
+        except OSError as e:
+            self.error.emit(f"Error: {e}")
+            return
+        finally:
+            client.close()
+        result.requests = client.transactions
+        result.batched = self.scanner.batched
+        result.elapsed = time.perf_counter() - began
+        result.timestamp = time.monotonic()
+        self.finished.emit(result)
@@ -0,0 +1,119 @@
+# app/services/i2c_client.py
+"""Synchronous WRITE/READ/ACK-probe transactions against the LabVIEW I2C VI.
+
+Bulk tools (EEPROM programming, bus scans, register maps) issue thousands of
+transactions, so they go over one persistent LabVIEWClient connection rather
+than I2CService._send_ini_message, which opens a socket per message.
+"""
+from dataclasses import replace
+import logging
+import re
+from app.models.i2c_model import I2CTestBaseConfig, I2CPayloadConfig
+from app.services.i2c_labview_service import i2c_config_encoder
+from app.services.labview_client import LabVIEWClient
+from app.services.labview_service import parse_batch_reply_line
+
+logger = logging.getLogger(__name__)
+
+WRITE_TEST = "WRITE TEST"
+READ_TEST = "READ TEST"
+PROBE_TEST = "ACK/NACK DETECTION TEST"  # address-only transaction; the VI answers ACK or NACK
+
+_TOKEN_SPLIT = re.compile(r"[\s,;]+")
+
+
+def is_ack(reply: str) -> bool:
+    reply = reply.upper()
+    return "ACK" in reply and "NACK" not in reply
+
+
+def parse_read_reply(reply: str, strict: bool = False):
+    """Byte values from a READ TEST reply: decimal or 0x-prefixed values, one per line or separated by commas.
+
+    With strict, returns None unless every value is a whole number from 0 to 255.
+    """
+    values = bytearray()
+    for token in _TOKEN_SPLIT.split(reply):
+        if not token:
+            continue
+        try:
+            if token[:2].lower() == "0x":
+                value = int(token, 16)
+            else:
+                value = int(float(token))
+        except ValueError:
+            continue  # status words such as ACK
+        if strict and (not 0 <= value <= 0xFF or (token[:2].lower() != "0x" and float(token) != value)):
+            return None
+        values.append(value & 0xFF)
+    return bytes(values)
+
+
+def format_address(address: int, register_size: int) -> str:
+    return f"0x{address:0{register_size // 4}x}"
+
+
+class I2CClient:
+    def __init__(self, base_config: I2CTestBaseConfig, host='127.0.0.1', port=9561, idle_timeout=0.5,
+                 cancel_token=None):
+        self.base_config = base_config
+        self.link = LabVIEWClient(host, port, idle_timeout=idle_timeout, cancel_token=cancel_token)
+        self._encoders = {}  # (test name, device address, addressing mode) -> IniEncoder
+        self.transactions = 0
+
+    def _encoder(self, test_name: str, device_address: str, addressing_mode: str = None):
+        addressing_mode = addressing_mode or self.base_config.addressing_mode
+        key = (test_name, device_address, addressing_mode)
+        encoder = self._encoders.get(key)
+        if encoder is None:
+            encoder = i2c_config_encoder()
+            encoder.set_base_config(replace(self.base_config, test_name=test_name, device_address=device_address,
+                                            addressing_mode=addressing_mode, register_address=""))
+            self._encoders[key] = encoder
+        return encoder
+
+    def _request(self, test_name: str, device_address, payload: I2CPayloadConfig, addressing_mode=None) -> str:
+        if isinstance(device_address, int):
+            device_address = f"0x{device_address:02x}"
+        device_address = device_address or self.base_config.device_address
+        message = self._encoder(test_name, device_address, addressing_mode).encode(payload)
+        self.transactions += 1
+        return self.link.request(message)
+
+    def write(self, register_address: int, data: bytes, register_size=8, device_address=None) -> bool:
+        """One write transaction; True if the device ACKed."""
+        payload = I2CPayloadConfig(data, len(data), register_size, format_address(register_address, register_size))
+        return is_ack(self._request(WRITE_TEST, device_address, payload))
+
+    def read(self, register_address: int, length: int, register_size=8, device_address=None) -> bytes:
+        """Sequential read of length bytes starting at register_address."""
+        payload = I2CPayloadConfig(b"", length, register_size, format_address(register_address, register_size))
+        return parse_read_reply(self._request(READ_TEST, device_address, payload))
+
+    def probe(self, device_address, addressing_mode: str = None) -> bool:
+        """Address the device with no data; True if it ACKs."""
+        return is_ack(self._request(PROBE_TEST, device_address, I2CPayloadConfig(b"", 0, 8), addressing_mode))
+
+    def probe_many(self, addresses, addressing_mode: str = "7-bit"):
+        """ACK flags for many addresses in one request, or None if the VI does not answer batches.
+
+        The request carries ``probe_count = N`` and ``probe_address_<i>`` lines;
+        the VI replies with one ``<i>,ACK`` / ``<i>,NACK`` line per address.
+        """
+        width = 3 if addressing_mode == "10-bit" else 2
+        lines = [f"probe_count = {len(addresses)}\n"]
+        lines.extend(f"probe_address_{i} = '0x{a:0{width}x}'\n" for i, a in enumerate(addresses))
+        encoder = self._encoder(PROBE_TEST, f"0x{addresses[0]:0{width}x}", addressing_mode)
+        self.transactions += 1
+        reply = self.link.request(encoder.encode_section("".join(lines)))
+        acks = [False] * len(addresses)
+        indexed = False
+        for line in reply.splitlines():
+            parsed = parse_batch_reply_line(line)
+            if parsed is not None and parsed[0] < len(addresses):
+                indexed = True
+                acks[parsed[0]] = is_ack(parsed[1])
+        return acks if indexed else None
+
+    def close(self):
+        self.link.close()
@@ -1,8 +1,92 @@
 import socket
 import subprocess
-import select
 import logging
+from functools import lru_cache
 from app.models.i2c_model import I2CTestBaseConfig, I2CPayloadConfig,I2CFullConfig
+from app.services.response_framing import read_framed_response
+from app.services import session_capture
+from app.services.ini_encoder import IniEncoder
+from app.services.reception_server import ReceptionServer
+from app.services.resilience import endpoint
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=1024)
+def split_register_address(register_address: str, register_size: int) -> str:
+    """
+    Convert register address(es) into LabVIEW-compatible format.
+    - Single address (8-bit):  '0xAB'
+    - Single address (16-bit): '0xAB', '0xCD'
+    - Multiple addresses:     '0xFA', '0xFB', '0xFC'
+    """
+    if not register_address or not register_address.strip():
+        return ""
+
+    # Split by whitespace and clean up
+    tokens = [token.strip().lower() for token in register_address.split() if token.strip()]
+    result_parts = []
+
+    for token in tokens:
+        if not token.startswith('0x'):
+            token = '0x' + token.lstrip('0')
+
+        # Remove 0x prefix for processing
+        hex_part = token[2:]
+
+        if register_size == 16:
+            # Pad to 4 hex digits and split into high/low
+            hex_part = hex_part.zfill(4)
+            high = hex_part[:2].upper()
+            low = hex_part[2:].upper()
+            result_parts.extend([f"'0x{high}'", f"'0x{low}'"])
+        else:
+            # 8-bit: pad to 2 digits
+            hex_part = hex_part.zfill(2)
+            result_parts.append(f"'0x{hex_part.upper()}'")
+
+    # Join with comma and space, wrapped in quotes
+    final_result = ", ".join(result_parts)
+    logger.debug("register_address input: '%s' → LabVIEW format: %s", register_address, final_result)
+    return final_result
+
+
+def _i2c_config_header(base_config: I2CTestBaseConfig) -> str:
+    """The [I2CConfig] base section sent ahead of every payload."""
+    lines = [
+        "[I2CConfig]",
+        f"test_name = {base_config.test_name}",
+        f"device_address = '{base_config.device_address}'",  # Original 7-bit address
+        f"clock_speed = {base_config.clock_speed}",
+        f"addressing_mode = {base_config.addressing_mode}",
+        f"bus_mode = {base_config.bus_mode}",
+    ]
+    # Add read/write addresses based on test type
+    if base_config.read_address:
+        lines.append(f"read_address = '{base_config.read_address}'")
+    if base_config.write_address:
+        lines.append(f"write_address = '{base_config.write_address}'")
+    return "\n".join(lines) + "\n"
+
+
+def _i2c_payload_section(base_config: I2CTestBaseConfig, payload_config: I2CPayloadConfig) -> str:
+    lines = [
+        f"write_data = '{payload_config.message_data}'",  # Wrap in quotes to ensure string format
+        f"write_length = {payload_config.data_length}",
+        f"register_size = {payload_config.register_size}",  # This should be 8 or 16
+    ]
+    # Register address from the payload, else the base config's (8-bit)
+    if payload_config.register_address:
+        lines.append(f"register_address = "
+                     f"{split_register_address(payload_config.register_address, payload_config.register_size)}")
+    elif base_config.register_address:
+        lines.append(f"register_address = {split_register_address(base_config.register_address, 8)}")
+    return "\n".join(lines) + "\n"
+
+
+def i2c_config_encoder() -> IniEncoder:
+    """Encoder for [I2CConfig] messages; set its base config once, then encode payloads."""
+    return IniEncoder(_i2c_config_header, _i2c_payload_section)
 
 class I2CService:
     def __init__(self, host='127.0.0.1', send_port=9561, receive_port=9562):
@@ -10,6 +94,7 @@ class I2CService:
         self.server_ip = host
         self.send_port = send_port
         self.receive_port = receive_port
+        self.reception = ReceptionServer(host, receive_port)
         self.vi_file = r"C:\Users\sandbox\Downloads\i2c all test cases.vi" # Update to your I2C VI file
         self.lv_shortcut = r"C:\ProgramData\Microsoft\Windows\Start Menu\Programs\NI LabVIEW 2025 Q1 (64-bit).lnk"
     
@@ -25,7 +110,7 @@ class I2CService:
             self.logger.info("LabVIEW I2C VI launched and initialized")
             return p
         except Exception as e:
-            self.logger.error(f"Failed to launch I2C VI: {e}")
+            self.logger.error("Failed to launch I2C VI: %s", e)
             return None
 
     def send_base_config(self, base_config: I2CTestBaseConfig):
@@ -36,41 +121,7 @@ class I2CService:
         ini_message = self._build_ini_message(payload_config)
         return self._send_ini_message(ini_message, self.send_port)
     def _split_register_address(self, register_address: str, register_size: int) -> str:
-        """
-        Convert register address(es) into LabVIEW-compatible format.
-        - Single address (8-bit):  '0xAB'
-        - Single address (16-bit): '0xAB', '0xCD'
-        - Multiple addresses:     '0xFA', '0xFB', '0xFC'
-        """
-        if not register_address or not register_address.strip():
-            return ""
-
-        # Split by whitespace and clean up
-        tokens = [token.strip().lower() for token in register_address.split() if token.strip()]
-        result_parts = []
-
-        for token in tokens:
-            if not token.startswith('0x'):
-                token = '0x' + token.lstrip('0')
-            
-            # Remove 0x prefix for processing
-            hex_part = token[2:]
-            
-            if register_size == 16:
-                # Pad to 4 hex digits and split into high/low
-                hex_part = hex_part.zfill(4)
-                high = hex_part[:2].upper()
-                low = hex_part[2:].upper()
-                result_parts.extend([f"'0xhigh'",f"'0xlow'"])
-            else:
-                # 8-bit: pad to 2 digits
-                hex_part = hex_part.zfill(2)
-                result_parts.append(f"'0x{hex_part.upper()}'")
-
-        # Join with comma and space, wrapped in quotes
-        final_result = ", ".join(result_parts)
-        self.logger.info(f"register_address input: '{register_address}' → LabVIEW format: {final_result}")
-        return final_result
+        return split_register_address(register_address, register_size)
     # def _split_register_address(self, register_address: str, register_size: int) -> str:
     #     """Split 16-bit register address into two 8-bit addresses if needed."""
     #     if not register_address:
@@ -138,10 +189,10 @@ class I2CService:
                 # NEW: Always include read_address and write_address if present (for LabVIEW to access from GUI)
             if config.read_address:
                 lines.append(f"read_address = '{config.read_address}'")
-                self.logger.info(f"Adding read_address: {config.read_address}")
+                self.logger.debug("Adding read_address: %s", config.read_address)
             if config.write_address:
                 lines.append(f"write_address = '{config.write_address}'")
-                self.logger.info(f"Adding write_address: {config.write_address}")
+                self.logger.debug("Adding write_address: %s", config.write_address)
         elif isinstance(config, I2CPayloadConfig):
             # Handle payload config
             lines.append(f"write_data = '{config.message_data}'")  # Wrap in quotes to ensure string format
@@ -154,46 +205,11 @@ class I2CService:
                 split_addr = self._split_register_address(formatted_address, config.register_size)
                 lines.append(f"register_address = {split_addr}")
                 
-                self.logger.info(f"Register address for LabVIEW: {split_addr}")
+                self.logger.debug("Register address for LabVIEW: %s", split_addr)
         elif isinstance(config, tuple) and len(config) == 2:
             # Handle combined base config and payload
             base_config, payload_config = config
-            test_name = base_config.test_name
-            
-            # Add base config with original device address and read/write addresses
-            lines.extend([
-                f"test_name = {base_config.test_name}",
-                f"device_address = '{base_config.device_address}'",  # Original 7-bit address
-                f"clock_speed = {base_config.clock_speed}",
-                f"addressing_mode = {base_config.addressing_mode}",
-                f"bus_mode = {base_config.bus_mode}"
-            ])
-
-            # Add read/write addresses based on test type
-            if base_config.read_address:
-                lines.append(f"read_address = '{base_config.read_address}'")
-                self.logger.info(f"Adding read_address: {base_config.read_address}")
-            if base_config.write_address:
-                lines.append(f"write_address = '{base_config.write_address}'")
-                self.logger.info(f"Adding write_address: {base_config.write_address}")
-
-            # Add payload config
-            lines.extend([
-                f"write_data = '{payload_config.message_data}'",  # Wrap in quotes to ensure string format
-                f"write_length = {payload_config.data_length}",
-                f"register_size = {payload_config.register_size}"  # This should be 8 or 16
-            ])
-            
-            # Add register address from payload config
-            if payload_config.register_address:
-                split_addr = self._split_register_address(payload_config.register_address, payload_config.register_size)
-                self.logger.info(f"Sending register address as {split_addr} with size {payload_config.register_size}")
-                lines.append(f"register_address = {split_addr}")
-            # Also include the base register address if different
-            elif base_config.register_address:
-                split_addr = self._split_register_address(base_config.register_address, 8)  # Default to 8-bit for base config
-                self.logger.info(f"Using base config register address: {split_addr}")
-                lines.append(f"register_address = {split_addr}")
+            return _i2c_config_header(base_config) + _i2c_payload_section(base_config, payload_config)
 
         return "\n".join(lines)
     
@@ -211,46 +227,33 @@ class I2CService:
 
     def _send_ini_message(self, message, port):
         try:
-            import time
-            # Add initial delay to ensure LabVIEW is ready
-            time.sleep(2)  # Wait 2 seconds before attempting connection
-            
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-                # Set a longer initial timeout for connection
-                sock.settimeout(30)  # 30 seconds timeout for initial connection
-                self.logger.info(f"Connecting to LabVIEW at {self.server_ip}:{port}")
+            self.logger.info("Connecting to LabVIEW at %s:%s", self.server_ip, port)
+            # Backoff retries while the VI starts; fails fast while it is known to be down
+            with endpoint(self.server_ip, port).connect(timeout=30) as sock:
+                sock.settimeout(30)
                 
-                # Try to connect with retry
-                max_retries = 3
-                for attempt in range(max_retries):
-                    try:
-                        sock.connect((self.server_ip, port))
-                        break
-                    except socket.error as e:
-                        if attempt < max_retries - 1:
-                            self.logger.warning(f"Connection attempt {attempt + 1} failed, retrying in 2 seconds...")
-                            time.sleep(2)
-                        else:
-                            raise e
+                if isinstance(message, str):
+                    message = message.encode('utf-8')
+                if not message.endswith(b'\n'):
+                    message += b'\n'
                 
-                if not message.endswith('\n'):
-                    message += '\n'
+                self.logger.info("Sending INI message (%d bytes)", len(message))
+                self.logger.debug("INI message:\n%s", message)
+                sock.sendall(message)
+                session_capture.record(session_capture.REQUEST, port, message)
                 
-                self.logger.info(f"Sending INI message ({len(message)} bytes):\n{message}")
-                sock.sendall(message.encode('utf-8'))
-                
-                # Wait a moment after sending before trying to receive
-                time.sleep(1)
-                
-                sock.settimeout(50)  # 20 second timeout for receiving response
-                response = sock.recv(4096).decode('utf-8', errors='ignore').strip()
-                print("response received:", response)
+                # Returns as soon as the reply's end marker arrives
+                response = read_framed_response(sock, response_timeout=50, idle_timeout=0.5)
+                session_capture.record(session_capture.RESPONSE, port, response)
+                if not response:
+                    raise socket.timeout()
+                response = response.decode('utf-8', errors='ignore').strip()
                 cleaned_response = ''.join(char for char in response if char.isprintable() or char.isspace())
                 if cleaned_response.startswith('\ufeff'):
                     cleaned_response = cleaned_response[1:]
                 
-                self.logger.info(f"Raw response bytes: {response.encode('utf-8')}")
-                self.logger.info(f"Cleaned response: {cleaned_response}")
+                self.logger.debug("Raw response bytes: %r", response)
+                self.logger.debug("Cleaned response: %s", cleaned_response)
                 
                 return cleaned_response
                 
@@ -258,28 +261,32 @@ class I2CService:
             self.logger.warning("Timeout waiting for LabVIEW response")
             return "No Response"
         except Exception as e:
-            self.logger.error(f"Error sending INI message: {e}")
+            self.logger.error("Error sending INI message: %s", e)
             return f"Error: {e}"
 
-    def receive_response(self):
+    def start_reception(self) -> bool:
+        """Start listening on the receive port; the backend calls this once at startup."""
         try:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                s.bind((self.server_ip, self.receive_port))
-                s.listen(1)
-                s.setblocking(False)
-                self.logger.info(f"Listening for LabVIEW response on {self.server_ip}:{self.receive_port}")
-                ready = select.select([s], [], [], 30)
-                if ready[0]:
-                    conn, addr = s.accept()
-                    with conn:
-                        self.logger.info(f"Connected by {addr}")
-                        data = conn.recv(1024)
-                        response = data.decode('utf-8').strip()
-                        self.logger.info(f"Received response data: {response}")
-                        return response
-                else:
-                    self.logger.warning("Timeout waiting for LabVIEW response")
-                    return None
-        except Exception as e:
-            self.logger.error(f"Error receiving LabVIEW response: {e}")
-            return None
\ No newline at end of file
+            self.reception.start()
+            return True
+        except OSError as e:
+            self.logger.error("Could not listen on receive port %s: %s", self.receive_port, e)
+            return False
+
+    def receive_response(self, timeout=30):
+        """Next message the VI pushed to the receive port, or None after timeout seconds.
+
+        The reception server keeps listening between calls, so pushes that
+        arrive in the meantime are queued rather than lost.
+        """
+        if not self.reception.running and not self.start_reception():
+            return None
+        response = self.reception.get(timeout)
+        if response is None:
+            self.logger.warning("Timeout waiting for LabVIEW response")
+        else:
+            self.logger.debug("Received response data: %s", response)
+        return response
+
+    def close(self):
+        self.reception.stop()
@@ -0,0 +1,46 @@
+# app/services/ini_encoder.py
+"""INI message encoding shared by the UART and I2C transports.
+
+A message is a section header built from the base configuration followed by
+a payload section. The header only changes when the user adds a new base
+config, so it is built and UTF-8 encoded once and every send only encodes
+its payload lines.
+"""
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class IniEncoder:
+    """Caches the encoded header of one base config and appends payload sections to it.
+
+    ``header_builder(base_config) -> str`` and
+    ``payload_builder(base_config, payload) -> str`` each return
+    newline-terminated INI lines; the payload builder gets the base config
+    for fields that fall back to it.
+    """
+
+    def __init__(self, header_builder, payload_builder):
+        self.header_builder = header_builder
+        self.payload_builder = payload_builder
+        self.base_config = None
+        self.header = b""
+
+    def set_base_config(self, base_config):
+        """Rebuild the cached header; call whenever the base config is replaced."""
+        self.base_config = base_config
+        if base_config is None:
+            self.header = b""
+            return
+        self.header = self.header_builder(base_config).encode("utf-8")
+        logger.debug("Cached %d-byte INI header for %s", len(self.header), type(base_config).__name__)
+
+    def encode(self, payload) -> bytes:
+        """Complete message for payload: cached header plus its payload lines."""
+        return self.encode_section(self.payload_builder(self.base_config, payload))
+
+    def encode_section(self, section: str) -> bytes:
+        """Cached header followed by arbitrary INI lines (e.g. a batch of payloads)."""
+        if self.base_config is None:
+            raise ValueError("No base configuration available")
+        return self.header + section.encode("utf-8")
@@ -0,0 +1,126 @@
+# app/services/labview_client.py
+import socket
+import logging
+from app.services.response_framing import ResponseFramer
+from app.services.cancellation import Cancelled
+from app.services.resilience import endpoint
+from app.services import session_capture
+
+
+def clean_line(line: str) -> str:
+    """Strip the non-printable bytes LabVIEW pads its replies with."""
+    return ''.join(c for c in line if c.isprintable() or c in ',.-\t ')
+
+
+def clean_response(data: bytes) -> str:
+    """Decode a raw reply into the same newline-joined form LabVIEWWorker emits."""
+    text = data.decode('utf-8', errors='ignore')
+    lines = []
+    for line in text.split('\n'):
+        line = line.rstrip('\r')
+        if line.strip():
+            lines.append(clean_line(line))
+    full = '\n'.join(lines)
+    if full.startswith('\ufeff'):
+        full = full[1:]
+    return full
+
+
+class LabVIEWClient:
+    """Synchronous request/response connection to a LabVIEW VI.
+
+    The socket is kept open between requests so a batch of messages runs
+    back-to-back over one connection. A reply ends at its #LEN/#END marker
+    (see response_framing), or failing that when the VI closes the socket
+    or goes quiet; after a close the next request reconnects transparently.
+
+    With a cancel_token, cancelling the token from another thread aborts a
+    request in progress: its socket is shut down and request() raises
+    Cancelled instead of waiting out the response timeout.
+    """
+
+    def __init__(self, host='127.0.0.1', port=12345, connect_timeout=10,
+                 response_timeout=40, idle_timeout=2.0, cancel_token=None):
+        self.logger = logging.getLogger(__name__)
+        self.host = host
+        self.port = port
+        self.connect_timeout = connect_timeout
+        self.response_timeout = response_timeout  # wait for the first byte
+        self.idle_timeout = idle_timeout          # gap that ends a reply
+        self.cancel_token = cancel_token
+        self.endpoint = endpoint(host, port)  # shared retry/backoff and circuit breaker
+        self.sock = None
+
+    @property
+    def connected(self):
+        return self.sock is not None
+
+    def connect(self):
+        self.close()
+        sock = self.endpoint.connect(self.connect_timeout, self.cancel_token)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.sock = sock
+        if self.cancel_token is not None:
+            self.cancel_token.add(sock)
+        self.logger.debug("Connected to LabVIEW at %s:%s", self.host, self.port)
+
+    def close(self):
+        if self.sock is not None:
+            if self.cancel_token is not None:
+                self.cancel_token.discard(self.sock)
+            try:
+                self.sock.close()
+            except OSError:
+                pass
+            self.sock = None
+
+    def request(self, message) -> str:
+        """Send one INI message and return the cleaned reply text."""
+        if isinstance(message, str):
+            message = message.encode('utf-8')
+        if not message.endswith(b'\n'):
+            message += b'\n'
+
+        self._check_cancelled()
+        if self.sock is None:
+            self.connect()
+        try:
+            self.sock.sendall(message)
+        except OSError:
+            self._check_cancelled()
+            # The VI dropped the previous connection; retry once on a fresh one
+            self.connect()
+            self.sock.sendall(message)
+        session_capture.record(session_capture.REQUEST, self.port, message)
+        body = self._read_response()
+        self._check_cancelled()
+        session_capture.record(session_capture.RESPONSE, self.port, body)
+        return clean_response(body)
+
+    def _check_cancelled(self):
+        if self.cancel_token is not None and self.cancel_token.cancelled:
+            self.close()
+            raise Cancelled()
+
+    def _read_response(self) -> bytes:
+        framer = ResponseFramer()
+        self.sock.settimeout(self.response_timeout)
+        while not framer.complete:
+            try:
+                chunk = self.sock.recv(4096)
+            except socket.timeout:
+                break
+            if not chunk:
+                # VI closes the socket after each reply
+                self.close()
+                break
+            framer.feed(chunk)
+            self.sock.settimeout(self.idle_timeout)
+        framer.flush()
+        return framer.body
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
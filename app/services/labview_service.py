@@ -1,17 +1,135 @@
 # app/services/labview_service.py
-import socket
 import subprocess
-import select
 import logging
+import threading
 from PySide6.QtCore import QObject, Signal  # <-- CRITICAL IMPORT
 from app.models.uart_model import UARTTestBaseConfig, UARTPayloadConfig
 from app.services.labview_worker import LabVIEWWorker
+from app.services.ini_encoder import IniEncoder
+from app.services.reception_server import ReceptionServer
+
+WORKER_STOP_TIMEOUT_MS = 500  # bounded join of a cancelled worker
+PROCESS_STOP_TIMEOUT = 5      # seconds for the VI process to exit before it is killed
+
+
+def _serial_port_header(base_config):
+    """The [SerialPort] section up to, but not including, the payload lines."""
+    # Map stop bits to LabVIEW format
+    stop_bits_map = {0.5: 5, 1.0: 10, 1.5: 15, 2.0: 20}
+    stop_bits_lv = stop_bits_map.get(float(base_config.stop_bits), 10)
+
+    message = "[SerialPort]\n"
+    message += f"test_name = {base_config.test_name}\n"
+    message += f"device_id = {base_config.device_id}\n"
+    message += f"baud_rate = {base_config.baud_rate}\n"
+    message += f"databits = {base_config.data_bits}\n"  # Note: databits not data_bits
+    message += f"parity = {base_config.parity}\n"
+    message += f"stop_bits = {stop_bits_lv}\n"  # Use LabVIEW format
+    message += f"data_shift = {base_config.data_shift}\n"
+    message += f"handshake = {base_config.handshake}\n"
+    return message
+
+
+def _serial_port_payload(base_config, payload_config):
+    return f"tx_data = {payload_config.message_data}\n"
+
+
+def _batch_payload_section(payloads):
+    lines = [f"payload_count = {len(payloads)}\n"]
+    lines.extend(f"tx_data_{i} = {p.message_data}\n" for i, p in enumerate(payloads))
+    return "".join(lines)
+
+
+def _stream_window_section(first_chunk, total_chunks, chunks):
+    lines = [f"stream_first_chunk = {first_chunk}\n",
+             f"stream_chunk_count = {total_chunks}\n",
+             "tx_encoding = hex\n",
+             f"payload_count = {len(chunks)}\n"]
+    lines.extend(f"tx_data_{i} = {chunk.hex()}\n" for i, chunk in enumerate(chunks))
+    return "".join(lines)
+
+
+def serial_port_encoder() -> IniEncoder:
+    """Encoder for [SerialPort] messages; set its base config once, then encode payloads."""
+    return IniEncoder(_serial_port_header, _serial_port_payload)
+
+
+def encode_batch(encoder: IniEncoder, payloads) -> bytes:
+    """Batch message (see build_batch_message) on top of the encoder's cached header."""
+    return encoder.encode_section(_batch_payload_section(payloads))
+
+
+def encode_stream_window(encoder: IniEncoder, first_chunk: int, total_chunks: int, chunks) -> bytes:
+    """Batch message carrying file chunks first_chunk.. of total_chunks as hex.
+
+    It is a batch (see build_batch_message) with ``tx_encoding = hex`` so the
+    VI transmits the decoded bytes; loopback data comes back hex encoded on
+    the ``<index>,<rx data>`` lines, index relative to first_chunk.
+    """
+    return encoder.encode_section(_stream_window_section(first_chunk, total_chunks, chunks))
+
+
+def build_serial_port_message(base_config, payload_config):
+    """Build the [SerialPort] INI message LabVIEW expects for one payload."""
+    return _serial_port_header(base_config) + _serial_port_payload(base_config, payload_config)
+
+
+def build_batch_message(base_config, payloads):
+    """One [SerialPort] message carrying the base config once and every payload.
+
+    The VI answers with one ``<index>,<rx data>`` line per payload, in any
+    order, followed by the usual end-of-response marker.
+    """
+    return _serial_port_header(base_config) + _batch_payload_section(payloads)
+
+
+def parse_batch_reply_line(line: str):
+    """Split a batch reply line into (payload index, rx data); None if it is not one."""
+    index, sep, rx_data = line.partition(",")
+    if not sep or not index.strip().isdigit():
+        return None
+    return int(index), rx_data
+
+
+def parse_batch_payloads(message: str):
+    """Payloads of a batch message from build_batch_message, or None for a single-payload one."""
+    fields = dict(line.split(" = ", 1) for line in message.splitlines() if " = " in line)
+    if "payload_count" not in fields:
+        return None
+    payloads = []
+    for i in range(int(fields["payload_count"])):
+        tx_data = fields.get(f"tx_data_{i}", "")
+        payloads.append(UARTPayloadConfig(message_data=tx_data, data_length=len(tx_data)))
+    return payloads
+
+
+def parse_serial_port_message(message: str):
+    """Inverse of build_serial_port_message, used when replaying captured sessions."""
+    fields = {}
+    for line in message.splitlines():
+        key, sep, value = line.partition(" = ")
+        if sep:
+            fields[key.strip()] = value.strip()
+    stop_bits_map = {"5": 0.5, "10": 1.0, "15": 1.5, "20": 2.0}
+    base_config = UARTTestBaseConfig(
+        test_name=fields.get("test_name", ""),
+        device_id=fields.get("device_id", ""),
+        baud_rate=int(fields.get("baud_rate") or 0),
+        stop_bits=stop_bits_map.get(fields.get("stop_bits"), 1.0),
+        parity=fields.get("parity", "0"),
+        data_bits=int(fields.get("databits") or 8),
+        data_shift=fields.get("data_shift", ""),
+        handshake=fields.get("handshake", "")
+    )
+    tx_data = fields.get("tx_data", "")
+    return base_config, UARTPayloadConfig(message_data=tx_data, data_length=len(tx_data))
 
 
 class LabVIEWService(QObject):  # <-- MUST INHERIT FROM QObject
     line_received = Signal(str)  # <-- DEFINE THE SIGNAL HERE
     progress = Signal(int)
     finished = Signal(str)
+    error = Signal(str)
 
     def __init__(self, host='127.0.0.1', send_port=12345, receive_port=12346):
         super().__init__()  # <-- CALL SUPER!
@@ -19,9 +137,12 @@ class LabVIEWService(QObject):  # <-- MUST INHERIT FROM QObject
         self.server_ip = host
         self.send_port = send_port
         self.receive_port = receive_port
+        self.reception = ReceptionServer(host, receive_port)
         self.vi_file = r"C:\Users\sandbox\Downloads\UART ALL TEST CASES (1).vi"
         self.lv_shortcut = r"C:\ProgramData\Microsoft\Windows\Start Menu\Programs\NI LabVIEW 2025 Q1 (64-bit).lnk"
         self.current_worker = None
+        self._stopping_workers = set()  # cancelled workers kept alive until their thread exits
+        self.lv_process = None
 
     def launch_vi(self):
         cmd = f'"{self.lv_shortcut}" "{self.vi_file}"'
@@ -31,29 +152,53 @@ class LabVIEWService(QObject):  # <-- MUST INHERIT FROM QObject
             self.logger.info("Launched LabVIEW VI")
             return p
         except Exception as e:
-            self.logger.error(f"Failed to launch VI: {e}")
+            self.logger.error("Failed to launch VI: %s", e)
             return None
         
     def stop(self):
         self.logger.info("STOP requested - cleaning up LabVIEW resources")
 
         #worker thread
-        if self.current_worker and self.current_worker.isRunning():
-            self.logger.info("Terminating LabVIEWWorker thread...")
-            self.current_worker.terminate()
-            self.current_worker.wait(3000)
-            self.current_worker(None)
+        self.cancel_request()
 
         #LabVIEW VI process:-
         if self.lv_process:
+            process, self.lv_process = self.lv_process, None
             try:
                 self.logger.info("Terminating LabVIEW VI process...")
-                self.lv_process.terminate()
-                self.lv_process.wait(5000)
+                process.terminate()
+            except Exception as e:
+                self.logger.error("Failed to kill LabVIEW process: %s", e)
+                return
+            # Waiting for the exit could take seconds; do it off the caller's (GUI) thread
+            threading.Thread(target=self._reap_process, args=(process,), name="labview-reaper", daemon=True).start()
+
+    def _reap_process(self, process):
+        try:
+            process.wait(timeout=PROCESS_STOP_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            self.logger.warning("LabVIEW VI process did not exit; killing it")
+            try:
+                process.kill()
+                process.wait(timeout=PROCESS_STOP_TIMEOUT)
             except Exception as e:
-                self.logger.error(f"Failed to kill LabVIEW process: {e}")
-            finally:
-                self.lv_process=None
+                self.logger.error("Failed to kill LabVIEW process: %s", e)
+
+    def cancel_request(self):
+        """Cancel the in-flight request and wait (bounded) for its thread to unwind."""
+        worker = self.current_worker
+        self.current_worker = None
+        if worker is None or not worker.isRunning():
+            return
+        self.logger.info("Cancelling LabVIEWWorker request...")
+        self._stopping_workers.add(worker)
+        worker.cancelled.connect(lambda: self._stopping_workers.discard(worker))
+        worker.cancel()
+        if worker.wait(WORKER_STOP_TIMEOUT_MS):
+            self._stopping_workers.discard(worker)
+        else:
+            # Still unwinding; it emits cancelled once it returns
+            self.logger.warning("LabVIEWWorker did not stop within %d ms", WORKER_STOP_TIMEOUT_MS)
 
     def send_base_config(self, base_config):
         ini_message = self._build_ini_message(base_config)
@@ -86,9 +231,7 @@ class LabVIEWService(QObject):  # <-- MUST INHERIT FROM QObject
     def _send_ini_message(self, message, port):
         """Start a background worker – keep it alive until done."""
         # Cancel any previous worker
-        if self.current_worker and self.current_worker.isRunning():
-            self.current_worker.terminate()
-            self.current_worker.wait(3000)
+        self.cancel_request()
 
         self.current_worker = LabVIEWWorker(message, self.server_ip, port)
 
@@ -101,42 +244,53 @@ class LabVIEWService(QObject):  # <-- MUST INHERIT FROM QObject
         # Keep worker alive until finished
         self.current_worker.finished.connect(self.current_worker.deleteLater)
         self.current_worker.error.connect(self.current_worker.deleteLater)
+        self.current_worker.cancelled.connect(self.current_worker.deleteLater)
         # ALSO: Connect to clear reference
-        self.current_worker.finished.connect(lambda: setattr(self, 'current_worker', None))
-        self.current_worker.error.connect(lambda: setattr(self, 'current_worker', None))
+        worker = self.current_worker
+        self.current_worker.finished.connect(lambda: self._clear_worker(worker))
+        self.current_worker.error.connect(lambda: self._clear_worker(worker))
 
         self.current_worker.start()
         return "Sent (async)"
     
+    def _clear_worker(self, worker):
+        # A cancelled worker must not clear the reference to its replacement
+        if self.current_worker is worker:
+            self.current_worker = None
+
     def _on_worker_finished(self, full_response):
-        self.logger.info(f"Worker finished. Full response: {len(full_response)} chars")
+        self.logger.debug("Worker finished. Full response: %d chars", len(full_response))
         self.finished.emit(full_response)
         # Optional: store response if needed
 
     def _on_worker_error(self, msg):
-        self.logger.error(f"LabVIEW Worker error: {msg}")
-        self.current_worker = None
+        self.logger.error("LabVIEW Worker error: %s", msg)
+        self.error.emit(msg)
 
 
-    def receive_response(self):
+    def start_reception(self) -> bool:
+        """Start listening on the receive port; the backend calls this once at startup."""
         try:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                s.bind((self.server_ip, self.receive_port))
-                s.listen(1)
-                s.setblocking(False)
-                self.logger.info(f"Listening for LabVIEW response on {self.server_ip}:{self.receive_port}")
-                ready = select.select([s], [], [], 30)  # 30 sec timeout
-                if ready[0]:
-                    conn, addr = s.accept()
-                    with conn:
-                        self.logger.info(f"Connected by {addr}")
-                        data = conn.recv(1024)
-                        response = data.decode('utf-8').strip()
-                        self.logger.info(f"Received response data: {response}")
-                        return response
-                else:
-                    self.logger.warning("Timeout waiting for LabVIEW response")
-                    return None
-        except Exception as e:
-            self.logger.error(f"Error receiving LabVIEW response: {e}")
-            return None
\ No newline at end of file
+            self.reception.start()
+            return True
+        except OSError as e:
+            self.logger.error("Could not listen on receive port %s: %s", self.receive_port, e)
+            return False
+
+    def receive_response(self, timeout=30):
+        """Next message the VI pushed to the receive port, or None after timeout seconds.
+
+        The reception server keeps listening between calls, so pushes that
+        arrive in the meantime are queued rather than lost.
+        """
+        if not self.reception.running and not self.start_reception():
+            return None
+        response = self.reception.get(timeout)
+        if response is None:
+            self.logger.warning("Timeout waiting for LabVIEW response")
+        else:
+            self.logger.debug("Received response data: %s", response)
+        return response
+
+    def close(self):
+        self.reception.stop()
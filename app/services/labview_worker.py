@@ -2,6 +2,13 @@
 from PySide6.QtCore import QThread, Signal
 import socket
 import logging
+from app.services.labview_client import clean_line
+from app.services.response_framing import ResponseFramer
+from app.services import session_capture
+from app.services.cancellation import CancelToken
+from app.services.resilience import endpoint
+
+CONNECT_TIMEOUT = 10  # seconds per connect attempt
 
 
 class LabVIEWWorker(QThread):
@@ -9,6 +16,7 @@ class LabVIEWWorker(QThread):
     finished = Signal(str)           # Emitted when done (full response)
     error = Signal(str)   
     progress      = Signal(int)         
+    cancelled = Signal()             # Emitted instead of finished/error after cancel()
 
     def __init__(self, message, host='127.0.0.1', port=12345):
         super().__init__()
@@ -16,75 +24,64 @@ class LabVIEWWorker(QThread):
         self.host = host
         self.port = port
         self.logger = logging.getLogger(__name__)
-        self._buffer = ""
         self._line_count = 0
+        self.cancel_token = CancelToken()
+
+    def cancel(self):
+        """Abort the request from any thread; the worker unwinds and emits cancelled."""
+        self.cancel_token.cancel()
+
+    def _emit_lines(self, raw_lines, all_lines):
+        for raw in raw_lines:
+            session_capture.record(session_capture.LINE, self.port, raw)
+            line = raw.decode('utf-8', errors='ignore')
+            if line.strip():
+                cleaned = clean_line(line)
+                all_lines.append(cleaned)
+                self._line_count += 1
+                self.logger.debug("[Worker] Emitting line: %s", cleaned)
+                self.line_received.emit(cleaned)
+                self.progress.emit(self._line_count)
 
     def run(self):
         try:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            self.logger.info("[Worker] Connecting to LabVIEW at %s:%s", self.host, self.port)
+            sock = endpoint(self.host, self.port).connect(CONNECT_TIMEOUT, self.cancel_token)
+            with sock, self.cancel_token.watch(sock):
                 sock.settimeout(120)
-                self.logger.info(f"[Worker] Connecting to LabVIEW at {self.host}:{self.port}")
-                sock.connect((self.host, self.port))
+                self.cancel_token.raise_if_cancelled()
 
-                if not self.message.endswith('\n'):
-                    self.message += '\n'
+                if isinstance(self.message, str):
+                    self.message = self.message.encode('utf-8')
+                if not self.message.endswith(b'\n'):
+                    self.message += b'\n'
 
-                self.logger.info(f"[Worker] Sending message ({len(self.message)} bytes)")
-                sock.sendall(self.message.encode('utf-8'))
+                self.logger.info("[Worker] Sending message (%d bytes)", len(self.message))
+                sock.sendall(self.message)
+                session_capture.record(session_capture.REQUEST, self.port, self.message)
 
                 sock.settimeout(40)
-                response_data = b""
+                framer = ResponseFramer()
                 all_lines = []
 
-                while True:
+                while not framer.complete:
                     try:
                         chunk = sock.recv(4096)
-                        if not chunk:
-                            break
-
-                        response_data += chunk
-                        text = chunk.decode('utf-8', errors='ignore')
-                        self._buffer += text
-
-                        lines = self._buffer.split('\n')
-                        self._buffer = lines.pop() if lines else ""
-
-                        for line in lines:
-                            line = line.rstrip('\r')
-                            if line.strip():
-                                cleaned = ''.join(c for c in line if c.isprintable() or c in ',.-\t ')
-                                all_lines.append(cleaned)
-                                self._line_count += 1
-                                self.logger.info(f"[Worker] Emitting line: {cleaned}")
-                                self.line_received.emit(cleaned)
-                                self.progress.emit(self._line_count)
-
-                        if len(response_data) > 1024 * 1024:
-                            break
-
                     except socket.timeout:
                         break
+                    if not chunk:
+                        break
+                    self._emit_lines(framer.feed(chunk), all_lines)
+                    if len(framer.body) > 1024 * 1024:
+                        break
+                    if framer.complete:
+                        self.logger.info("[Worker] End of response after %d lines", self._line_count)
 
-                # NEW: Emit full buffer as single line if no lines split
-                if self._line_count == 0 and self._buffer.strip():
-                    cleaned = ''.join(c for c in self._buffer if c.isprintable() or c in ',.-\t ')
-                    if cleaned.strip():
-                        all_lines.append(cleaned)
-                        self._line_count += 1
-                        self.logger.info(f"[Worker] Emitting full buffer as single line: {cleaned}")
-                        self.line_received.emit(cleaned)
-                        self.progress.emit(self._line_count)
-                        self._buffer = ""
-
-                # Final buffer flush
-                if self._buffer.strip():
-                    final = ''.join(c for c in self._buffer if c.isprintable() or c in ',.-\t ')
-                    if final.strip():
-                        all_lines.append(final)
-                        self._line_count += 1
-                        self.logger.info(f"[Worker] Emitting final line: {final}")
-                        self.line_received.emit(final)
-                        self.progress.emit(self._line_count)
+                # A cancel shuts the socket down, which ends the loop above like a close
+                self.cancel_token.raise_if_cancelled()
+                # Unterminated last line of a reply that ended by close/timeout
+                self._emit_lines(framer.flush(), all_lines)
+                session_capture.record(session_capture.RESPONSE, self.port, framer.body)
 
                 full = '\n'.join(all_lines)
                 if full.startswith('\ufeff'):
@@ -93,4 +90,8 @@ class LabVIEWWorker(QThread):
                 self.finished.emit(full)
 
         except Exception as e:
-            self.error.emit(f"Error: {e}")
\ No newline at end of file
+            if self.cancel_token.cancelled:
+                self.logger.info("[Worker] Request cancelled")
+                self.cancelled.emit()
+                return
+            self.error.emit(f"Error: {e}")
@@ -0,0 +1,35 @@
+# app/services/log_store.py
+from logging.handlers import RotatingFileHandler
+import logging
+import os
+
+LOG_FILE_BYTES = 5 * 1024 * 1024
+LOG_FILE_BACKUPS = 5
+
+
+class LogStore:
+    """Rotating activity-log files, one writer per path however many panels use it."""
+
+    def __init__(self, max_bytes: int = LOG_FILE_BYTES, backups: int = LOG_FILE_BACKUPS):
+        self.max_bytes = max_bytes
+        self.backups = backups
+
+    def writer(self, path: str) -> logging.Logger:
+        writer = logging.getLogger(f"activity.{os.path.basename(path)}")
+        if not writer.handlers:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            writer.propagate = False
+            writer.setLevel(logging.DEBUG)
+            handler = RotatingFileHandler(path, maxBytes=self.max_bytes, backupCount=self.backups, encoding="utf-8")
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            writer.addHandler(handler)
+        return writer
+
+    def close(self):
+        for name, writer in list(logging.Logger.manager.loggerDict.items()):
+            if name.startswith("activity.") and isinstance(writer, logging.Logger):
+                for handler in writer.handlers[:]:
+                    handler.close()
+                    writer.removeHandler(handler)
@@ -0,0 +1,120 @@
+# app/services/parallel_plan_runner.py
+from datetime import datetime
+import queue
+import logging
+from typing import Callable, Dict, List, Optional
+from PySide6.QtCore import QObject, Signal
+from app.models.fixture_model import Fixture, FixtureSummary
+from app.models.test_plan import TestPlan, PlanResult
+from app.services.test_plan_executor import TestPlanExecutor
+
+REPLICATE = "replicate"    # every fixture runs the whole plan (one DUT each)
+DISTRIBUTE = "distribute"  # fixtures pull items from one shared queue
+
+
+class ParallelPlanRunner(QObject):
+    """Fans a TestPlan out across several fixtures and aggregates per fixture.
+
+    Each fixture gets its own TestPlanExecutor thread and LabVIEW connection,
+    so a slow or dead fixture never holds up the others.
+    """
+    result_ready = Signal(object)           # PlanResult from any fixture
+    fixture_finished = Signal(str, object)  # (fixture name, FixtureSummary)
+    finished = Signal(object)               # {fixture name: FixtureSummary}
+    error = Signal(str)
+
+    def __init__(self, plan: TestPlan, fixtures: List[Fixture], mode: str = REPLICATE,
+                 evaluate: Optional[Callable[[PlanResult], bool]] = None):
+        super().__init__()
+        if mode not in (REPLICATE, DISTRIBUTE):
+            raise ValueError(f"Unknown scheduling mode: {mode}")
+        self.plan = plan
+        self.fixtures = list(fixtures)
+        self.mode = mode
+        self.evaluate = evaluate  # returns True when a result passes
+        self.logger = logging.getLogger(__name__)
+        self.summaries: Dict[str, FixtureSummary] = {}
+        self._executors: Dict[str, TestPlanExecutor] = {}
+        self._done = set()
+        self._work_queue: Optional[queue.Queue] = None
+        self._stop_requested = False
+        self.unsent = 0  # distributed items no fixture could send
+
+    def start(self):
+        if not self.fixtures:
+            self.finished.emit({})
+            return
+
+        work_queue = None
+        if self.mode == DISTRIBUTE:
+            work_queue = queue.Queue()
+            for item in self.plan.iter_items():
+                work_queue.put(item)
+        self._work_queue = work_queue
+
+        for fixture in self.fixtures:
+            self.summaries[fixture.name] = FixtureSummary(fixture.name)
+            executor = TestPlanExecutor(self.plan, fixture.host, fixture.port,
+                                        fixture_name=fixture.name,
+                                        device_id=fixture.device_id or None,
+                                        work_queue=work_queue)
+            executor.result_ready.connect(self._on_result)
+            executor.error.connect(self.error)
+            executor.finished.connect(lambda _done, name=fixture.name: self._on_executor_finished(name))
+            self._executors[fixture.name] = executor
+
+        self.logger.info("Running plan '%s' on %d fixtures (%s)",
+                         self.plan.name, len(self.fixtures), self.mode)
+        for executor in self._executors.values():
+            executor.start()
+
+    def stop(self):
+        self._stop_requested = True
+        for executor in self._executors.values():
+            executor.stop()
+
+    def is_running(self) -> bool:
+        return len(self._done) < len(self._executors)
+
+    def _on_result(self, result: PlanResult):
+        summary = self.summaries[result.fixture]
+        summary.sent += 1
+        if result.error:
+            summary.errors += 1
+        else:
+            summary.total_latency += (result.rx_timestamp - result.tx_timestamp).total_seconds()
+            if self.evaluate is None or self.evaluate(result):
+                summary.passed += 1
+            else:
+                summary.failed += 1
+        self.result_ready.emit(result)
+
+    def _on_executor_finished(self, name: str):
+        self._done.add(name)
+        self.fixture_finished.emit(name, self.summaries[name])
+        if len(self._done) == len(self._executors):
+            self._report_unsent()
+            self.finished.emit(dict(self.summaries))
+
+    def _report_unsent(self):
+        """Account for distributed items still queued once every executor has exited.
+
+        An unreachable fixture hands its item back to the queue, but the
+        fixtures that already found the queue empty are gone by then.
+        """
+        if self._work_queue is None:
+            return
+        while True:
+            try:
+                step_index, payload_index, iteration, base, payload = self._work_queue.get_nowait()
+            except queue.Empty:
+                break
+            self.unsent += 1
+            if not self._stop_requested:
+                self.result_ready.emit(PlanResult(step_index, payload_index, iteration, base, payload,
+                                                  tx_timestamp=datetime.now(),
+                                                  error="Error: not sent, no fixture reachable"))
+        if self.unsent:
+            reason = "stopped" if self._stop_requested else "no fixture reachable"
+            self.logger.warning("%d plan items not sent (%s)", self.unsent, reason)
+            self.error.emit(f"Error: {self.unsent} plan items not sent ({reason})")
@@ -0,0 +1,198 @@
+# app/services/reception_server.py
+"""Long-lived listener for data the VIs push to the application.
+
+RECEPTION TEST replies arrive on a separate port, with the VI as the
+client. The port is bound once and one selector thread accepts and reads
+every connection, so nothing the VI sends between two receive_response()
+calls is lost. Each connection's bytes go through a ResponseFramer, which
+reassembles a message split over several packets and separates several
+messages sent on one connection; complete messages are queued for consumers.
+"""
+from typing import Dict, Optional
+import logging
+import os
+import queue
+import selectors
+import socket
+import threading
+import time
+from app.services.labview_client import clean_response
+from app.services.response_framing import ResponseFramer
+from app.services import session_capture
+
+logger = logging.getLogger(__name__)
+
+IDLE_TIMEOUT = 0.5     # seconds of silence that end an unmarked message
+MAX_QUEUED = 10000     # oldest messages are dropped beyond this many unread
+SELECT_INTERVAL = 0.1  # seconds; bounds how late an idle message is delivered
+
+
+class _Connection:
+    def __init__(self, sock: socket.socket, peer):
+        self.sock = sock
+        self.peer = peer
+        self.framer = ResponseFramer()
+        self.last_data = 0.0  # time of the last byte received, 0 once delivered
+
+
+class ReceptionServer:
+    def __init__(self, host='127.0.0.1', port=12346, idle_timeout=IDLE_TIMEOUT, max_queued=MAX_QUEUED):
+        self.host = host
+        self.port = port
+        self.idle_timeout = idle_timeout
+        self.messages: "queue.Queue[str]" = queue.Queue(maxsize=max_queued)
+        self.received = 0
+        self.dropped = 0
+        self._listener: Optional[socket.socket] = None
+        self._selector: Optional[selectors.BaseSelector] = None
+        self._connections: Dict[socket.socket, _Connection] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._wake_r = self._wake_w = None
+        self._stop_requested = False
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """Bind and start the selector thread; does nothing if already running. Raises OSError if the port is taken."""
+        with self._lock:
+            if self.running:
+                return
+            listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            try:
+                if os.name != "nt":
+                    # Rebind over connections left in TIME_WAIT; on Windows this flag would allow port sharing
+                    listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                listener.bind((self.host, self.port))
+                listener.listen(8)
+            except OSError:
+                listener.close()
+                raise
+            listener.setblocking(False)
+            self._listener = listener
+            self._wake_r, self._wake_w = socket.socketpair()
+            self._wake_r.setblocking(False)
+            self._selector = selectors.DefaultSelector()
+            self._selector.register(listener, selectors.EVENT_READ, self._accept)
+            self._selector.register(self._wake_r, selectors.EVENT_READ, None)
+            self._stop_requested = False
+            self._thread = threading.Thread(target=self._run, name=f"reception-{self.port}", daemon=True)
+            self._thread.start()
+            logger.info("Reception server listening on %s:%s", self.host, self.port)
+
+    def stop(self, timeout: float = 1.0):
+        with self._lock:
+            if not self.running:
+                return
+            self._stop_requested = True
+            try:
+                self._wake_w.send(b"\0")
+            except OSError:
+                pass
+            self._thread.join(timeout)
+            self._thread = None
+
+    def get(self, timeout: Optional[float] = None) -> Optional[str]:
+        """Next complete message, waiting up to timeout seconds; None on timeout."""
+        try:
+            return self.messages.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def drain(self):
+        """Every message already queued, oldest first, without waiting."""
+        drained = []
+        while True:
+            try:
+                drained.append(self.messages.get_nowait())
+            except queue.Empty:
+                return drained
+
+    def _run(self):
+        try:
+            while not self._stop_requested:
+                for key, _ in self._selector.select(SELECT_INTERVAL):
+                    if key.data is None:
+                        self._wake_r.recv(64)
+                    elif key.fileobj is self._listener:
+                        self._accept()
+                    else:
+                        self._read(key.data)
+                self._flush_idle()
+        finally:
+            for connection in list(self._connections.values()):
+                self._close(connection, deliver=True)
+            self._selector.close()
+            for sock in (self._listener, self._wake_r, self._wake_w):
+                sock.close()
+            logger.info("Reception server on port %s stopped", self.port)
+
+    def _accept(self):
+        try:
+            sock, peer = self._listener.accept()
+        except (BlockingIOError, InterruptedError):
+            return
+        sock.setblocking(False)
+        connection = _Connection(sock, peer)
+        self._connections[sock] = connection
+        self._selector.register(sock, selectors.EVENT_READ, connection)
+        logger.debug("Reception connection from %s", peer)
+
+    def _read(self, connection: _Connection):
+        try:
+            data = connection.sock.recv(65536)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError as e:
+            logger.warning("Reception connection %s failed: %s", connection.peer, e)
+            data = b""
+        if not data:
+            self._close(connection, deliver=True)
+            return
+        connection.framer.feed(data)
+        while connection.framer.complete:
+            remainder = connection.framer.remainder
+            self._deliver(connection.framer.body)
+            connection.framer = ResponseFramer()
+            connection.framer.feed(remainder)
+        connection.last_data = time.monotonic()
+
+    def _flush_idle(self):
+        """Deliver unmarked messages that have gone quiet, as a blocking read would have.
+
+        Flushing a connection with nothing pending delivers nothing.
+        """
+        now = time.monotonic()
+        for connection in list(self._connections.values()):
+            if connection.last_data and now - connection.last_data >= self.idle_timeout:
+                connection.framer.flush()
+                self._deliver(connection.framer.body)
+                connection.framer = ResponseFramer()
+                connection.last_data = 0.0
+
+    def _close(self, connection: _Connection, deliver: bool):
+        if deliver:
+            connection.framer.flush()
+            self._deliver(connection.framer.body)
+        self._connections.pop(connection.sock, None)
+        try:
+            self._selector.unregister(connection.sock)
+        except (KeyError, ValueError):
+            pass
+        connection.sock.close()
+
+    def _deliver(self, body: bytes):
+        message = clean_response(body)
+        if not message:
+            return
+        session_capture.record(session_capture.RESPONSE, self.port, body)
+        if self.messages.full():
+            try:
+                self.messages.get_nowait()
+                self.dropped += 1
+            except queue.Empty:
+                pass
+        self.messages.put_nowait(message)
+        self.received += 1
@@ -0,0 +1,185 @@
+# app/services/register_map.py
+"""Device register maps loaded from JSON or YAML descriptions.
+
+A description is compiled once into name/address lookups plus numpy tables
+of register offsets and bitfield shifts/masks, so resolving a name is a dict
+lookup and decoding a register dump is a few vector operations::
+
+    device: BME280
+    register_size: 8        # register address width in bits
+    byte_order: big         # of registers wider than 8 bits
+    registers:
+      - name: CTRL_MEAS
+        address: 0xF4
+        width: 8            # register width in bits
+        fields:
+          osrs_t: "7:5"
+          mode: {bits: "1:0", values: {sleep: 0, forced: 1, normal: 3}}
+        volatile: true      # writes trigger actions / reads change; bypass the register cache
+"""
+from typing import List, Optional, Tuple
+import json
+import os
+import numpy as np
+from app.models.register_map_model import Register, RegisterField
+
+
+def _int(value) -> int:
+    return int(value, 0) if isinstance(value, str) else int(value)
+
+
+def _parse_bits(bits) -> Tuple[int, int]:
+    """'7:5' or [7, 5] -> (lsb, width); a single bit number -> (bit, 1)."""
+    if isinstance(bits, str) and ":" in bits:
+        msb, lsb = (int(part) for part in bits.split(":"))
+    elif isinstance(bits, (list, tuple)):
+        msb, lsb = int(bits[0]), int(bits[-1])
+    else:
+        msb = lsb = int(bits)
+    if msb < lsb:
+        msb, lsb = lsb, msb
+    return lsb, msb - lsb + 1
+
+
+def _parse_field(name: str, spec) -> RegisterField:
+    values = {}
+    if isinstance(spec, dict):
+        values = {_int(raw): label for label, raw in spec.get("values", {}).items()}
+        spec = spec["bits"]
+    lsb, width = _parse_bits(spec)
+    return RegisterField(name, lsb, width, values)
+
+
+class RegisterMap:
+    def __init__(self, device: str, registers: List[Register], register_size: int = 8, byte_order: str = "big"):
+        if register_size not in (8, 16):
+            raise ValueError("register_size must be either 8 or 16 (bits)")
+        if byte_order not in ("big", "little"):
+            raise ValueError("byte_order must be 'big' or 'little'")
+        self.device = device
+        self.register_size = register_size
+        self.byte_order = byte_order
+        self.registers = sorted(registers, key=lambda r: r.address)
+        self.by_name = {r.name.upper(): r for r in self.registers}
+        self.by_address = {r.address: r for r in self.registers}
+        if len(self.by_name) != len(self.registers) or len(self.by_address) != len(self.registers):
+            raise ValueError(f"{device}: duplicate register name or address")
+
+        # Vector tables: one row per register, one per field
+        self._address = np.array([r.address for r in self.registers], dtype=np.int64)
+        self._size = np.array([r.size for r in self.registers], dtype=np.int64)
+        fields = [(index, f) for index, r in enumerate(self.registers) for f in r.fields]
+        self._fields = [f for _, f in fields]
+        self._field_register = np.array([index for index, _ in fields], dtype=np.int64)
+        self._field_shift = np.array([f.lsb for f in self._fields], dtype=np.uint64)
+        self._field_mask = np.array([f.mask for f in self._fields], dtype=np.uint64)
+
+    @property
+    def names(self) -> List[str]:
+        return [r.name for r in self.registers]
+
+    def resolve(self, text: str) -> Optional[Register]:
+        """Register called text, or at the hex address text; None if neither."""
+        text = text.strip()
+        register = self.by_name.get(text.upper())
+        if register is None:
+            try:
+                register = self.by_address.get(int(text, 16))
+            except ValueError:
+                return None
+        return register
+
+    def any_volatile(self, start: int, length: int) -> bool:
+        """True if a transfer of length bytes from start touches a volatile register."""
+        end = start + length
+        return any(r.volatile and r.address < end and start < r.address + r.size for r in self.registers)
+
+    def encode(self, name: str, value: int = None, **fields) -> bytes:
+        """Bytes to write to register name: value (default the reset value) with the given fields replaced.
+
+        Field values may be numbers or the labels from the description.
+        """
+        register = self.by_name[name.upper()]
+        value = register.reset if value is None else value
+        for f in register.fields:
+            if f.name not in fields:
+                continue
+            raw = fields.pop(f.name)
+            if isinstance(raw, str):
+                labels = {label: number for number, label in f.values.items()}
+                raw = labels[raw] if raw in labels else _int(raw)
+            if not 0 <= raw <= f.mask:
+                raise ValueError(f"{register.name}.{f.name} = {raw} does not fit in {f.width} bits")
+            value = (value & ~(f.mask << f.lsb)) | (raw << f.lsb)
+        if fields:
+            raise ValueError(f"{register.name} has no field(s) {', '.join(fields)}")
+        return int(value).to_bytes(register.size, self.byte_order)
+
+    def decode(self, start: int, data: bytes):
+        """Decode a register dump read from start.
+
+        Returns (registers, values, field_values): the registers fully
+        covered by data, their values, and a value per field of those
+        registers (None for fields of registers not covered).
+        """
+        raw = np.frombuffer(bytes(data), dtype=np.uint8).astype(np.uint64)
+        offset = self._address - start
+        covered = np.flatnonzero((offset >= 0) & (offset + self._size <= raw.size))
+        offset, size = offset[covered], self._size[covered]
+        values = np.zeros(covered.size, dtype=np.uint64)
+        for byte in range(int(size.max()) if covered.size else 0):
+            has = size > byte
+            if self.byte_order == "big":
+                values[has] = (values[has] << np.uint64(8)) | raw[offset[has] + byte]
+            else:
+                values[has] |= raw[offset[has] + byte] << np.uint64(8 * byte)
+
+        position = np.full(len(self.registers), -1, dtype=np.int64)
+        position[covered] = np.arange(covered.size)
+        field_position = position[self._field_register] if self._fields else np.empty(0, dtype=np.int64)
+        field_values = np.zeros(len(self._fields), dtype=np.uint64)
+        decoded = field_position >= 0
+        field_values[decoded] = (values[field_position[decoded]] >> self._field_shift[decoded]) & self._field_mask[decoded]
+        return ([self.registers[i] for i in covered], values,
+                [int(v) if ok else None for v, ok in zip(field_values.tolist(), decoded.tolist())])
+
+    def describe(self, start: int, data: bytes) -> str:
+        """One-line decode for the monitor, e.g. ``CTRL_MEAS=0x27 (osrs_t=1, mode=normal)``."""
+        registers, values, field_values = self.decode(start, data)
+        by_register = {}
+        for f, index, value in zip(self._fields, self._field_register.tolist(), field_values):
+            if value is not None:
+                by_register.setdefault(self.registers[index].name, []).append(f"{f.name}={f.values.get(value, value)}")
+        parts = []
+        for register, value in zip(registers, values.tolist()):
+            text = f"{register.name}=0x{value:0{register.size * 2}X}"
+            field_text = by_register.get(register.name)
+            parts.append(f"{text} ({', '.join(field_text)})" if field_text else text)
+        return "; ".join(parts)
+
+
+def compile_register_map(description: dict) -> RegisterMap:
+    registers = []
+    for spec in description.get("registers", []):
+        fields = tuple(_parse_field(name, bits) for name, bits in (spec.get("fields") or {}).items())
+        width = int(spec.get("width", 8))
+        if width % 8 or not 8 <= width <= 32:
+            raise ValueError(f"{spec.get('name')}: width must be 8, 16, 24 or 32 bits")
+        registers.append(Register(spec["name"], _int(spec["address"]), width, fields, _int(spec.get("reset", 0)),
+                                  bool(spec.get("volatile", False))))
+    return RegisterMap(description.get("device", ""), registers,
+                       int(description.get("register_size", 8)), description.get("byte_order", "big"))
+
+
+def load_register_map(path: str) -> RegisterMap:
+    """Read and compile a .json, .yaml or .yml register map description."""
+    with open(path, "r", encoding="utf-8") as f:
+        if os.path.splitext(path)[1].lower() in (".yaml", ".yml"):
+            try:
+                import yaml
+            except ImportError:
+                raise ValueError("YAML register maps need PyYAML (pip install pyyaml); use JSON instead") from None
+            description = yaml.safe_load(f)
+        else:
+            description = json.load(f)
+    return compile_register_map(description)
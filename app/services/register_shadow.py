@@ -0,0 +1,124 @@
+# app/services/register_shadow.py
+"""Shadow copy of a device's registers so unchanged registers are not re-sent.
+
+One byte per register address, as auto-incrementing I2C register maps are
+laid out. Value, valid, dirty and timestamp are flat numpy arrays indexed by
+register address, so diffing a write or finding dirty ranges is a handful
+of vector operations even for a 16-bit register space.
+"""
+from typing import Callable, Dict, List, Optional, Tuple
+import time
+import numpy as np
+
+DEFAULT_TTL = 2.0   # seconds a read value is trusted before reading the device again
+MAX_GAP = 2         # unchanged registers worth re-sending to merge two dirty ranges into one write
+
+
+class RegisterShadow:
+    def __init__(self, register_size: int = 8, ttl: float = DEFAULT_TTL):
+        if register_size not in (8, 16):
+            raise ValueError("register_size must be either 8 or 16 (bits)")
+        size = 1 << register_size
+        self.register_size = register_size
+        self.ttl = ttl
+        self.values = np.zeros(size, dtype=np.uint8)
+        self.valid = np.zeros(size, dtype=bool)    # value is known to match the device
+        self.dirty = np.zeros(size, dtype=bool)    # value staged but not yet written
+        self.stamp = np.zeros(size, dtype=np.float64)
+
+    def _span(self, address: int, length: int) -> slice:
+        if address < 0 or length < 0 or address + length > self.values.size:
+            raise ValueError(f"registers 0x{address:x}+{length} outside the {self.register_size}-bit register space")
+        return slice(address, address + length)
+
+    def cached(self, address: int, length: int, now: float = None) -> Optional[bytes]:
+        """Values of the range if every register is known and younger than the TTL."""
+        span = self._span(address, length)
+        now = time.monotonic() if now is None else now
+        if self.valid[span].all() and (now - self.stamp[span] <= self.ttl).all():
+            return self.values[span].tobytes()
+        return None
+
+    def store(self, address: int, data: bytes):
+        """Record values just read from or written to the device."""
+        span = self._span(address, len(data))
+        self.values[span] = np.frombuffer(data, dtype=np.uint8)
+        self.valid[span] = True
+        self.dirty[span] = False
+        self.stamp[span] = time.monotonic()
+
+    def read(self, address: int, length: int, fetch: Callable[[int, int], bytes]) -> bytes:
+        """Read-through: cached values, else fetch(address, length) from the device."""
+        data = self.cached(address, length)
+        if data is None:
+            data = fetch(address, length)
+            if len(data) == length:
+                self.store(address, data)
+        return data
+
+    def stage(self, address: int, data: bytes) -> int:
+        """Mark registers whose new value differs from (or is not known on) the device; returns how many."""
+        span = self._span(address, len(data))
+        new = np.frombuffer(data, dtype=np.uint8)
+        changed = ~self.valid[span] | (self.values[span] != new)
+        self.values[span] = new
+        self.dirty[span] |= changed
+        return int(np.count_nonzero(changed))
+
+    def dirty_ranges(self, max_gap: int = MAX_GAP) -> List[Tuple[int, int]]:
+        """(start, end) of each write needed, merging ranges split by a few known-valid registers."""
+        index = np.flatnonzero(self.dirty)
+        if not index.size:
+            return []
+        breaks = np.flatnonzero(np.diff(index) > 1)
+        starts = index[np.r_[0, breaks + 1]]
+        ends = index[np.r_[breaks, index.size - 1]] + 1
+        ranges = [(int(starts[0]), int(ends[0]))]
+        for start, end in zip(starts[1:].tolist(), ends[1:].tolist()):
+            previous_start, previous_end = ranges[-1]
+            if start - previous_end <= max_gap and self.valid[previous_end:start].all():
+                ranges[-1] = (previous_start, end)
+            else:
+                ranges.append((start, end))
+        return ranges
+
+    def flush(self, write: Callable[[int, bytes], bool], max_gap: int = MAX_GAP) -> List[Tuple[int, int, bool]]:
+        """Send every dirty range through write(address, data) -> ACKed; returns (start, end, ok) per write."""
+        results = []
+        for start, end in self.dirty_ranges(max_gap):
+            data = self.values[start:end].tobytes()
+            ok = bool(write(start, data))
+            if ok:
+                self.store(start, data)
+            else:
+                self.valid[start:end] = False  # device state unknown; stays dirty for the next flush
+            results.append((start, end, ok))
+        return results
+
+    def invalidate(self, address: int = None, length: int = None):
+        if address is None:
+            self.valid[:] = False
+            self.dirty[:] = False
+        else:
+            span = self._span(address, length or 1)
+            self.valid[span] = False
+            self.dirty[span] = False
+
+
+class ShadowRegistry:
+    """One RegisterShadow per (device address, register size)."""
+
+    def __init__(self, ttl: float = DEFAULT_TTL):
+        self.ttl = ttl
+        self._shadows: Dict[Tuple[str, int], RegisterShadow] = {}
+
+    def get(self, device_address: str, register_size: int) -> RegisterShadow:
+        key = (device_address.lower(), register_size)
+        shadow = self._shadows.get(key)
+        if shadow is None:
+            shadow = RegisterShadow(register_size, self.ttl)
+            self._shadows[key] = shadow
+        return shadow
+
+    def clear(self):
+        self._shadows.clear()
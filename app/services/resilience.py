@@ -0,0 +1,230 @@
+# app/services/resilience.py
+"""Connection resilience shared by every LabVIEW endpoint.
+
+Each (host, port) has one Endpoint, shared by all the clients, workers and
+runners that talk to it:
+
+* Connects are retried with exponential backoff and full jitter, so a VI
+  that is restarting is reconnected within a fraction of a second instead
+  of after fixed multi-second sleeps.
+* A circuit breaker counts connects that fail even after retries. Once it
+  opens, connects fail immediately until the reset timeout has passed. A
+  VI that has crashed then costs each pending send microseconds, not
+  seconds of retries.
+* After the reset timeout one health ping (a bare TCP connect) decides
+  whether the circuit closes again, and the next request reconnects.
+
+Only the connect is retried: resending an INI message whose reply was lost
+could run a test twice.
+"""
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+import errno
+import logging
+import os
+import random
+import select
+import socket
+import threading
+import time
+from app.services.cancellation import Cancelled
+
+logger = logging.getLogger(__name__)
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half-open"
+CANCEL_POLL = 0.05  # seconds between cancel checks while a connect is pending
+_IN_PROGRESS = {errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EALREADY, getattr(errno, "WSAEWOULDBLOCK", errno.EWOULDBLOCK)}
+
+
+class CircuitOpenError(ConnectionError):
+    """Raised instead of connecting while an endpoint's circuit is open."""
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    attempts: int = 3          # connects per operation, including the first
+    base_delay: float = 0.1    # seconds before the first retry
+    max_delay: float = 1.0
+    multiplier: float = 2.0
+
+    def delay(self, retry: int) -> float:
+        """Full-jitter backoff before retry number retry (0-based)."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * self.multiplier ** retry))
+
+
+class CircuitBreaker:
+    def __init__(self, failure_threshold: int = 3, reset_timeout: float = 5.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def retry_in(self, now: float = None) -> float:
+        """Seconds until an open circuit may be tried again."""
+        now = time.monotonic() if now is None else now
+        return max(0.0, self.opened_at + self.reset_timeout - now)
+
+    def allow(self) -> bool:
+        """True if a connect may be attempted; an expired open circuit turns half-open for one trial."""
+        with self._lock:
+            if self.state == OPEN and not self.retry_in():
+                self.state = HALF_OPEN
+                return True
+            return self.state == CLOSED
+
+    def record_success(self) -> bool:
+        """Returns True if this closed a circuit that was not closed."""
+        with self._lock:
+            reopened = self.state != CLOSED
+            self.state = CLOSED
+            self.failures = 0
+            return reopened
+
+    def record_failure(self) -> bool:
+        """Returns True if this opened the circuit."""
+        with self._lock:
+            self.failures += 1
+            if self.state == HALF_OPEN or (self.state == CLOSED and self.failures >= self.failure_threshold):
+                self.state = OPEN
+                self.opened_at = time.monotonic()
+                return True
+            return False
+
+
+def open_connection(host: str, port: int, timeout: float, cancel_token=None) -> socket.socket:
+    """socket.create_connection() that a cancel_token can interrupt while the connect is pending.
+
+    Shutting down a socket that is still connecting does not wake the
+    thread blocked in connect(), so the connect is made non-blocking and
+    the token is checked every CANCEL_POLL seconds instead.
+    """
+    if cancel_token is None:
+        return socket.create_connection((host, port), timeout=timeout)
+    deadline = time.monotonic() + timeout
+    error = None
+    for family, kind, proto, _, address in socket.getaddrinfo(host, port, 0, socket.SOCK_STREAM):
+        sock = socket.socket(family, kind, proto)
+        try:
+            sock.setblocking(False)
+            code = sock.connect_ex(address)
+            while code in _IN_PROGRESS:
+                cancel_token.raise_if_cancelled()
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise socket.timeout("timed out")
+                _, writable, failed = select.select([], [sock], [sock], min(remaining, CANCEL_POLL))
+                if writable or failed:
+                    code = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+            if code:
+                raise OSError(code, os.strerror(code))
+            sock.settimeout(timeout)
+            return sock
+        except Cancelled:
+            sock.close()
+            raise
+        except OSError as e:
+            sock.close()
+            error = e
+    raise error or OSError(f"no address for {host}:{port}")
+
+
+class Endpoint:
+    def __init__(self, host: str, port: int, policy: RetryPolicy = None, breaker: CircuitBreaker = None):
+        self.host = host
+        self.port = port
+        self.policy = policy or RetryPolicy()
+        self.breaker = breaker or CircuitBreaker()
+        self.connects = 0
+        self.connect_failures = 0
+        self.fast_failures = 0   # connects refused by the open circuit
+        self.last_ok: Optional[float] = None
+
+    def __repr__(self):
+        return f"Endpoint({self.host}:{self.port}, {self.breaker.state})"
+
+    @property
+    def healthy(self) -> bool:
+        return self.breaker.state == CLOSED
+
+    def _check_circuit(self):
+        if self.breaker.allow():
+            return
+        self.fast_failures += 1
+        raise CircuitOpenError(f"LabVIEW at {self.host}:{self.port} is unreachable; "
+                               f"next attempt in {self.breaker.retry_in():.1f}s")
+
+    def _record(self, ok: bool):
+        if ok:
+            self.last_ok = time.monotonic()
+            if self.breaker.record_success():
+                logger.info("LabVIEW at %s:%s is reachable again", self.host, self.port)
+        elif self.breaker.record_failure():
+            logger.warning("LabVIEW at %s:%s unreachable; failing fast for %.0fs",
+                           self.host, self.port, self.breaker.reset_timeout)
+
+    def ping(self, timeout: float = 1.0) -> bool:
+        """Health check: can a TCP connection be opened? Updates the circuit either way."""
+        try:
+            socket.create_connection((self.host, self.port), timeout=timeout).close()
+        except OSError:
+            self._record(False)
+            return False
+        self._record(True)
+        return True
+
+    def connect(self, timeout: float = 10, cancel_token=None) -> socket.socket:
+        """Open a connection, retrying with backoff; raises CircuitOpenError while the VI is known to be down."""
+        self._check_circuit()
+        if self.breaker.state == HALF_OPEN:
+            # One quick health ping decides the trial, so the retry budget is not burnt on a dead VI
+            if not self.ping(min(timeout, 1.0)):
+                raise CircuitOpenError(f"LabVIEW at {self.host}:{self.port} is still unreachable")
+        error = None
+        for attempt in range(self.policy.attempts):
+            if attempt:
+                delay = self.policy.delay(attempt - 1)
+                logger.debug("Connect to %s:%s failed (%s); retry %d in %.0f ms",
+                             self.host, self.port, error, attempt, delay * 1000)
+                if cancel_token is not None and cancel_token.sleep(delay):
+                    raise Cancelled()
+                if cancel_token is None:
+                    time.sleep(delay)
+            self.connects += 1
+            try:
+                sock = open_connection(self.host, self.port, timeout, cancel_token)
+            except Cancelled:
+                raise  # not the VI's fault; leaves the circuit as it was
+            except OSError as e:
+                self.connect_failures += 1
+                error = e
+                continue
+            self._record(True)
+            return sock
+        self._record(False)
+        raise error
+
+    def stats(self) -> dict:
+        return {"state": self.breaker.state, "connects": self.connects,
+                "connect_failures": self.connect_failures, "fast_failures": self.fast_failures,
+                "last_ok": self.last_ok}
+
+
+_endpoints: Dict[Tuple[str, int], Endpoint] = {}
+_lock = threading.Lock()
+
+
+def endpoint(host: str, port: int) -> Endpoint:
+    """The shared Endpoint for host:port."""
+    key = (host, int(port))
+    with _lock:
+        found = _endpoints.get(key)
+        if found is None:
+            found = _endpoints[key] = Endpoint(host, int(port))
+        return found
+
+
+def endpoints():
+    with _lock:
+        return list(_endpoints.values())
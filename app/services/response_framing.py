@@ -0,0 +1,122 @@
+# app/services/response_framing.py
+"""End-of-response detection for replies from the LabVIEW VIs.
+
+A VI can mark where its reply ends in one of two ways:
+
+* Length header: the first line is ``#LEN <n>`` and exactly ``n`` bytes of
+  reply follow it.
+* Terminator: the reply ends with a line containing only ``#END``.
+
+Either way the reply is complete as soon as its last byte arrives, even if
+the VI keeps the socket open. Older VIs that send neither marker still work:
+their reply ends when the socket closes or goes idle, as before.
+"""
+import socket
+from typing import List
+
+LENGTH_HEADER = b"#LEN "
+END_MARKER = b"#END"
+
+
+class ResponseFramer:
+    """Incrementally splits a reply into lines and detects its end."""
+
+    def __init__(self):
+        self._pending = b""       # bytes after the last newline
+        self._body = bytearray()  # reply bytes, markers excluded
+        self._expected = None     # body length announced by #LEN
+        self._partial = b""       # unterminated line inside a counted body
+        self._first_line = True
+        self.complete = False
+
+    @property
+    def body(self) -> bytes:
+        return bytes(self._body)
+
+    @property
+    def remainder(self) -> bytes:
+        """Bytes received after the end of a complete reply, i.e. the start of the next one."""
+        return self._pending if self.complete else b""
+
+    def feed(self, data: bytes) -> List[bytes]:
+        """Consume a received chunk and return the reply lines it completed."""
+        if self.complete:
+            return []
+        lines = []
+        self._pending += data
+        while not self.complete:
+            if self._expected is not None:
+                self._take_counted(lines)
+                break
+            newline = self._pending.find(b"\n")
+            if newline < 0:
+                break
+            raw = self._pending[:newline + 1]
+            self._pending = self._pending[newline + 1:]
+            line = raw.rstrip(b"\r\n")
+
+            if self._first_line:
+                self._first_line = False
+                if line.startswith(LENGTH_HEADER):
+                    try:
+                        self._expected = int(line[len(LENGTH_HEADER):])
+                        continue
+                    except ValueError:
+                        pass  # Not a header after all; treat as data
+            if line.strip() == END_MARKER:
+                self.complete = True
+                break
+            self._body += raw
+            lines.append(line)
+        return lines
+
+    def _take_counted(self, lines: List[bytes]):
+        needed = self._expected - len(self._body)
+        taken, self._pending = self._pending[:needed], self._pending[needed:]
+        self._body += taken
+        *finished, self._partial = (self._partial + taken).split(b"\n")
+        lines.extend(line.rstrip(b"\r") for line in finished)
+        if len(self._body) >= self._expected:
+            self.complete = True
+            lines.extend(self._take_partial())
+
+    def _take_partial(self) -> List[bytes]:
+        tail, self._partial = self._partial, b""
+        return [tail.rstrip(b"\r")] if tail.strip() else []
+
+    def flush(self) -> List[bytes]:
+        """Return any unterminated last line once the socket closes or idles."""
+        if self.complete:
+            return []
+        self.complete = True
+        if self._expected is not None:
+            # Short read: the VI closed before sending all announced bytes
+            return self._take_partial()
+        tail, self._pending = self._pending, b""
+        if tail.strip() == END_MARKER:
+            return []
+        self._body += tail
+        return [tail.rstrip(b"\r")] if tail.strip() else []
+
+
+def read_framed_response(sock, response_timeout=40, idle_timeout=2.0, max_bytes=1024 * 1024) -> bytes:
+    """Read one reply from sock, returning as soon as its end is recognised.
+
+    Without a marker the reply ends when the peer closes the socket or no
+    data arrives for idle_timeout seconds after the first byte.
+    """
+    framer = ResponseFramer()
+    sock.settimeout(response_timeout)
+    while not framer.complete:
+        try:
+            chunk = sock.recv(4096)
+        except socket.timeout:
+            break
+        if not chunk:
+            break
+        framer.feed(chunk)
+        if len(framer.body) > max_bytes:
+            break
+        sock.settimeout(idle_timeout)
+    framer.flush()
+    return framer.body
@@ -0,0 +1,83 @@
+# app/services/service_container.py
+import logging
+from app.services.log_store import LogStore
+
+logger = logging.getLogger(__name__)
+
+DB_CONFIG = {
+    'dbname': 'uart_test',
+    'user': 'postgres',
+    'password': 'tejasai',
+    'host': 'localhost',
+    'port': '5432'
+}
+
+
+class ServiceContainer:
+    """Application-wide services shared by every protocol window.
+
+    Heavy services are built on first use, so the landing page does not pay
+    for psycopg2 or a database round-trip before the user picks a protocol.
+    """
+
+    def __init__(self, db_config=None):
+        self.db_config = dict(db_config or DB_CONFIG)
+        self.log_store = LogStore()
+        self._db = None
+        self._uart_backend = None
+        self._i2c_backend = None
+        self._windows = {}
+        self.stall_detector = None  # app.stall_detector.StallDetector, set by main()
+
+    @property
+    def db(self):
+        """Pooled Database; tables are created on first access only."""
+        if self._db is None:
+            from app.services.database_service import Database
+            self._db = Database(self.db_config)
+        if not self._db.tables_ready:
+            self._db.create_tables()
+        return self._db
+
+    @property
+    def uart_backend(self):
+        if self._uart_backend is None:
+            from app.services.uart_backend import UARTBackend
+            self._uart_backend = UARTBackend()
+        return self._uart_backend
+
+    @property
+    def i2c_backend(self):
+        if self._i2c_backend is None:
+            from app.services.i2c_backend import I2CBackend
+            self._i2c_backend = I2CBackend()
+        return self._i2c_backend
+
+    def window(self, name: str, factory):
+        """Return the cached window called name, building it with factory() the first time."""
+        window = self._windows.get(name)
+        if window is None:
+            logger.info("Creating %s window", name)
+            window = factory()
+            self._windows[name] = window
+        return window
+
+    def shutdown(self):
+        for window in self._windows.values():
+            window.close()
+        for backend in (self._uart_backend, self._i2c_backend):
+            if backend is not None:
+                backend.close()
+        if self._db is not None:
+            self._db.close()
+        self.log_store.close()
+
+
+_services = None
+
+
+def get_services() -> ServiceContainer:
+    global _services
+    if _services is None:
+        _services = ServiceContainer()
+    return _services
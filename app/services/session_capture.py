@@ -0,0 +1,200 @@
+# app/services/session_capture.py
+"""Raw capture of everything exchanged with LabVIEW.
+
+Capture file layout (little-endian)::
+
+    MAGIC                                  8 bytes
+    frame*  kind:u8  time:f64  port:u16  length:u32  data[length]
+
+Frame offsets are appended to a sidecar ``<file>.idx`` as u64 values so a
+reader can jump straight to frame N. If the index is missing or was cut
+short by a crash, the reader rebuilds it by scanning the capture.
+"""
+from collections import namedtuple
+import mmap
+import os
+import struct
+import threading
+import time
+import logging
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"PVSCAP\x00\x01"
+FRAME = struct.Struct("<BdHI")
+
+# Frame kinds
+REQUEST = 1   # INI message sent to a VI
+RESPONSE = 2  # complete reply
+LINE = 3      # one streamed reply line
+KIND_NAMES = {REQUEST: "request", RESPONSE: "response", LINE: "line"}
+
+FLUSH_INTERVAL = 0.5  # seconds between flushes of the capture and index files
+
+Frame = namedtuple("Frame", "kind timestamp port data")
+
+
+def index_path(path: str) -> str:
+    return path + ".idx"
+
+
+class SessionCaptureWriter:
+    """Append-only capture file; safe to call from any transport thread."""
+
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(path, "wb")
+        self._index = open(index_path(path), "wb")
+        self._file.write(MAGIC)
+        self._offset = len(MAGIC)
+        self._lock = threading.Lock()
+        self._last_flush = time.monotonic()
+        self.frames = 0
+
+    def record(self, kind: int, port: int, data, timestamp: float = None):
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        header = FRAME.pack(kind, time.time() if timestamp is None else timestamp, port, len(data))
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.write(header)
+            self._file.write(data)
+            self._index.write(struct.pack("<Q", self._offset))
+            self._offset += FRAME.size + len(data)
+            self.frames += 1
+            now = time.monotonic()
+            if now - self._last_flush >= FLUSH_INTERVAL:
+                self._file.flush()
+                self._index.flush()
+                self._last_flush = now
+
+    def close(self):
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.close()
+            self._index.close()
+            self._file = self._index = None
+
+
+_active_writer = None
+
+
+def start_capture(path: str) -> SessionCaptureWriter:
+    """Begin recording all transport traffic to path, replacing any running capture."""
+    global _active_writer
+    stop_capture()
+    _active_writer = SessionCaptureWriter(path)
+    logger.info("Capturing LabVIEW traffic to %s", path)
+    return _active_writer
+
+
+def stop_capture():
+    global _active_writer
+    writer, _active_writer = _active_writer, None
+    if writer is not None:
+        writer.close()
+        logger.info("Capture closed: %d frames in %s", writer.frames, writer.path)
+    return writer
+
+
+def is_capturing() -> bool:
+    return _active_writer is not None
+
+
+def record(kind: int, port: int, data):
+    """Called by the transports; a no-op unless a capture is running."""
+    writer = _active_writer
+    if writer is not None:
+        writer.record(kind, port, data)
+
+
+class SessionCaptureReader:
+    """Random access to a capture file through mmap and the offset index."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        if size < len(MAGIC):
+            raise ValueError(f"{path} is not a session capture")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mm[:len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a session capture")
+        self.offsets = self._load_index()
+
+    def _load_index(self) -> np.ndarray:
+        size = len(self._mm)
+        try:
+            offsets = np.fromfile(index_path(self.path), dtype="<u8")
+        except (OSError, ValueError):
+            offsets = np.empty(0, dtype="<u8")
+        # A cleanly closed capture ends exactly where its last indexed frame ends
+        if offsets.size and self._frame_end(int(offsets[-1])) == size:
+            return offsets
+        if not offsets.size and size == len(MAGIC):
+            return offsets
+        logger.warning("Rebuilding index for %s", self.path)
+        return self._scan()
+
+    def _frame_end(self, offset: int):
+        """End offset of the frame at offset, or None if it is truncated."""
+        if offset + FRAME.size > len(self._mm):
+            return None
+        length = FRAME.unpack_from(self._mm, offset)[3]
+        end = offset + FRAME.size + length
+        return end if end <= len(self._mm) else None
+
+    def _scan(self) -> np.ndarray:
+        offsets = []
+        offset = len(MAGIC)
+        while True:
+            end = self._frame_end(offset)
+            if end is None:
+                break
+            offsets.append(offset)
+            offset = end
+        offsets = np.array(offsets, dtype="<u8")
+        offsets.tofile(index_path(self.path))
+        return offsets
+
+    def __len__(self):
+        return int(self.offsets.size)
+
+    def __getitem__(self, i: int) -> Frame:
+        offset = int(self.offsets[i])
+        kind, timestamp, port, length = FRAME.unpack_from(self._mm, offset)
+        start = offset + FRAME.size
+        return Frame(kind, timestamp, port, self._mm[start:start + length])
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def timestamps(self) -> np.ndarray:
+        """Every frame's timestamp, gathered straight from the mapped file."""
+        raw = np.frombuffer(self._mm, dtype=np.uint8)
+        fields = self.offsets.astype(np.int64)[:, None] + 1 + np.arange(8)
+        return raw[fields].copy().view("<f8").ravel()
+
+    def seek_time(self, timestamp: float) -> int:
+        """Index of the first frame at or after timestamp."""
+        return int(np.searchsorted(self.timestamps(), timestamp))
+
+    def close(self):
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,73 @@
+# app/services/session_replayer.py
+import time
+from PySide6.QtCore import QThread, Signal
+from app.services.burst_sender import sleep_until
+from app.services.labview_client import clean_line, clean_response
+from app.services.session_capture import SessionCaptureReader, REQUEST, RESPONSE, LINE
+
+
+class SessionReplayer(QThread):
+    """Plays a capture back through the same signals the live transport emits."""
+    request_sent = Signal(str)     # INI message
+    line_received = Signal(str)
+    response_received = Signal(str)
+    progress = Signal(int, int)    # (frames replayed, total)
+    finished = Signal(int)         # frames replayed
+    error = Signal(str)
+
+    def __init__(self, path: str, speed: float = 1.0, ports=None, start_index: int = 0):
+        super().__init__()
+        self.path = path
+        self.speed = speed  # 1.0 replays in real time, 0 as fast as possible
+        self.ports = set(ports) if ports else None
+        self.start_index = start_index
+        self._stop_requested = False
+
+    def stop(self):
+        self._stop_requested = True
+
+    def _wait_until(self, deadline: float):
+        # Sleep in short steps so stop() is honoured during long gaps
+        while deadline - time.perf_counter() > 0.1:
+            if self._stop_requested:
+                return
+            time.sleep(0.05)
+        sleep_until(deadline)
+
+    def run(self):
+        replayed = 0
+        position = self.start_index
+        try:
+            with SessionCaptureReader(self.path) as reader:
+                total = len(reader)
+                start = time.perf_counter()
+                first_timestamp = None
+                for i in range(self.start_index, total):
+                    if self._stop_requested:
+                        break
+                    frame = reader[i]
+                    if self.ports and frame.port not in self.ports:
+                        continue
+                    if self.speed > 0:
+                        if first_timestamp is None:
+                            first_timestamp = frame.timestamp
+                        self._wait_until(start + (frame.timestamp - first_timestamp) / self.speed)
+                        if self._stop_requested:
+                            break
+                    # Replies are stored raw; clean them as the live transport does
+                    if frame.kind == RESPONSE:
+                        self.response_received.emit(clean_response(frame.data))
+                    elif frame.kind == LINE:
+                        line = clean_line(frame.data.decode("utf-8", errors="ignore"))
+                        if line.strip():
+                            self.line_received.emit(line)
+                    elif frame.kind == REQUEST:
+                        self.request_sent.emit(frame.data.decode("utf-8", errors="ignore"))
+                    replayed += 1
+                    position = i + 1
+                    if replayed % 100 == 0:
+                        self.progress.emit(position, total)
+                self.progress.emit(position, total)
+        except (OSError, ValueError) as e:
+            self.error.emit(f"Error: {e}")
+        self.finished.emit(replayed)
@@ -0,0 +1,142 @@
+# app/services/signal_buffer.py
+import time
+from typing import Dict, Tuple
+import numpy as np
+
+# Channels recorded from the LabVIEW transport: name -> (capacity, y-axis label)
+BAUD_MIN_ERROR = "Baud Error (min edge)"
+BAUD_MAX_ERROR = "Baud Error (max edge)"
+RX_BYTES = "Rx Byte Values"
+LATENCY = "Latency"
+
+CHANNELS = {
+    BAUD_MIN_ERROR: (1 << 18, "Error (%)"),
+    BAUD_MAX_ERROR: (1 << 18, "Error (%)"),
+    RX_BYTES: (1 << 21, "Byte Value"),
+    LATENCY: (1 << 18, "Latency (ms)"),
+}
+
+
+class RingBuffer:
+    """Fixed-capacity (time, value) history; the oldest samples are overwritten.
+
+    Memory is allocated once, so appending costs the same after an hour
+    of streaming as after a second.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._t = np.zeros(capacity, dtype=np.float64)
+        self._y = np.zeros(capacity, dtype=np.float32)
+        self._head = 0   # next slot to write
+        self._count = 0
+        self.version = 0  # bumped on every write so viewers can skip redraws
+
+    def __len__(self):
+        return self._count
+
+    def clear(self):
+        self._head = 0
+        self._count = 0
+        self.version += 1
+
+    def append(self, t: float, y: float):
+        self._t[self._head] = t
+        self._y[self._head] = y
+        self._head = (self._head + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+        self.version += 1
+
+    def extend(self, t, ys):
+        """Append many samples; t is a scalar or an array matching ys."""
+        ys = np.asarray(ys, dtype=np.float32).ravel()
+        ts = np.broadcast_to(np.asarray(t, dtype=np.float64), ys.shape)
+        if ys.size > self.capacity:
+            ts, ys = ts[-self.capacity:], ys[-self.capacity:]
+        n = ys.size
+        first = min(n, self.capacity - self._head)
+        self._t[self._head:self._head + first] = ts[:first]
+        self._y[self._head:self._head + first] = ys[:first]
+        self._t[:n - first] = ts[first:]
+        self._y[:n - first] = ys[first:]
+        self._head = (self._head + n) % self.capacity
+        self._count = min(self._count + n, self.capacity)
+        self.version += 1
+
+    def _segments(self):
+        """Stored samples as (older, newer) slice pairs in time order."""
+        if self._count < self.capacity:
+            return [slice(0, self._count)]
+        return [slice(self._head, self.capacity), slice(0, self._head)]
+
+    def latest(self, span: float = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Samples newer than span seconds before the last one (all when span is None)."""
+        if self._count == 0:
+            return np.empty(0), np.empty(0, dtype=np.float32)
+        segments = self._segments()
+        if span is not None:
+            newest = self._t[(self._head - 1) % self.capacity]
+            cutoff = newest - span
+            trimmed = []
+            for seg in segments:
+                start = seg.start + int(np.searchsorted(self._t[seg], cutoff))
+                if start < seg.stop:
+                    trimmed.append(slice(start, seg.stop))
+            segments = trimmed
+        if len(segments) == 1:
+            seg = segments[0]
+            return self._t[seg].copy(), self._y[seg].copy()
+        return (np.concatenate([self._t[s] for s in segments]),
+                np.concatenate([self._y[s] for s in segments]))
+
+
+def minmax_decimate(t: np.ndarray, y: np.ndarray, max_points: int):
+    """Reduce to at most ~max_points samples, keeping each bin's min and max.
+
+    Peaks and glitches stay visible however much history is on screen,
+    unlike plain striding.
+    """
+    n = y.size
+    bins = max(max_points // 2, 1)
+    if n <= max_points:
+        return t, y
+    per = -(-n // bins)  # ceil
+    usable = (n // per) * per
+    blocks = y[:usable].reshape(-1, per)
+    base = np.arange(blocks.shape[0]) * per
+    imin = blocks.argmin(axis=1) + base
+    imax = blocks.argmax(axis=1) + base
+    index = np.column_stack((np.minimum(imin, imax), np.maximum(imin, imax))).ravel()
+    if usable < n:
+        tail = y[usable:]
+        extra = sorted({usable + int(tail.argmin()), usable + int(tail.argmax())})
+        index = np.concatenate((index, extra))
+    return t[index], y[index]
+
+
+class SignalStreams:
+    """One RingBuffer per channel, timestamped relative to creation."""
+
+    def __init__(self, channels: Dict[str, tuple] = None):
+        self.channels = dict(channels or CHANNELS)
+        self.t0 = time.monotonic()
+        self.buffers = {name: RingBuffer(capacity) for name, (capacity, _) in self.channels.items()}
+
+    def now(self) -> float:
+        return time.monotonic() - self.t0
+
+    def append(self, channel: str, value: float):
+        self.buffers[channel].append(self.now(), value)
+
+    def extend(self, channel: str, values):
+        self.buffers[channel].extend(self.now(), values)
+
+    def append_bytes(self, channel: str, data: bytes):
+        self.extend(channel, np.frombuffer(data, dtype=np.uint8))
+
+    def unit(self, channel: str) -> str:
+        return self.channels[channel][1]
+
+    def clear(self):
+        for buffer in self.buffers.values():
+            buffer.clear()
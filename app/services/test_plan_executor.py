@@ -0,0 +1,97 @@
+# app/services/test_plan_executor.py
+from dataclasses import replace
+from datetime import datetime
+import queue
+import logging
+from PySide6.QtCore import QThread, Signal
+from app.models.test_plan import TestPlan, PlanResult
+from app.services.cancellation import CancelToken, Cancelled
+from app.services.labview_client import LabVIEWClient
+from app.services.labview_service import serial_port_encoder
+
+
+class TestPlanExecutor(QThread):
+    """Runs every item of a TestPlan back-to-back over one LabVIEW connection.
+
+    When ``work_queue`` is given, items are pulled from that shared queue
+    instead of the plan, so several executors can split one plan between
+    them.
+    """
+    result_ready = Signal(object)   # PlanResult, one per sent payload
+    progress = Signal(int, int)     # (completed, total)
+    finished = Signal(int)          # number of items executed
+    error = Signal(str)
+
+    def __init__(self, plan: TestPlan, host='127.0.0.1', port=12345,
+                 fixture_name="", device_id=None, work_queue=None):
+        super().__init__()
+        self.plan = plan
+        self.host = host
+        self.port = port
+        self.fixture_name = fixture_name
+        self.device_id = device_id  # Overrides base_config.device_id when set
+        self.work_queue = work_queue
+        self.logger = logging.getLogger(__name__)
+        self.cancel_token = CancelToken()
+        self._stop_requested = False
+
+    def stop(self):
+        self._stop_requested = True
+        self.cancel_token.cancel()  # aborts the request in flight
+
+    def _items(self):
+        if self.work_queue is None:
+            yield from self.plan.iter_items()
+            return
+        while True:
+            try:
+                yield self.work_queue.get_nowait()
+            except queue.Empty:
+                return
+
+    def run(self):
+        total = self.plan.total_items()
+        done = 0
+        client = LabVIEWClient(self.host, self.port, cancel_token=self.cancel_token)
+        encoder = serial_port_encoder()
+        current_step = None
+        try:
+            for item in self._items():
+                step_index, payload_index, iteration, base, payload = item
+                if self._stop_requested:
+                    self.logger.info("Test plan stopped after %d items", done)
+                    break
+
+                if step_index != current_step:
+                    # Steps share one base config, so the header is encoded once per step
+                    if self.device_id:
+                        base = replace(base, device_id=self.device_id)
+                    encoder.set_base_config(base)
+                    current_step = step_index
+                base = encoder.base_config
+                message = encoder.encode(payload)
+                result = PlanResult(step_index, payload_index, iteration, base, payload,
+                                    tx_timestamp=datetime.now(), fixture=self.fixture_name)
+                try:
+                    result.rx_data = client.request(message)
+                    result.rx_timestamp = datetime.now()
+                except Cancelled:
+                    self.logger.info("Test plan stopped after %d items", done)
+                    break
+                except OSError as e:
+                    client.close()
+                    if self.work_queue is not None:
+                        # Leave the item to the fixtures that are still reachable
+                        self.work_queue.put(item)
+                        self.error.emit(f"Error: {self.fixture_name or self.host} unreachable: {e}")
+                        break
+                    result.error = f"Error: {e}"
+
+                done += 1
+                self.result_ready.emit(result)
+                self.progress.emit(done, total)
+        except Exception as e:
+            self.error.emit(f"Error: {e}")
+        finally:
+            client.close()
+        self.finished.emit(done)
@@ -6,14 +6,18 @@ class UARTBackend:
     def __init__(self, host='127.0.0.1', send_port=12345, receive_port=12346):
         self.logger = logging.getLogger(__name__)
         self.labview = LabVIEWService(host, send_port, receive_port)
+        self.labview.start_reception()  # Listen for VI pushes for the backend's lifetime
         
     def send_base_config(self, base_config):
-        self.logger.info(f"Sending base_config: {base_config}")
+        self.logger.debug("Sending base_config: %s", base_config)
         return self.labview.send_base_config(base_config)
 
     def send_payload(self, payload_config):
-        self.logger.info(f"Sending payload: {payload_config}")
+        self.logger.debug("Sending payload: %s", payload_config)
         return self.labview.send_payload(payload_config)
 
-    def receive_response(self):
-        return self.labview.receive_response()
\ No newline at end of file
+    def receive_response(self, timeout=30):
+        return self.labview.receive_response(timeout)
+
+    def close(self):
+        self.labview.close()
\ No newline at end of file
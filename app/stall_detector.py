@@ -0,0 +1,136 @@
+# app/stall_detector.py
+"""Watchdog for the Qt GUI thread's event loop.
+
+A QTimer on the GUI thread records a heartbeat every INTERVAL_MS; how late
+each beat fires is the event-loop latency. A monitor thread checks the
+heartbeat: once it is older than the stall threshold, the GUI thread is
+stuck in a handler, and the monitor captures that thread's Python stack
+with sys._current_frames() while it is still inside the blocking code. When
+the loop runs again the next beat closes the stall with its real duration.
+"""
+from collections import deque
+from dataclasses import dataclass
+from typing import List, Optional
+import logging
+import statistics
+import sys
+import threading
+import time
+import traceback
+from PySide6.QtCore import QObject, QTimer
+
+logger = logging.getLogger(__name__)
+
+INTERVAL_MS = 50          # heartbeat period
+STALL_THRESHOLD_MS = 250  # a beat this late is a stall
+MAX_STALLS = 100          # most recent stalls kept with their stacks
+LATENCY_SAMPLES = 4096    # most recent beat latencies kept for percentiles
+
+
+@dataclass
+class Stall:
+    started: float    # time.time() of the last beat before the stall
+    duration: float   # seconds the event loop did not run
+    stack: str        # GUI thread stack captured during the stall ("" if it ended before the monitor looked)
+
+    @property
+    def location(self) -> str:
+        """Innermost frame of the captured stack, e.g. ``File "x.py", line 3, in f``."""
+        lines = [line.strip() for line in self.stack.splitlines() if line.strip().startswith("File ")]
+        return lines[-1] if lines else "unknown"
+
+
+class StallDetector(QObject):
+    def __init__(self, threshold_ms: float = STALL_THRESHOLD_MS, interval_ms: int = INTERVAL_MS, parent=None):
+        super().__init__(parent)
+        self.threshold = threshold_ms / 1000.0
+        self.interval = interval_ms / 1000.0
+        self.stalls: "deque[Stall]" = deque(maxlen=MAX_STALLS)
+        self.stall_count = 0
+        self.worst = 0.0
+        self.total_stalled = 0.0
+        self.beats = 0
+        self._latencies = deque(maxlen=LATENCY_SAMPLES)
+        self._last_beat = time.monotonic()
+        self._pending_stack = ""
+        self._gui_thread_id = threading.get_ident()
+        self._timer = QTimer(self)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self._beat)
+        self._monitor: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def start(self):
+        """Start watching; call from the GUI thread."""
+        if self._monitor is not None:
+            return
+        self._gui_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._stop.clear()
+        self._timer.start()
+        self._monitor = threading.Thread(target=self._watch, name="stall-monitor", daemon=True)
+        self._monitor.start()
+        logger.info("GUI stall detector started (threshold %.0f ms)", self.threshold * 1000)
+
+    def stop(self):
+        if self._monitor is None:
+            return
+        self._timer.stop()
+        self._stop.set()
+        self._monitor.join(1.0)
+        self._monitor = None
+        stats = self.stats()
+        logger.info("GUI stalls: %d, worst %.0f ms, %.1f s stalled in total; loop latency p50 %.1f ms, p99 %.1f ms",
+                    stats["stalls"], stats["worst_ms"], stats["total_stalled_s"],
+                    stats["latency_p50_ms"], stats["latency_p99_ms"])
+
+    def _beat(self):
+        now = time.monotonic()
+        gap = now - self._last_beat
+        self._last_beat = now
+        self.beats += 1
+        self._latencies.append(max(0.0, gap - self.interval))
+        if gap < self.threshold:
+            return
+        stall = Stall(time.time() - gap, gap, self._pending_stack)
+        self._pending_stack = ""
+        self.stalls.append(stall)
+        self.stall_count += 1
+        self.total_stalled += gap
+        self.worst = max(self.worst, gap)
+        logger.warning("GUI thread stalled for %.0f ms at %s\n%s", gap * 1000, stall.location, stall.stack.rstrip())
+
+    def _watch(self):
+        """Monitor thread: capture the GUI thread's stack once per stall."""
+        captured_for = None
+        while not self._stop.wait(self.interval):
+            last_beat = self._last_beat
+            if time.monotonic() - last_beat < self.threshold or captured_for == last_beat:
+                continue
+            frame = sys._current_frames().get(self._gui_thread_id)
+            if frame is None:
+                continue
+            self._pending_stack = "".join(traceback.format_stack(frame))
+            captured_for = last_beat
+            del frame
+            logger.debug("GUI thread blocked for over %.0f ms", self.threshold * 1000)
+
+    def recent(self, count: int = 10) -> List[Stall]:
+        return list(self.stalls)[-count:]
+
+    def stats(self) -> dict:
+        # statistics rather than numpy: this module loads before the first paint
+        latencies = [latency * 1000 for latency in self._latencies]
+        if len(latencies) >= 2:
+            percentiles = statistics.quantiles(latencies, n=100, method="inclusive")
+            p50, p99 = percentiles[49], percentiles[98]
+        else:
+            p50 = p99 = latencies[0] if latencies else 0.0
+        return {
+            "stalls": self.stall_count,
+            "worst_ms": self.worst * 1000,
+            "total_stalled_s": self.total_stalled,
+            "beats": self.beats,
+            "latency_p50_ms": float(p50),
+            "latency_p99_ms": float(p99),
+        }
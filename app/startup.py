@@ -0,0 +1,63 @@
+# app/startup.py
+"""Cold-start helpers: background pre-warming of heavy imports and an import-time report."""
+import importlib
+import logging
+import subprocess
+import sys
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Imported on first use by the landing page; pre-warmed after it is painted
+PROTOCOL_WINDOW_MODULES = [
+    "app.views.main_window",
+    "app.views.i2c_main_window",
+    "app.views.components.graph_panel",
+]
+
+
+def prewarm(modules=None) -> threading.Thread:
+    """Import modules on a daemon thread so opening a window later is instant.
+
+    Importing only defines classes, no widgets are created, so this is safe
+    off the GUI thread. If the user opens a window mid-way, Python's import
+    lock makes the GUI thread wait for the module instead of importing it twice.
+    """
+    modules = list(modules or PROTOCOL_WINDOW_MODULES)
+
+    def run():
+        start = time.perf_counter()
+        for name in modules:
+            try:
+                importlib.import_module(name)
+            except Exception as e:
+                logger.warning("Pre-warming %s failed: %s", name, e)
+        logger.debug("Pre-warmed %d modules in %.2fs", len(modules), time.perf_counter() - start)
+
+    thread = threading.Thread(target=run, name="import-prewarm", daemon=True)
+    thread.start()
+    return thread
+
+
+def import_report(modules, top: int = 25) -> str:
+    """Import modules in a fresh interpreter under -X importtime and tabulate the slowest."""
+    code = "; ".join(f"import {name}" for name in modules)
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                          capture_output=True, text=True)
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        rows.append((int(cumulative_us), int(self_us), name[1:].rstrip()))  # drop the separator space
+
+    lines = [f"Import report for: {', '.join(modules)}"]
+    if proc.returncode != 0:
+        lines.append(proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else "import failed")
+    lines.append(f"{'cumulative ms':>14} {'self ms':>9}  module")
+    for cumulative_us, self_us, name in sorted(rows, reverse=True)[:top]:
+        lines.append(f"{cumulative_us / 1000:14.1f} {self_us / 1000:9.1f}  {name.strip()}")
+    top_level = [row for row in rows if not row[2].startswith(" ")]
+    lines.append(f"Total: {sum(row[0] for row in top_level) / 1000:.1f} ms")
+    return "\n".join(lines)
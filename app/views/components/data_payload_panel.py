@@ -1,6 +1,6 @@
 from PySide6.QtWidgets import (
     QGroupBox, QHBoxLayout, QVBoxLayout, QLabel, QLineEdit,
-    QSpinBox, QPushButton, QWidget, QSizePolicy
+    QSpinBox, QDoubleSpinBox, QPushButton, QWidget, QSizePolicy
 )
 from PySide6.QtCore import Qt, Slot, Signal
 
@@ -48,6 +48,34 @@ class DataPayloadPanel(QGroupBox):
         # Add columns to main layout
         columns_layout.addLayout(data_column)
         columns_layout.addLayout(length_column)
+
+        # Cyclic send parameters
+        self.repeat_count = QSpinBox()
+        self.repeat_count.setRange(1, 1000000)
+        self.repeat_count.setValue(1)
+
+        self.send_rate = QDoubleSpinBox()
+        self.send_rate.setRange(0.0, 10000.0)
+        self.send_rate.setDecimals(1)
+        self.send_rate.setValue(0.0)
+        self.send_rate.setSpecialValueText("MAX")  # 0 = back-to-back
+        self.send_rate.setToolTip("Target messages per second (MAX = back-to-back)")
+
+        self.in_flight = QSpinBox()
+        self.in_flight.setRange(1, 64)
+        self.in_flight.setValue(1)
+        self.in_flight.setToolTip("Requests kept in flight at once")
+
+        for title, widget in (("REPEAT TIMES", self.repeat_count),
+                              ("RATE (MSG/S)", self.send_rate),
+                              ("IN FLIGHT", self.in_flight)):
+            label = QLabel(title)
+            label.setAlignment(Qt.AlignCenter)
+            label.setStyleSheet("font-weight: bold;")
+            column = QVBoxLayout()
+            column.addWidget(label)
+            column.addWidget(widget)
+            columns_layout.addLayout(column)
         
         self.layout().addLayout(columns_layout)
 
@@ -59,9 +87,15 @@ class DataPayloadPanel(QGroupBox):
         self.stop_btn = QPushButton("STOP")
         self.stop_btn.setStyleSheet("color:black;")
         action_row.addWidget(self.send_once_btn)
+        self.send_all_btn = QPushButton("SEND ALL")
+        self.send_all_btn.setToolTip("Send every transmit table row in one batched request")
+        action_row.addWidget(self.send_all_btn)
         action_row.addWidget(self.stop_btn)
-        # self.send_cyclic_btn = QPushButton("Send Cyclic")
-        # action_row.addWidget(self.send_cyclic_btn)
+        self.send_cyclic_btn = QPushButton("Send Cyclic")
+        action_row.addWidget(self.send_cyclic_btn)
+        self.send_file_btn = QPushButton("Send File")
+        self.send_file_btn.setToolTip("Stream a file to the VI in chunks")
+        action_row.addWidget(self.send_file_btn)
 
         # Spacer
         spacer = QWidget()
@@ -75,20 +109,6 @@ class DataPayloadPanel(QGroupBox):
         action_row.addWidget(self.del_btn)
         
         self.layout().addLayout(action_row)
-        # In DataPayloadPanel.__init_ui__()
-        # self.repeat_count = QSpinBox()
-        # self.repeat_count.setRange(1, 1000)          # Reasonable limits
-        # self.repeat_count.setValue(1)                # Default to 1
-
-        # repeat_label = QLabel("REPEAT TIMES")
-        # repeat_label.setAlignment(Qt.AlignCenter)
-        # repeat_label.setStyleSheet("font-weight: bold;")
-        # repeat_layout = QVBoxLayout()
-        # repeat_layout.addWidget(repeat_label)
-        # repeat_layout.addWidget(self.repeat_count)
-
-        # columns_layout.addLayout(repeat_layout)
-
 
     def __connect_signals(self):
         self.data_length.valueChanged.connect(self._on_length_changed)
@@ -1,26 +1,46 @@
 # app/views/components/graph_panel.py
-from PySide6.QtWidgets import QVBoxLayout, QLabel, QPushButton, QHBoxLayout, QWidget
+from PySide6.QtWidgets import QVBoxLayout, QLabel, QPushButton, QHBoxLayout, QWidget, QComboBox
 import pyqtgraph as pg
-import random
 from PySide6.QtCore import QTimer
+from app.services.signal_buffer import SignalStreams, minmax_decimate
+
+# Visible history choices: label -> seconds (None shows everything buffered)
+WINDOWS = {"10 s": 10.0, "1 min": 60.0, "10 min": 600.0, "1 h": 3600.0, "All": None}
+
 
 class GraphPanel(QWidget):
-    def __init__(self):
+    def __init__(self, streams: SignalStreams = None):
         super().__init__()
-        self.setWindowTitle("UART Signal Graph") 
+        self.setWindowTitle("UART Signal Graph")
         self.setMinimumWidth(300)
+        # Samples keep recording into the streams while this window is closed
+        self.streams = streams or SignalStreams()
 
         layout = QVBoxLayout()
         self.plot_widget = pg.PlotWidget()
         layout.addWidget(QLabel("Real-Time UART Signal Graph"))
+
+        select_layout = QHBoxLayout()
+        self.channel_combo = QComboBox()
+        self.channel_combo.addItems(list(self.streams.channels))
+        self.window_combo = QComboBox()
+        self.window_combo.addItems(list(WINDOWS))
+        self.window_combo.setCurrentText("1 min")
+        select_layout.addWidget(QLabel("Channel:"))
+        select_layout.addWidget(self.channel_combo, 1)
+        select_layout.addWidget(QLabel("Window:"))
+        select_layout.addWidget(self.window_combo)
+        layout.addLayout(select_layout)
         layout.addWidget(self.plot_widget)
-        
+
         # Buttons for start and stop
         button_layout = QHBoxLayout()
         self.start_button = QPushButton("Start")
         self.stop_button = QPushButton("Stop")
+        self.clear_button = QPushButton("Clear")
         button_layout.addWidget(self.start_button)
         button_layout.addWidget(self.stop_button)
+        button_layout.addWidget(self.clear_button)
         layout.addLayout(button_layout)
 
         self.setLayout(layout)
@@ -28,35 +48,68 @@ class GraphPanel(QWidget):
         # Plot appearance
         self.plot_widget.setBackground('w')
         self.plot_widget.showGrid(x=True, y=True)
-        self.plot_widget.setLabel('left', 'Signal Value')
-        self.plot_widget.setLabel('bottom', 'Time')
+        self.plot_widget.setLabel('bottom', 'Time (s)')
+        self.curve = self.plot_widget.plot(pen='b')
 
-        # Data buffer
-        self.x_data = list(range(100))
-        self.y_data = [0] * 100
-        self.curve = self.plot_widget.plot(self.x_data, self.y_data, pen='b')
-
-        self.timer = QTimer()
+        # Redraw at most once per display frame, and only when data changed
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.update_graph)
+        self._drawn_version = None
 
         # Initializing the start/stop functionality
         self.start_button.clicked.connect(self.start_data)
         self.stop_button.clicked.connect(self.stop_data)
+        self.clear_button.clicked.connect(self.clear_data)
+        self.channel_combo.currentTextChanged.connect(self._on_selection_changed)
+        self.window_combo.currentTextChanged.connect(self._on_selection_changed)
+        self._on_selection_changed()
+        self.start_data()
+
+    def _frame_interval(self) -> int:
+        screen = self.screen()
+        rate = screen.refreshRate() if screen else 0
+        return max(int(1000 / rate), 8) if rate > 0 else 16
 
     def start_data(self):
         """Starts the real-time data updates"""
-        self.timer.timeout.connect(self.update_graph)
-        self.timer.start(100)
+        self.timer.start(self._frame_interval())
         self.start_button.setEnabled(False)
         self.stop_button.setEnabled(True)
 
     def stop_data(self):
-        """Stops the real-time data updates"""
+        """Freezes the plot; samples keep being recorded"""
         self.timer.stop()
         self.start_button.setEnabled(True)
         self.stop_button.setEnabled(False)
 
+    def clear_data(self):
+        self.streams.buffers[self.channel_combo.currentText()].clear()
+        self.update_graph()
+
+    def _on_selection_changed(self, *_):
+        self.plot_widget.setLabel('left', self.streams.unit(self.channel_combo.currentText()))
+        self._drawn_version = None
+        self.update_graph()
+
     def update_graph(self):
-        """Updates the graph with new dummy data"""
-        new_value = random.randint(0, 100)
-        self.y_data = self.y_data[1:] + [new_value]
-        self.curve.setData(self.x_data, self.y_data)
\ No newline at end of file
+        """Redraws the selected channel if new samples arrived since the last frame"""
+        channel = self.channel_combo.currentText()
+        buffer = self.streams.buffers[channel]
+        if buffer.version == self._drawn_version or not self.isVisible():
+            return
+        self._drawn_version = buffer.version
+
+        t, y = buffer.latest(WINDOWS[self.window_combo.currentText()])
+        # Two points (min and max) per horizontal pixel is all the screen can show
+        t, y = minmax_decimate(t, y, max(self.plot_widget.width(), 100) * 2)
+        self.curve.setData(t, y, skipFiniteCheck=True)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self.stop_button.isEnabled():
+            self.timer.start(self._frame_interval())
+        self._drawn_version = None
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.timer.stop()
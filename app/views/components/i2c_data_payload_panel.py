@@ -1,6 +1,6 @@
 from PySide6.QtWidgets import (
     QGroupBox, QVBoxLayout, QFormLayout, QComboBox,
-    QLineEdit, QPushButton, QLabel, QSpinBox, QHBoxLayout, QSizePolicy
+    QLineEdit, QPushButton, QLabel, QSpinBox, QHBoxLayout, QSizePolicy, QCompleter
 )
 from PySide6.QtCore import Qt, Slot, QRegularExpression
 from PySide6.QtGui import QRegularExpressionValidator
@@ -68,11 +68,18 @@ class I2CDataPayloadPanel(QGroupBox):
         # For 16-bit register addresses
         self.regaddr_validator_16 = QRegularExpressionValidator(QRegularExpression(r"^(0x[0-9A-Fa-f]{4}(\s+)?)+$"))
 
+        # With a register map loaded, a register name is accepted as well
+        self.regname_validator_8 = QRegularExpressionValidator(
+            QRegularExpression(r"^([A-Za-z_][A-Za-z0-9_]*|(0x[0-9A-Fa-f]{2}(\s+)?)+)$"))
+        self.regname_validator_16 = QRegularExpressionValidator(
+            QRegularExpression(r"^([A-Za-z_][A-Za-z0-9_]*|(0x[0-9A-Fa-f]{4}(\s+)?)+)$"))
+        self.register_names = []
 
         self.data_validator = QRegularExpressionValidator(QRegularExpression(r"^0x[0-9A-Fa-f]{0,2}$"))
         self.data_validator_16 = QRegularExpressionValidator(QRegularExpression(r"^0x[0-9A-Fa-f]{0,4}$"))
         try:
             for v in [self.regaddr_validator_8, self.regaddr_validator_16,
+                      self.regname_validator_8, self.regname_validator_16,
                       self.data_validator, self.data_validator_16]:
                 v.setValidationMode(QRegularExpressionValidator.Intermediate)
         except AttributeError:
@@ -155,12 +162,26 @@ class I2CDataPayloadPanel(QGroupBox):
 
         if size_bits == 8:
             self.register_address.setPlaceholderText("Register Address (space-separated 0x00 values)")
-            self.register_address.setValidator(self.regaddr_validator_8)
+            self.register_address.setValidator(
+                self.regname_validator_8 if self.register_names else self.regaddr_validator_8)
             self.register_address.setMaxLength(500)
         else:
             self.register_address.setPlaceholderText("Register Address (space-separated 0x0000 values)")
-            self.register_address.setValidator(self.regaddr_validator_16)
+            self.register_address.setValidator(
+                self.regname_validator_16 if self.register_names else self.regaddr_validator_16)
             self.register_address.setMaxLength(500)
+        if self.register_names:
+            self.register_address.setPlaceholderText(self.register_address.placeholderText()[:-1] + " or register name)")
 
         self.register_address.clear()
-        self.data.clear()
\ No newline at end of file
+        self.data.clear()
+
+    def set_register_names(self, names):
+        """Offer the registers of a loaded register map by name; an empty list goes back to hex-only."""
+        self.register_names = list(names)
+        completer = None
+        if self.register_names:
+            completer = QCompleter(self.register_names, self.register_address)
+            completer.setCaseSensitivity(Qt.CaseInsensitive)
+        self.register_address.setCompleter(completer)
+        self._apply_register_size(self.register_size.currentText())
@@ -13,10 +13,10 @@ class I2CMonitorPanel(QGroupBox):
         self.setLayout(QVBoxLayout())
 
         # Table setup
-        self.table = QTableWidget(0, 7)
+        self.table = QTableWidget(0, 8)
         self.table.setHorizontalHeaderLabels([
             "S.N.O", "Tx Timestamp", "Rx Timestamp", "Register Address",
-            "R/W Bit", "Data", "Result"
+            "R/W Bit", "Data", "Result", "Decoded"
         ])
         self.table.setEditTriggers(QTableWidget.NoEditTriggers)
         self.table.setSelectionBehavior(QTableWidget.SelectRows)
@@ -66,16 +66,16 @@ class I2CMonitorPanel(QGroupBox):
     #     self.table.setRowCount(0)  # Reset table for new test type
 
     def update_columns_for_test_case(self, test_case):
-        # Always use the full 7-column structure, regardless of test case
+        # Always use the full 8-column structure, regardless of test case
         headers = [
             "S.N.O", "Tx Timestamp", "Rx Timestamp", "Register Address",
-            "R/W Bit", "Data", "Result"
+            "R/W Bit", "Data", "Result", "Decoded"
         ]
         self.table.setColumnCount(len(headers))
         self.table.setHorizontalHeaderLabels(headers)
         # Removed: self.table.setRowCount(0)  # No reset to allow continuous logging
 
-    def add_log_entry(self, test_case, register_address, rw_bit, data, tx_timestamp="", rx_timestamp="", result=""):
+    def add_log_entry(self, test_case, register_address, rw_bit, data, tx_timestamp="", rx_timestamp="", result="", decoded=""):
         self.serial_number += 1
         self.current_row = self.table.rowCount()
         self.table.insertRow(self.current_row)
@@ -91,7 +91,8 @@ class I2CMonitorPanel(QGroupBox):
         center(register_address),   # Col 3: Register Address
         center(rw_bit),             # Col 4: R/W Bit
         center(data),               # Col 5: Data
-        center(result)              # Col 6: Result
+        center(result),             # Col 6: Result
+        center(decoded)             # Col 7: Decoded (register map fields)
     ]
 
         # if test_case.upper() == "READ TEST":
@@ -137,7 +138,7 @@ class I2CMonitorPanel(QGroupBox):
             with open(path, mode='w', newline='') as file:
                 writer = csv.writer(file)
                 writer.writerow(["S.N.O", "Tx Timestamp", "Rx Timestamp", "Register Address",
-                                 "R/W Bit", "Data", "Result"])
+                                 "R/W Bit", "Data", "Result", "Decoded"])
                 for row in range(self.table.rowCount()):
                     row_data = []
                     for col in range(self.table.columnCount()):
@@ -1,5 +1,5 @@
 from PySide6.QtWidgets import (
-    QGroupBox, QFormLayout, QComboBox, QLineEdit, QPushButton, QLabel, QVBoxLayout
+    QGroupBox, QFormLayout, QComboBox, QLineEdit, QPushButton, QLabel, QVBoxLayout, QHBoxLayout
 )
 from PySide6.QtGui import QRegularExpressionValidator, QFont
 from PySide6.QtCore import Qt, QRegularExpression
@@ -92,6 +92,19 @@ class I2CTestSelectionPanel(QGroupBox):
         style_label_input(device_address_label, self.device_address)
         form.addRow(device_address_label, self.device_address)
 
+        # BUS SCAN: probe the bus and pick a discovered device
+        self.scan_btn = QPushButton("SCAN")
+        self.scan_btn.setToolTip("Probe every address on the bus for an ACK (10-bit too in 10-bit mode)")
+        self.found_devices = QComboBox()
+        self.found_devices.setPlaceholderText("No scan yet")
+        found_label = QLabel("FOUND DEVICES:")
+        style_label_input(found_label, self.found_devices)
+        self.scan_btn.setFont(input_font)
+        scan_row = QHBoxLayout()
+        scan_row.addWidget(self.found_devices, 1)
+        scan_row.addWidget(self.scan_btn)
+        form.addRow(found_label, scan_row)
+
         # FRAME FORMAT
         self.frame_format = QComboBox()
         self.frame_format.addItems(["MSB First", "LSB First"])
@@ -146,9 +159,25 @@ class I2CTestSelectionPanel(QGroupBox):
         self.address_mode.currentTextChanged.connect(self.validate_device_address)
         self.test_case.currentTextChanged.connect(self.validate_device_address)
         self.device_address.editingFinished.connect(self.validate_device_address)
+        self.found_devices.textActivated.connect(self.use_found_device)
         self.read_address.editingFinished.connect(self.update_register_address)
         self.write_address.editingFinished.connect(self.update_register_address)
         
+    def set_found_devices(self, addresses):
+        self.found_devices.clear()
+        self.found_devices.addItems(addresses)
+        self.found_devices.setPlaceholderText("No devices found" if not addresses else "")
+        if addresses and not self.device_address.text().strip():
+            self.use_found_device(addresses[0])
+
+    def use_found_device(self, address: str):
+        # 10-bit addresses switch the address mode, which clears the field first
+        wanted_mode = "10-bit" if len(address) > 4 else "7-bit"
+        if self.address_mode.currentText() != wanted_mode:
+            self.address_mode.setCurrentText(wanted_mode)
+        self.device_address.setText(address)
+        self.validate_device_address()
+
     def update_for_mode(self, mode: str):
         is_master = (mode == "Master")
         self.speed_mode_label.setVisible(is_master)
@@ -1,15 +1,38 @@
 # app/views/components/status_panel.py
-from PySide6.QtWidgets import QGroupBox, QTextEdit, QPushButton, QVBoxLayout
+from PySide6.QtWidgets import QGroupBox, QPlainTextEdit, QPushButton, QVBoxLayout, QHBoxLayout, QComboBox, QLabel
+from PySide6.QtGui import QTextCharFormat, QColor, QTextCursor
+from PySide6.QtCore import QTimer
+from collections import deque
 from datetime import datetime
+from app.services.log_store import LogStore
+import os
+
+LEVELS = {"debug": 10, "info": 20, "warning": 30, "error": 40}
+COLORS = {"info": "black", "warning": "orange", "error": "red", "debug": "gray"}
+FILTERS = {"All": 0, "Info": 20, "Warning": 30, "Error": 40}
+
+MAX_VISIBLE_LINES = 5000    # lines kept in the view
+MAX_ENTRIES = 20000         # entries kept in memory for re-filtering
+FLUSH_INTERVAL_MS = 16      # one batch per frame
+
 
 class StatusPanel(QGroupBox):
-    def __init__(self):
+    def __init__(self, log_file: str = os.path.join("logs", "activity.log"), log_store: LogStore = None):
         super().__init__("LIVE ACTIVITY LOG")
         self.setMinimumWidth(300)
         self.setLayout(QVBoxLayout())
 
-        self.log_output = QTextEdit()
+        filter_layout = QHBoxLayout()
+        filter_layout.addWidget(QLabel("Show:"))
+        self.level_filter = QComboBox()
+        self.level_filter.addItems(list(FILTERS))
+        self.level_filter.currentTextChanged.connect(self._refilter)
+        filter_layout.addWidget(self.level_filter, 1)
+        self.layout().addLayout(filter_layout)
+
+        self.log_output = QPlainTextEdit()
         self.log_output.setReadOnly(True)
+        self.log_output.setMaximumBlockCount(MAX_VISIBLE_LINES)
         self.layout().addWidget(self.log_output)
 
         self.clear_btn = QPushButton("CLEAR LOGS")
@@ -17,29 +40,64 @@ class StatusPanel(QGroupBox):
         self.clear_btn.clicked.connect(self.clear_logs)
         self.layout().addWidget(self.clear_btn)
 
+        self._formats = {}
+        for level, color in COLORS.items():
+            fmt = QTextCharFormat()
+            fmt.setForeground(QColor(color))
+            self._formats[level] = fmt
+
+        self._entries = deque(maxlen=MAX_ENTRIES)  # (level, line), formatted once
+        self._pending = deque()
+        self._min_level = 0
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.timeout.connect(self._flush)
+        self._spill = (log_store or LogStore()).writer(log_file)
+
     def append_message(self, message: str, level: str = "info"):
-        """Append a message with timestamp and color based on level."""
+        """Queue a timestamped message; the view updates once per frame."""
+        level = level.lower() if level.lower() in LEVELS else "info"
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        color = {
-            "info": "black",
-            "warning": "orange",
-            "error": "red",
-            "debug": "gray"
-        }.get(level.lower(), "black")
-
-        safe_message = (
-            message.replace("&", "&amp;")
-                   .replace("<", "&lt;")
-                   .replace(">", "&gt;")
-        )
-
-        formatted_message = (
-        f'<div style="margin-bottom:4px;">'
-        f'<span style="color:gray;">[{timestamp}]</span><br>'
-        f'<span style="color:{color};">{safe_message}</span>'
-        f'</div>'
-    )
-        self.log_output.append(formatted_message)
+        line = f"[{timestamp}] {message}"
+        self._pending.append((level, line))
+        if not self._flush_timer.isActive():
+            self._flush_timer.start(FLUSH_INTERVAL_MS)
+
+    def _flush(self):
+        batch = list(self._pending)
+        self._pending.clear()
+        self._entries.extend(batch)
+        if batch:
+            self._spill.info("\n".join(f"{level.upper():7} {line}" for level, line in batch))
+        shown = [entry for entry in batch if LEVELS[entry[0]] >= self._min_level]
+        # Lines beyond the view's capacity would be dropped straight away
+        self._write(shown[-MAX_VISIBLE_LINES:])
+
+    def _write(self, entries):
+        if not entries:
+            return
+        scrollbar = self.log_output.verticalScrollBar()
+        at_bottom = scrollbar.value() == scrollbar.maximum()
+
+        cursor = QTextCursor(self.log_output.document())
+        cursor.movePosition(QTextCursor.End)
+        cursor.beginEditBlock()
+        for level, line in entries:
+            if not self.log_output.document().isEmpty():
+                cursor.insertBlock()
+            cursor.insertText(line, self._formats[level])
+        cursor.endEditBlock()
+
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
+
+    def _refilter(self, choice: str):
+        self._min_level = FILTERS.get(choice, 0)
+        self.log_output.clear()
+        shown = [entry for entry in self._entries if LEVELS[entry[0]] >= self._min_level]
+        self._write(shown[-MAX_VISIBLE_LINES:])
 
     def clear_logs(self):
-        self.log_output.clear()
\ No newline at end of file
+        self._flush()  # Still spill queued messages to the file
+        self._entries.clear()
+        self.log_output.clear()
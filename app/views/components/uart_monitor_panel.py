@@ -294,6 +294,21 @@ class LiveMonitorPanel(QGroupBox):
                 self.table.setItem(self.current_row, RX_DATA_COL, rx_data_item)
 
             self.table.scrollToBottom()
+    def set_rx_result(self, row: int, data: str, status: str):
+        """Fill the Rx columns and status of an existing Tx row (batched replies arrive out of order)."""
+        RX_TS_COL = 4
+        RX_DATA_COL = 5
+        STATUS_COL = 6
+        test_case_item = self.table.item(row, 1)
+        if test_case_item and test_case_item.text() in ["TRANSMISSION TEST", "RTS/CTS HARDWARE FLOW TEST", "PARITY DETECTION"]:
+            timestamp, data = "—", "—"
+        else:
+            timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
+        for col, text in ((RX_TS_COL, timestamp), (RX_DATA_COL, data), (STATUS_COL, status)):
+            item = QTableWidgetItem(text)
+            item.setTextAlignment(Qt.AlignCenter)
+            self.table.setItem(row, col, item)
+
     def export_log(self):
         path, _ = QFileDialog.getSaveFileName(self, "Save Log", "", "CSV Files (*.csv)")
         if not path:
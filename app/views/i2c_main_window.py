@@ -1,22 +1,24 @@
 from PySide6.QtWidgets import (
     QMenuBar, QMainWindow, QMenu, QWidget, QVBoxLayout, QScrollArea,
-    QSplitter, QFileDialog, QMessageBox
+    QSplitter, QFileDialog, QMessageBox, QInputDialog
 )
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QAction, QIcon, QKeySequence
 from app.views.components.i2c_test_selection_panel import I2CTestSelectionPanel
 from app.views.components.i2c_data_payload_panel import I2CDataPayloadPanel
 from app.views.components.status_panel import StatusPanel
-from app.views.components.graph_panel import GraphPanel
 from app.views.components.i2c_monitor_panel import I2CMonitorPanel
 from app.views.components.i2c_transmit_table import I2CTransmitTable  # Import the transmit table
 from app.controllers.i2c_controller import I2CController
+from app.models.eeprom_model import EEPROM_PROFILES
+from app.services.service_container import get_services
 import os
 import sys
 
 class I2CWindow(QMainWindow):
-    def __init__(self):
+    def __init__(self, services=None):
         super().__init__()
+        self.services = services or get_services()
         self.setWindowTitle("I2C Protocol Testing Application")
         self.setGeometry(100, 100, 1200, 800)
         self.graph_window = None
@@ -26,7 +28,7 @@ class I2CWindow(QMainWindow):
         self.test_selection = I2CTestSelectionPanel(controller=None)
         self.payload_panel = I2CDataPayloadPanel()
         self.transmit_table = I2CTransmitTable()  # Initialize transmit table
-        self.status_panel = StatusPanel()
+        self.status_panel = StatusPanel(os.path.join("logs", "i2c_activity.log"), self.services.log_store)
         self.live_monitor = I2CMonitorPanel(self)
 
         # Right side layout: DataPayloadPanel over TransmitTable
@@ -145,6 +147,35 @@ class I2CWindow(QMainWindow):
         open_graph_action.triggered.connect(self.open_graph_window)
         graphs_menu.addAction(open_graph_action)
 
+        tools_menu = QMenu("Tools", self)
+        program_eeprom_action = QAction("Program EEPROM", self)
+        program_eeprom_action.triggered.connect(self.program_eeprom)
+        tools_menu.addAction(program_eeprom_action)
+
+        stop_transfer_action = QAction("Stop EEPROM Transfer", self)
+        stop_transfer_action.triggered.connect(self.controller.stop_eeprom_transfer)
+        tools_menu.addAction(stop_transfer_action)
+
+        tools_menu.addSeparator()
+        register_cache_action = QAction("Register Cache", self, checkable=True)
+        register_cache_action.setChecked(self.controller.register_cache_enabled)
+        register_cache_action.setToolTip("Skip writes of unchanged registers and reuse recent reads")
+        register_cache_action.toggled.connect(self.controller.set_register_cache_enabled)
+        tools_menu.addAction(register_cache_action)
+
+        clear_cache_action = QAction("Clear Register Cache", self)
+        clear_cache_action.triggered.connect(self.controller.register_shadows.clear)
+        tools_menu.addAction(clear_cache_action)
+
+        tools_menu.addSeparator()
+        load_register_map_action = QAction("Load Register Map", self)
+        load_register_map_action.triggered.connect(self.load_register_map)
+        tools_menu.addAction(load_register_map_action)
+
+        unload_register_map_action = QAction("Unload Register Map", self)
+        unload_register_map_action.triggered.connect(self.controller.unload_register_map)
+        tools_menu.addAction(unload_register_map_action)
+
         report_menu = QMenu("Report", self)
         generate_report_action = QAction("Generate Report", self)
         generate_report_action.setShortcut(QKeySequence("Ctrl+R"))
@@ -159,12 +190,15 @@ class I2CWindow(QMainWindow):
         menu_bar.addMenu(file_menu)
         menu_bar.addMenu(view_menu)
         menu_bar.addMenu(graphs_menu)
+        menu_bar.addMenu(tools_menu)
         menu_bar.addMenu(report_menu)
         menu_bar.addMenu(help_menu)
 
     def open_graph_window(self):
         if self.graph_window is None or not self.graph_window.isVisible():
-            self.graph_window = GraphPanel()
+            # pyqtgraph is only loaded when a graph is first opened
+            from app.views.components.graph_panel import GraphPanel
+            self.graph_window = GraphPanel(self.controller.signal_streams)
             self.graph_window.setWindowTitle("I2C Signal Graph")
             self.graph_window.show()
         else:
@@ -181,6 +215,20 @@ class I2CWindow(QMainWindow):
         if path:
             self.controller.load_config(path)
 
+    def program_eeprom(self):
+        path, _ = QFileDialog.getOpenFileName(self, "Program EEPROM", "", "Binary Files (*.bin);;All Files (*)")
+        if not path:
+            return
+        profile, ok = QInputDialog.getItem(self, "Program EEPROM", "Device:", list(EEPROM_PROFILES), 0, False)
+        if ok:
+            self.controller.program_eeprom(path, profile)
+
+    def load_register_map(self):
+        path, _ = QFileDialog.getOpenFileName(self, "Load Register Map", "",
+                                              "Register Maps (*.json *.yaml *.yml);;All Files (*)")
+        if path:
+            self.controller.load_register_map(path)
+
     def clear_fields(self):
         self.controller.clear_config()
         QMessageBox.information(self, "Cleared", "All fields have been cleared.")
@@ -1,21 +1,22 @@
 from PySide6.QtWidgets import (
     QMenuBar, QMainWindow, QMenu, QWidget, QVBoxLayout, QScrollArea,
-    QSplitter, QFileDialog, QMessageBox, QStackedWidget
+    QSplitter, QFileDialog, QMessageBox, QStackedWidget, QInputDialog
 )
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QAction, QIcon, QKeySequence
 from app.views.components.test_selection_panel import TestSelectionPanel
 from app.views.components.data_payload_panel import DataPayloadPanel
 from app.views.components.status_panel import StatusPanel
-from app.views.components.graph_panel import GraphPanel
 from app.views.components.uart_monitor_panel import LiveMonitorPanel
 from app.views.components.transmit_table import TransmitTable
 from app.controllers.main_controller import MainController
+from app.services.service_container import get_services
 import os
 
 class MainWindow(QMainWindow):
-    def __init__(self):
+    def __init__(self, services=None):
         super().__init__()
+        self.services = services or get_services()
         self.setWindowTitle("UART Protocol Testing Application")
         self.setGeometry(100, 100, 1200, 800)
         self.graph_window = None
@@ -34,7 +35,7 @@ class MainWindow(QMainWindow):
         self.test_selection = TestSelectionPanel(controller=None)
         self.payload_panel = DataPayloadPanel()
         self.transmit_table = TransmitTable()
-        self.status_panel = StatusPanel()
+        self.status_panel = StatusPanel(log_store=self.services.log_store)
         self.live_monitor = LiveMonitorPanel(self)
 
         # Right side layout: DataPayloadPanel over TransmitTable
@@ -120,6 +121,30 @@ class MainWindow(QMainWindow):
         open_graph_action.triggered.connect(self.open_graph_window)
         graphs_menu.addAction(open_graph_action)
 
+        tools_menu = QMenu("Tools", self)
+        run_plan_action = QAction("Run Test Plan", self)
+        run_plan_action.setShortcut(QKeySequence("Ctrl+P"))
+        run_plan_action.triggered.connect(self.run_test_plan)
+        tools_menu.addAction(run_plan_action)
+
+        run_fixtures_action = QAction("Run Test Plan on Fixtures", self)
+        run_fixtures_action.setShortcut(QKeySequence("Ctrl+Shift+P"))
+        run_fixtures_action.triggered.connect(self.run_test_plan_on_fixtures)
+        tools_menu.addAction(run_fixtures_action)
+
+        tolerance_action = QAction("Find Baud Tolerance", self)
+        tolerance_action.triggered.connect(self.controller.find_baud_tolerance)
+        tools_menu.addAction(tolerance_action)
+
+        tools_menu.addSeparator()
+        self.capture_action = QAction("Capture Session", self, checkable=True)
+        self.capture_action.toggled.connect(self.toggle_capture)
+        tools_menu.addAction(self.capture_action)
+
+        replay_action = QAction("Replay Session", self)
+        replay_action.triggered.connect(self.replay_session)
+        tools_menu.addAction(replay_action)
+
         report_menu = QMenu("Report", self)
         generate_report_action = QAction("Generate Report", self)
         generate_report_action.setShortcut(QKeySequence("Ctrl+R"))
@@ -134,12 +159,15 @@ class MainWindow(QMainWindow):
         menu_bar.addMenu(file_menu)
         menu_bar.addMenu(view_menu)
         menu_bar.addMenu(graphs_menu)
+        menu_bar.addMenu(tools_menu)
         menu_bar.addMenu(report_menu)
         menu_bar.addMenu(help_menu)
 
     def open_graph_window(self):
         if self.graph_window is None or not self.graph_window.isVisible():
-            self.graph_window = GraphPanel()
+            # pyqtgraph is only loaded when a graph is first opened
+            from app.views.components.graph_panel import GraphPanel
+            self.graph_window = GraphPanel(self.controller.signal_streams)
             self.graph_window.show()
         else:
             self.graph_window.raise_()
@@ -155,6 +183,45 @@ class MainWindow(QMainWindow):
         if path:
             self.controller.load_config(path)
 
+    def run_test_plan(self):
+        path, _ = QFileDialog.getOpenFileName(self, "Run Test Plan", "", "JSON Files (*.json)")
+        if path:
+            self.controller.run_test_plan(path)
+
+    def run_test_plan_on_fixtures(self):
+        plan_path, _ = QFileDialog.getOpenFileName(self, "Select Test Plan", "", "JSON Files (*.json)")
+        if not plan_path:
+            return
+        fixtures_path, _ = QFileDialog.getOpenFileName(self, "Select Fixtures File", "", "JSON Files (*.json)")
+        if not fixtures_path:
+            return
+        modes = {
+            "Replicate: every fixture runs the whole plan": "replicate",
+            "Distribute: fixtures share the plan's sends": "distribute"
+        }
+        choice, ok = QInputDialog.getItem(self, "Scheduling", "Mode:", list(modes), 0, False)
+        if ok:
+            self.controller.run_test_plan_on_fixtures(plan_path, fixtures_path, modes[choice])
+
+    def toggle_capture(self, checked):
+        if not checked:
+            self.controller.stop_capture()
+            return
+        path, _ = QFileDialog.getSaveFileName(self, "Capture Session", "", "Session Captures (*.pvscap)")
+        if path:
+            self.controller.start_capture(path)
+        else:
+            self.capture_action.setChecked(False)
+
+    def replay_session(self):
+        path, _ = QFileDialog.getOpenFileName(self, "Replay Session", "", "Session Captures (*.pvscap)")
+        if not path:
+            return
+        speeds = {"Real time (1x)": 1.0, "Maximum speed": 0.0}
+        choice, ok = QInputDialog.getItem(self, "Replay Speed", "Speed:", list(speeds), 0, False)
+        if ok:
+            self.controller.replay_session(path, speeds[choice])
+
     def clear_fields(self):
         self.controller.clear_config()
         QMessageBox.information(self, "Cleared", "All fields have been cleared.")
@@ -168,6 +235,11 @@ class MainWindow(QMainWindow):
         else:
             self.toolbar.hide()
 
+    def closeEvent(self, event):
+        # The sweep analysis pool is started again on the next sweep if the window is reopened
+        self.controller.baud_analyzer.shutdown()
+        super().closeEvent(event)
+
     def _setup_toolbar(self):
         self.toolbar = self.addToolBar("Main Toolbar")
         self.toolbar.setMovable(True)
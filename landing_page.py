@@ -6,8 +6,8 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtGui import QFont, QAction, QIcon, QPixmap
 from PySide6.QtCore import Qt, QPropertyAnimation, QTimer
-from app.views.main_window import MainWindow
-from app.views.i2c_main_window import I2CWindow
+from app.startup import prewarm
+from app.services.service_container import get_services
 import os
 
 class FirstPage(QMainWindow):
@@ -21,6 +21,7 @@ class FirstPage(QMainWindow):
         self.setStatusBar(self.status_bar)
 
         # Initialize state
+        self._prewarm_started = False
         self.sidebar_visible = True
         self.tabs = ["  Home", "  Videos", "  Documentation", "  Contact"]
         self.protocol_buttons = []
@@ -104,6 +105,13 @@ class FirstPage(QMainWindow):
         main_layout.addWidget(self.sidebar)
         main_layout.addWidget(self.content_frame, 1)
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self._prewarm_started:
+            # Once the chooser is on screen, load the protocol windows in the background
+            self._prewarm_started = True
+            QTimer.singleShot(500, prewarm)
+
     def create_home_page(self) -> QWidget:
         page = QWidget()
         gl = QGridLayout(page)
@@ -203,10 +211,21 @@ class FirstPage(QMainWindow):
 
     def open_uart_window(self):
         """Open the UART Window."""
-        self.main_window = MainWindow()
-        self.main_window.show()
+        from app.views.main_window import MainWindow
+        self.main_window = get_services().window("UART", MainWindow)
+        self._present(self.main_window)
 
     def open_i2c_window(self):
         """Open the I2C Window."""
-        self.i2c_window = I2CWindow()
-        self.i2c_window.show()
\ No newline at end of file
+        from app.views.i2c_main_window import I2CWindow
+        self.i2c_window = get_services().window("I2C", I2CWindow)
+        self._present(self.i2c_window)
+
+    @staticmethod
+    def _present(window):
+        """Show a cached window again, or bring it forward if it is already open."""
+        if window.isMinimized():
+            window.showNormal()
+        window.show()
+        window.raise_()
+        window.activateWindow()
\ No newline at end of file
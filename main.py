@@ -1,10 +1,37 @@
 # main.py
 import sys
 from PySide6.QtWidgets import QApplication
-from landing_page import FirstPage
+from app.logging_config import setup_logging, shutdown_logging
+
+def _option(name):
+    """Value following name on the command line, if given."""
+    if name in sys.argv:
+        index = sys.argv.index(name)
+        if index + 1 < len(sys.argv):
+            return sys.argv[index + 1]
+    return None
 
 def main():
+    if "--import-report" in sys.argv:
+        from app.startup import import_report, PROTOCOL_WINDOW_MODULES
+        print(import_report(["landing_page"]))
+        print()
+        print(import_report(PROTOCOL_WINDOW_MODULES))
+        return
+
+    # Level: --log-level, else $PVS_LOG_LEVEL, else INFO
+    setup_logging(_option("--log-level"))
+    from landing_page import FirstPage
+    from app.services.service_container import get_services
     app = QApplication(sys.argv)
+    # Watch the GUI thread for blocking handlers: --stall-ms, else 250 ms
+    from app.stall_detector import StallDetector, STALL_THRESHOLD_MS
+    stall_detector = StallDetector(float(_option("--stall-ms") or STALL_THRESHOLD_MS), parent=app)
+    get_services().stall_detector = stall_detector
+    stall_detector.start()
+    app.aboutToQuit.connect(stall_detector.stop)
+    app.aboutToQuit.connect(get_services().shutdown)
+    app.aboutToQuit.connect(shutdown_logging)
     window = FirstPage()
     window.show()
     sys.exit(app.exec())